@@ -344,20 +344,19 @@ def get_partition_subsets(
         updated_cache_value = get_and_update_asset_status_cache_value(
             instance, asset_key, partitions_def, dynamic_partitions_loader
         )
-        materialized_subset = (
-            updated_cache_value.deserialize_materialized_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
-        )
-        failed_subset = (
-            updated_cache_value.deserialize_failed_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
-        )
-        in_progress_subset = (
-            updated_cache_value.deserialize_in_progress_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
+        if not updated_cache_value:
+            return (
+                partitions_def.empty_subset(),
+                partitions_def.empty_subset(),
+                partitions_def.empty_subset(),
+            )
+
+        (
+            materialized_subset,
+            failed_subset,
+            in_progress_subset,
+        ) = updated_cache_value.deserialize_partition_subsets(
+            partitions_def, dynamic_partitions_store=dynamic_partitions_loader
         )
 
         return materialized_subset, failed_subset, in_progress_subset
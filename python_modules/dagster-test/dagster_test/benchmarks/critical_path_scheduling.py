@@ -0,0 +1,216 @@
+# ruff: noqa: T201
+
+import argparse
+import heapq
+import random
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from dagster import (
+    DependencyDefinition,
+    GraphDefinition,
+    In,
+    MultiDependencyDefinition,
+    NodeInvocation,
+    Nothing,
+    Out,
+    op,
+)
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.active import critical_path_sort_key_fn
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.execution.retries import RetryMode
+from rich.console import Console
+from rich.table import Table
+
+DESC = """
+Compare the makespan of runs scheduled with the default step ordering of ActiveExecution against
+runs scheduled with the critical path sort key. Steps are not executed: each synthetic DAG is given
+random step durations, and the execution of the plan is simulated with `--max-concurrent` slots.
+The critical path sort key is weighted with the same durations, as if they had been recorded in a
+previous run of the job.
+
+Three DAG shapes are simulated: a single long chain of steps next to many independent steps, several
+chains of different lengths, and random layered DAGs with `--num-steps` steps.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="critical_path_scheduling",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    default=200,
+    help="Set the number of steps in each synthetic DAG.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=4,
+    help="Set the number of steps that may execute concurrently.",
+)
+
+parser.add_argument(
+    "--num-trials",
+    type=int,
+    default=5,
+    help="Set the number of random DAGs simulated for each shape.",
+)
+
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=0,
+    help="Set the seed used to generate DAGs and step durations.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op(ins={"upstream": In(Nothing)}, out=Out(Nothing))
+def node():
+    pass
+
+
+StepDeps = Mapping[str, Sequence[str]]
+
+
+def build_plan(step_deps: StepDeps) -> ExecutionPlan:
+    graph = GraphDefinition(
+        name="synthetic",
+        node_defs=[node],
+        dependencies={
+            NodeInvocation("node", alias=step_key): (
+                {
+                    "upstream": MultiDependencyDefinition(
+                        [DependencyDefinition(upstream_key) for upstream_key in upstream_keys]
+                    )
+                }
+                if upstream_keys
+                else {}
+            )
+            for step_key, upstream_keys in step_deps.items()
+        },
+    )
+    return create_execution_plan(graph.to_job())
+
+
+def long_chain_deps(rng: random.Random, num_steps: int) -> StepDeps:
+    chain_length = num_steps // 4
+    deps: Dict[str, List[str]] = {
+        f"chain_{i}": [f"chain_{i - 1}"] if i else [] for i in range(chain_length)
+    }
+    deps.update({f"single_{i}": [] for i in range(num_steps - chain_length)})
+    return deps
+
+
+def many_chains_deps(rng: random.Random, num_steps: int) -> StepDeps:
+    deps: Dict[str, List[str]] = {}
+    chain_idx = 0
+    while len(deps) < num_steps:
+        chain_length = min(rng.randint(1, num_steps // 5), num_steps - len(deps))
+        for i in range(chain_length):
+            deps[f"chain_{chain_idx}_{i}"] = [f"chain_{chain_idx}_{i - 1}"] if i else []
+        chain_idx += 1
+    return deps
+
+
+def layered_deps(rng: random.Random, num_steps: int) -> StepDeps:
+    deps: Dict[str, List[str]] = {}
+    previous_layer: List[str] = []
+    layer_idx = 0
+    while len(deps) < num_steps:
+        layer_width = min(rng.randint(1, 10), num_steps - len(deps))
+        layer = [f"layer_{layer_idx}_{i}" for i in range(layer_width)]
+        for step_key in layer:
+            deps[step_key] = (
+                rng.sample(previous_layer, rng.randint(0, min(3, len(previous_layer))))
+                if previous_layer
+                else []
+            )
+        previous_layer = layer
+        layer_idx += 1
+    return deps
+
+
+SHAPES: Mapping[str, Callable[[random.Random, int], StepDeps]] = {
+    "long chain": long_chain_deps,
+    "many chains": many_chains_deps,
+    "layered": layered_deps,
+}
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def simulate_makespan(
+    plan: ExecutionPlan,
+    durations: Mapping[str, float],
+    max_concurrent: int,
+    sort_key_fn: Optional[Callable[[ExecutionStep], float]],
+) -> float:
+    now = 0.0
+    running: List[Tuple[float, str]] = []
+    with plan.start(
+        RetryMode.DISABLED, sort_key_fn=sort_key_fn, max_concurrent=max_concurrent
+    ) as active_execution:
+        while not active_execution.is_complete:
+            for step in active_execution.get_steps_to_execute():
+                heapq.heappush(running, (now + durations[step.key], step.key))
+
+            now, step_key = heapq.heappop(running)
+            step = active_execution.get_step_by_key(step_key)
+            for step_output in step.step_outputs:
+                active_execution.mark_step_produced_output(
+                    StepOutputHandle(step_key, step_output.name)
+                )
+            active_execution.mark_success(step_key)
+
+    return now
+
+
+def main(num_steps: int, max_concurrent: int, num_trials: int, seed: int) -> None:
+    rng = random.Random(seed)
+    console = Console()
+    console.print(
+        "Simulating critical path scheduling (num_steps:"
+        f" {num_steps}, max_concurrent: {max_concurrent}, num_trials: {num_trials})"
+    )
+
+    table = Table()
+    table.add_column("DAG shape")
+    table.add_column("Default makespan", justify="right")
+    table.add_column("Critical path makespan", justify="right")
+    table.add_column("Improvement", justify="right")
+
+    for shape_name, build_deps in SHAPES.items():
+        default_total = 0.0
+        critical_path_total = 0.0
+        for _ in range(num_trials):
+            plan = build_plan(build_deps(rng, num_steps))
+            durations = {step_key: rng.uniform(1.0, 10.0) for step_key in plan.step_keys_to_execute}
+            default_total += simulate_makespan(plan, durations, max_concurrent, None)
+            critical_path_total += simulate_makespan(
+                plan, durations, max_concurrent, critical_path_sort_key_fn(plan, durations)
+            )
+
+        table.add_row(
+            shape_name,
+            f"{default_total / num_trials:.1f}",
+            f"{critical_path_total / num_trials:.1f}",
+            f"{(1 - critical_path_total / default_total) * 100:.1f}%",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.max_concurrent, args.num_trials, args.seed)
@@ -0,0 +1,156 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+from typing import Callable, Sequence
+
+import dagster._serdes.serdes as serdes
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    Definitions,
+    MetadataValue,
+    asset,
+    define_asset_job,
+)
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.host_representation.external_data import external_repository_data_from_def
+from dagster._core.snap import JobSnapshot
+from dagster._serdes import deserialize_value, serialize_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of serializing and deserializing the serdes objects that dominate webserver
+and daemon workloads: the ExternalRepositoryData of a repository with N assets, the JobSnapshot of a
+job targeting all of those assets, and a batch of M asset materialization EventLogEntry rows. Each
+object is round-tripped with the standard library JSON parser and, if it is installed, with orjson.
+
+N and M are configurable via the `--num-assets` and `--num-events` args.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=1000,
+    help="Set the number of assets in the repository.",
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=10000,
+    help="Set the number of event log entries to round-trip.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_definitions(num_assets: int) -> Definitions:
+    def _make_asset(i: int):
+        @asset(
+            name=f"asset_{i}",
+            deps=[f"asset_{j}" for j in range(max(i - 3, 0), i)],
+            metadata={"owner": f"team_{i % 10}"},
+        )
+        def _asset() -> None:
+            ...
+
+        return _asset
+
+    return Definitions(
+        assets=[_make_asset(i) for i in range(num_assets)],
+        jobs=[define_asset_job("all_assets")],
+    )
+
+
+def get_event_log_entries(num_events: int) -> Sequence[EventLogEntry]:
+    return [
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="a8c3f1e2-0d6b-4e3c-9f1a-2b7d5e6c4a90",
+            timestamp=time.time(),
+            step_key=f"asset_{i}",
+            job_name="all_assets",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "all_assets",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["prefix", f"asset_{i}"]),
+                        metadata={"row_count": i, "path": MetadataValue.path(f"/tmp/{i}")},
+                    )
+                ),
+            ),
+        )
+        for i in range(num_events)
+    ]
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def run_benchmark(
+    session: ProfilingSession, name: str, get_serialized: Callable[[], Sequence[str]]
+) -> None:
+    with session.logged_execution_time(f"[{name}] Serialize"):
+        serialized = get_serialized()
+
+    with session.logged_execution_time(f"[{name}] Deserialize with json"):
+        for value in serialized:
+            deserialize_value(value)
+
+    if serdes.orjson is not None:
+        serdes._USE_ORJSON = True  # noqa: SLF001
+        try:
+            with session.logged_execution_time(f"[{name}] Deserialize with orjson"):
+                for value in serialized:
+                    deserialize_value(value)
+        finally:
+            serdes._USE_ORJSON = False  # noqa: SLF001
+
+
+def main(num_assets: int, num_events: int) -> None:
+    session = ProfilingSession(
+        name="Serdes round trips",
+        experiment_settings={"num_assets": num_assets, "num_events": num_events},
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Build objects"):
+        repository_def = get_definitions(num_assets).get_repository_def()
+        external_repository_data = external_repository_data_from_def(repository_def)
+        job_snapshot = JobSnapshot.from_job_def(repository_def.get_job("all_assets"))
+        event_log_entries = get_event_log_entries(num_events)
+
+    run_benchmark(
+        session,
+        "ExternalRepositoryData",
+        lambda: [serialize_value(external_repository_data)],
+    )
+    run_benchmark(session, "JobSnapshot", lambda: [serialize_value(job_snapshot)])
+    run_benchmark(
+        session,
+        "EventLogEntry",
+        lambda: [serialize_value(event) for event in event_log_entries],
+    )
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_events)
@@ -0,0 +1,156 @@
+# ruff: noqa: T201
+
+import argparse
+from datetime import datetime, timedelta
+from typing import Sequence, cast
+
+from dagster import PartitionKeyRange, TimeWindowPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsSubset
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of operations on TimeWindowPartitionsSubsets of time window partitions
+definitions with many partitions. For each of an hourly and a minutely partitions definition with N
+partitions, the script builds two overlapping subsets that each contain a large range of partitions
+broken up by gaps, and then times unions, intersections, differences, membership checks, adding
+partition keys, and finding the partitions that are not in a subset.
+
+N is configurable via the `--num-partitions` arg, and defaults to ten years of hourly partitions.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions_subset",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    default=10 * 365 * 24,
+    help="Set the number of partitions in each partitions definition.",
+)
+
+parser.add_argument(
+    "--num-gaps",
+    type=int,
+    default=100,
+    help="Set the number of gaps in the ranges of partitions included in each subset.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+START = datetime(2010, 1, 1)
+FMT = "%Y-%m-%d-%H:%M"
+
+
+def get_partitions_def(
+    cron_schedule: str, partition_length: timedelta, num_partitions: int
+) -> TimeWindowPartitionsDefinition:
+    return TimeWindowPartitionsDefinition(
+        start=START,
+        end=START + partition_length * num_partitions,
+        fmt=FMT,
+        cron_schedule=cron_schedule,
+    )
+
+
+def build_subset(
+    partitions_def: TimeWindowPartitionsDefinition,
+    partition_keys: Sequence[str],
+    partition_keys_with_gaps: range,
+    num_gaps: int,
+) -> TimeWindowPartitionsSubset:
+    subset = cast(TimeWindowPartitionsSubset, partitions_def.empty_subset())
+    gap_every = max(len(partition_keys_with_gaps) // (num_gaps + 1), 2)
+    for start_idx in range(
+        partition_keys_with_gaps.start, partition_keys_with_gaps.stop, gap_every
+    ):
+        end_idx = min(start_idx + gap_every - 2, partition_keys_with_gaps.stop - 1)
+        subset = subset.with_partition_key_range(
+            PartitionKeyRange(partition_keys[start_idx], partition_keys[end_idx])
+        )
+    return subset
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def run_benchmark(
+    session: ProfilingSession,
+    name: str,
+    partitions_def: TimeWindowPartitionsDefinition,
+    num_partitions: int,
+    num_gaps: int,
+) -> None:
+    partition_keys = partitions_def.get_partition_keys()
+    sample_keys = partition_keys[:: max(num_partitions // 1000, 1)]
+
+    with session.logged_execution_time(f"[{name}] Build subsets from partition key ranges"):
+        first_subset = build_subset(
+            partitions_def, partition_keys, range(0, num_partitions * 2 // 3), num_gaps
+        )
+        second_subset = build_subset(
+            partitions_def, partition_keys, range(num_partitions // 3, num_partitions), num_gaps
+        )
+
+    with session.logged_execution_time(f"[{name}] Union"):
+        union = first_subset | second_subset
+        assert len(union) <= num_partitions
+
+    with session.logged_execution_time(f"[{name}] Intersection"):
+        intersection = first_subset & second_subset
+        assert len(intersection) <= len(first_subset)
+
+    with session.logged_execution_time(f"[{name}] Difference"):
+        difference = first_subset - second_subset
+        assert len(difference) == len(first_subset) - len(intersection)
+
+    with session.logged_execution_time(f"[{name}] Check membership of {len(sample_keys)} keys"):
+        for partition_key in sample_keys:
+            _ = partition_key in union
+
+    with session.logged_execution_time(f"[{name}] Add {len(sample_keys)} partition keys"):
+        first_subset.with_partition_keys(sample_keys)
+
+    with session.logged_execution_time(f"[{name}] Get partition keys not in subset"):
+        partitions_not_in_union = list(union.get_partition_keys_not_in_subset())
+        assert len(partitions_not_in_union) == num_partitions - len(union)
+
+    with session.logged_execution_time(f"[{name}] Get partition keys of union"):
+        assert len(list(union.get_partition_keys())) == len(union)
+
+
+def main(num_partitions: int, num_gaps: int) -> None:
+    session = ProfilingSession(
+        name="Time window partitions subset operations",
+        experiment_settings={"num_partitions": num_partitions, "num_gaps": num_gaps},
+    ).start()
+
+    session.log_start_message()
+
+    run_benchmark(
+        session,
+        "hourly",
+        get_partitions_def("0 * * * *", timedelta(hours=1), num_partitions),
+        num_partitions,
+        num_gaps,
+    )
+    run_benchmark(
+        session,
+        "minutely",
+        get_partitions_def("* * * * *", timedelta(minutes=1), num_partitions),
+        num_partitions,
+        num_gaps,
+    )
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_partitions, args.num_gaps)
@@ -197,6 +197,8 @@ def dagster_webserver(
             read_only=read_only,
             kwargs=kwargs,
             code_server_log_level=code_server_log_level,
+            # serve the UI right away and show each code location as loading until it is ready
+            load_in_background=True,
         ) as workspace_process_context:
             host_dagster_ui_with_workspace_process_context(
                 workspace_process_context, host, port, path_prefix, log_level
@@ -1,4 +1,9 @@
-from typing import TYPE_CHECKING, Mapping
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Mapping, Optional
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -7,21 +12,150 @@
     ExternalRepositoryErrorData,
 )
 from dagster._serdes import deserialize_value
+from dagster._utils import mkdir_p
 
 if TYPE_CHECKING:
     from dagster._core.host_representation import CodeLocation
     from dagster._grpc.client import DagsterGrpcClient
 
+# The number of deserialized repository snapshots to keep in memory per process
+REPOSITORY_SNAPSHOT_CACHE_SIZE = 16
+
+
+class RepositorySnapshotCache:
+    """Thread-safe LRU cache of deserialized repository snapshots, keyed by the snapshot id that the
+    gRPC server reports for each repository (a hash of the serialized ExternalRepositoryData).
+
+    Since snapshot ids are content-addressed, entries never go stale. If a cache directory is given,
+    serialized snapshots are also written there, so that other processes and later restarts can skip
+    fetching them from the server.
+    """
+
+    def __init__(
+        self, max_size: int = REPOSITORY_SNAPSHOT_CACHE_SIZE, cache_dir: Optional[str] = None
+    ):
+        self._max_size = check.int_param(max_size, "max_size")
+        self._cache_dir = check.opt_str_param(cache_dir, "cache_dir")
+        self._lock = threading.Lock()
+        self._repository_datas: "OrderedDict[str, ExternalRepositoryData]" = OrderedDict()
+
+    def _get_cache_path(self, snapshot_id: str) -> str:
+        return os.path.join(check.not_none(self._cache_dir), f"{snapshot_id}.json")
+
+    def get(self, snapshot_id: str) -> Optional[ExternalRepositoryData]:
+        with self._lock:
+            repository_data = self._repository_datas.get(snapshot_id)
+            if repository_data is not None:
+                self._repository_datas.move_to_end(snapshot_id)
+                return repository_data
+
+        if not self._cache_dir:
+            return None
+
+        cache_path = self._get_cache_path(snapshot_id)
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            with open(cache_path, encoding="utf8") as f:
+                serialized_repository_data = f.read()
+            if _get_snapshot_id(serialized_repository_data) != snapshot_id:
+                raise Exception("Snapshot does not match its id")
+            repository_data = deserialize_value(serialized_repository_data, ExternalRepositoryData)
+        except Exception:
+            logging.getLogger("dagster").warning(
+                f"Could not read cached repository snapshot at {cache_path}", exc_info=True
+            )
+            return None
+
+        self._set_in_memory(snapshot_id, repository_data)
+        return repository_data
+
+    def set(
+        self,
+        snapshot_id: str,
+        serialized_repository_data: str,
+        repository_data: ExternalRepositoryData,
+    ) -> None:
+        self._set_in_memory(snapshot_id, repository_data)
+
+        if not self._cache_dir:
+            return
+
+        cache_path = self._get_cache_path(snapshot_id)
+        if os.path.exists(cache_path):
+            return
+
+        try:
+            mkdir_p(self._cache_dir)
+            # write to a temporary file and move it into place, so that concurrent readers never
+            # see a partially written snapshot
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf8") as f:
+                f.write(serialized_repository_data)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            logging.getLogger("dagster").warning(
+                f"Could not write repository snapshot to {cache_path}", exc_info=True
+            )
+
+    def _set_in_memory(self, snapshot_id: str, repository_data: ExternalRepositoryData) -> None:
+        with self._lock:
+            self._repository_datas[snapshot_id] = repository_data
+            self._repository_datas.move_to_end(snapshot_id)
+            while len(self._repository_datas) > self._max_size:
+                self._repository_datas.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._repository_datas.clear()
+
+
+_repository_snapshot_cache: Optional[RepositorySnapshotCache] = None
+_repository_snapshot_cache_lock = threading.Lock()
+
+
+def get_repository_snapshot_cache() -> RepositorySnapshotCache:
+    """The process-wide repository snapshot cache. Snapshots are also cached on disk if the
+    DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR environment variable is set.
+    """
+    global _repository_snapshot_cache  # noqa: PLW0603
+    with _repository_snapshot_cache_lock:
+        if _repository_snapshot_cache is None:
+            _repository_snapshot_cache = RepositorySnapshotCache(
+                cache_dir=os.getenv("DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR") or None
+            )
+        return _repository_snapshot_cache
+
+
+def _get_snapshot_id(serialized_repository_data: str) -> str:
+    return hashlib.sha256(serialized_repository_data.encode("utf-8")).hexdigest()
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    repository_snapshot_ids: Optional[Mapping[str, str]] = None,
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster._core.host_representation import CodeLocation, ExternalRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
+    check.opt_mapping_param(
+        repository_snapshot_ids, "repository_snapshot_ids", key_type=str, value_type=str
+    )
+
+    repository_snapshot_ids = repository_snapshot_ids or {}
+    snapshot_cache = get_repository_snapshot_cache()
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        # servers that report snapshot ids let us skip fetching snapshots that we already have
+        snapshot_id = repository_snapshot_ids.get(repository_name)
+        cached_repository_data = snapshot_cache.get(snapshot_id) if snapshot_id else None
+        if cached_repository_data is not None:
+            repo_datas[repository_name] = cached_repository_data
+            continue
+
         external_repository_chunks = list(
             api_client.streaming_external_repository(
                 external_repository_origin=ExternalRepositoryOrigin(
@@ -31,18 +165,19 @@ def sync_get_streaming_external_repositories_data_grpc(
             )
         )
 
+        serialized_result = "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        )
         result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
+            serialized_result,
             (ExternalRepositoryData, ExternalRepositoryErrorData),
         )
 
         if isinstance(result, ExternalRepositoryErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
 
+        if snapshot_id:
+            snapshot_cache.set(_get_snapshot_id(serialized_result), serialized_result, result)
+
         repo_datas[repository_name] = result
     return repo_datas
@@ -117,15 +117,16 @@ def _execute_run_command_body(
     run_worker_failed = 0
 
     try:
-        for event in core_execute_run(
-            recon_job,
-            dagster_run,
-            instance,
-            inject_env_vars=True,
-        ):
-            write_stream_fn(event)
-            if event.event_type == DagsterEventType.PIPELINE_FAILURE:
-                run_worker_failed = True
+        with instance.buffered_event_log_writes():
+            for event in core_execute_run(
+                recon_job,
+                dagster_run,
+                instance,
+                inject_env_vars=True,
+            ):
+                write_stream_fn(event)
+                if event.event_type == DagsterEventType.PIPELINE_FAILURE:
+                    run_worker_failed = True
     except:
         # relies on core_execute_run writing failures to the event log before raising
         run_worker_failed = True
@@ -216,16 +217,17 @@ def _resume_run_command_body(
     run_worker_failed = False
 
     try:
-        for event in core_execute_run(
-            recon_job,
-            dagster_run,
-            instance,
-            resume_from_failure=True,
-            inject_env_vars=True,
-        ):
-            write_stream_fn(event)
-            if event.event_type == DagsterEventType.PIPELINE_FAILURE:
-                run_worker_failed = True
+        with instance.buffered_event_log_writes():
+            for event in core_execute_run(
+                recon_job,
+                dagster_run,
+                instance,
+                resume_from_failure=True,
+                inject_env_vars=True,
+            ):
+                write_stream_fn(event)
+                if event.event_type == DagsterEventType.PIPELINE_FAILURE:
+                    run_worker_failed = True
 
     except:
         # relies on core_execute_run writing failures to the event log before raising
@@ -423,14 +425,15 @@ def _execute_step_command_body(
             repository_load_data=repository_load_data,
         )
 
-        yield from execute_plan_iterator(
-            execution_plan,
-            recon_job,
-            dagster_run,
-            instance,
-            run_config=dagster_run.run_config,
-            retry_mode=args.retry_mode,
-        )
+        with instance.buffered_event_log_writes():
+            yield from execute_plan_iterator(
+                execution_plan,
+                recon_job,
+                dagster_run,
+                instance,
+                run_config=dagster_run.run_config,
+                retry_mode=args.retry_mode,
+            )
     except (KeyboardInterrupt, DagsterExecutionInterruptedError):
         yield instance.report_engine_event(
             message="Step execution terminated by interrupt",
@@ -109,22 +109,29 @@ def __init__(
         self._auto_observe = auto_observe
         self._respect_materialization_data_versions = respect_materialization_data_versions
         self._logger = logger
+        self._query_stats_by_asset_key: Dict[AssetKey, Tuple[int, float]] = {}
 
-        # fetch some data in advance to batch some queries
+        self.prefetch()
+
+    def prefetch(self) -> None:
+        """Fetches the data that the evaluation of every target asset and its parents will need in
+        advance, so that it is loaded with a fixed number of batched queries rather than with one
+        or more queries per asset.
+        """
+        asset_keys = self.target_asset_keys_and_parents
         self.instance_queryer.prefetch_asset_records(
-            [
-                key
-                for key in self.target_asset_keys_and_parents
-                if not self.asset_graph.is_source(key)
-            ]
+            [key for key in asset_keys if not self.asset_graph.is_source(key)]
         )
         self.instance_queryer.prefetch_asset_partition_counts(
             [
                 key
-                for key in self.target_asset_keys_and_parents
+                for key in asset_keys
                 if self.asset_graph.is_partitioned(key) and not self.asset_graph.is_source(key)
             ],
-            after_cursor=cursor.latest_storage_id,
+            after_cursor=self.cursor.latest_storage_id,
+        )
+        self.instance_queryer.prefetch_latest_storage_ids_by_partition(
+            [key for key in asset_keys if self.asset_graph.is_partitioned(key)]
         )
 
     @property
@@ -163,6 +170,14 @@ def target_asset_keys_and_parents(self) -> AbstractSet[AssetKey]:
     def respect_materialization_data_versions(self) -> bool:
         return self._respect_materialization_data_versions
 
+    @property
+    def query_stats_by_asset_key(self) -> Mapping[AssetKey, Tuple[int, float]]:
+        """The number of queries issued against the instance while evaluating each target asset,
+        and the time in seconds that they took. Queries issued up front by `prefetch` are not
+        attributed to any asset.
+        """
+        return self._query_stats_by_asset_key
+
     @cached_method
     def _get_never_handled_and_newly_handled_root_asset_partitions(
         self,
@@ -460,9 +475,15 @@ def get_auto_materialize_asset_evaluations(
 
             self._logger.debug(f"Evaluating asset {asset_key.to_user_string()}")
 
+            num_queries_before = self.instance_queryer.num_queries
+            query_duration_before = self.instance_queryer.query_duration
             (evaluation, to_materialize_for_asset, to_discard_for_asset) = self.evaluate_asset(
                 asset_key, will_materialize_mapping, expected_data_time_mapping
             )
+            self._query_stats_by_asset_key[asset_key] = (
+                self.instance_queryer.num_queries - num_queries_before,
+                self.instance_queryer.query_duration - query_duration_before,
+            )
 
             log_fn = (
                 self._logger.info
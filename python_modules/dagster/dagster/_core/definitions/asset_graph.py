@@ -1,5 +1,5 @@
 import functools
-from collections import deque
+from collections import defaultdict, deque
 from datetime import datetime
 from heapq import heapify, heappop, heappush
 from typing import (
@@ -347,16 +347,59 @@ def get_child_partition_keys_of_parent(
                 f" '{parent_asset_key}' is not partitioned."
             )
 
-        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
-        child_partitions_subset = partition_mapping.get_downstream_partitions_for_partitions(
+        child_partitions_subset = self.get_child_partitions_subset_of_parent(
+            dynamic_partitions_store,
             parent_partitions_def.empty_subset().with_partition_keys([parent_partition_key]),
+            parent_asset_key,
+            child_asset_key,
+            current_time,
+        )
+
+        return list(child_partitions_subset.get_partition_keys())
+
+    def get_child_partitions_subset_of_parent(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        parent_partitions_subset: PartitionsSubset,
+        parent_asset_key: AssetKey,
+        child_asset_key: AssetKey,
+        current_time: datetime,
+    ) -> PartitionsSubset:
+        """Converts a subset of partitions of one asset to the corresponding subset of partitions in
+        a downstream asset, using a single call to the partition mapping between the two assets.
+
+        Prefer this to get_child_partition_keys_of_parent when mapping many partitions at once, e.g.
+        time window partitions are mapped range by range instead of key by key.
+
+        Args:
+            parent_partitions_subset (PartitionsSubset): The partitions to convert.
+            parent_asset_key (AssetKey): The asset key of the upstream asset, which the provided
+                partitions belong to.
+            child_asset_key (AssetKey): The asset key of the downstream asset. The provided
+                partitions will be mapped to partitions within this asset.
+
+        Returns:
+            PartitionsSubset: The partitions of child_asset_key that the given partitions map to.
+        """
+        child_partitions_def = self.get_partitions_def(child_asset_key)
+        if child_partitions_def is None:
+            raise DagsterInvalidInvocationError(
+                f"Asset key {child_asset_key} is not partitioned. Cannot get partition keys."
+            )
+        if self.get_partitions_def(parent_asset_key) is None:
+            raise DagsterInvalidInvocationError(
+                f"Parent partitions provided, but parent asset '{parent_asset_key}' is not"
+                " partitioned."
+            )
+
+        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
+        return partition_mapping.get_downstream_partitions_for_partitions(
+            parent_partitions_subset,
             downstream_partitions_def=child_partitions_def,
             dynamic_partitions_store=dynamic_partitions_store,
             current_time=current_time,
         )
 
-        return list(child_partitions_subset.get_partition_keys())
-
     def get_parents_partitions(
         self,
         dynamic_partitions_store: DynamicPartitionsStore,
@@ -424,6 +467,44 @@ def get_parent_partition_keys_for_child(
         partition_key = check.opt_str_param(partition_key, "partition_key")
 
         child_partitions_def = self.get_partitions_def(child_asset_key)
+
+        return self.get_parent_partitions_subset_for_child(
+            (
+                cast(PartitionsDefinition, child_partitions_def).subset_with_partition_keys(
+                    [partition_key]
+                )
+                if partition_key
+                else None
+            ),
+            parent_asset_key,
+            child_asset_key,
+            dynamic_partitions_store=dynamic_partitions_store,
+            current_time=current_time,
+        )
+
+    def get_parent_partitions_subset_for_child(
+        self,
+        child_partitions_subset: Optional[PartitionsSubset],
+        parent_asset_key: AssetKey,
+        child_asset_key: AssetKey,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        current_time: datetime,
+    ) -> UpstreamPartitionsResult:
+        """Converts a subset of partitions of one asset to the corresponding partitions in one of its
+        parent assets, using a single call to the partition mapping between the two assets.
+
+        Args:
+            child_partitions_subset (Optional[PartitionsSubset]): The partitions to convert, or None
+                if the child asset is not partitioned.
+            child_asset_key (AssetKey): The asset key of the child asset, which the provided
+                partitions belong to.
+            parent_asset_key (AssetKey): The asset key of the parent asset. The provided partitions
+                will be mapped to partitions within this asset.
+
+        Returns:
+            UpstreamPartitionsResult: The partitions of parent_asset_key that the given partitions
+                depend on, along with any required parent partitions that do not exist.
+        """
         parent_partitions_def = self.get_partitions_def(parent_asset_key)
 
         if parent_partitions_def is None:
@@ -434,13 +515,7 @@ def get_parent_partition_keys_for_child(
         partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
 
         return partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
-            (
-                cast(PartitionsDefinition, child_partitions_def).subset_with_partition_keys(
-                    [partition_key]
-                )
-                if partition_key
-                else None
-            ),
+            child_partitions_subset,
             upstream_partitions_def=parent_partitions_def,
             dynamic_partitions_store=dynamic_partitions_store,
             current_time=current_time,
@@ -638,25 +713,113 @@ def bfs_filter_asset_partitions(
 
         result: Set[AssetKeyPartitionKey] = set()
 
+        # Children that are guaranteed to be dequeued after every item on the current level of the
+        # queue don't need to be enqueued right away. Deferring them lets us map the partitions of
+        # each asset on this level to its children in one batch, instead of one partition at a time.
+        deferred_partition_keys_by_asset_key: Dict[AssetKey, Set[Optional[str]]] = defaultdict(
+            set
+        )
+
+        def _enqueue(children: Iterable[AssetKeyPartitionKey]) -> None:
+            for child in children:
+                if child not in all_nodes:
+                    queue.enqueue(child)
+                    all_nodes.add(child)
+
         while len(queue) > 0:
+            level = queue.peek_level()
             candidates_unit = queue.dequeue()
 
             if condition_fn(candidates_unit, result):
                 result.update(candidates_unit)
 
                 for candidate in candidates_unit:
-                    for child in self.get_children_partitions(
-                        dynamic_partitions_store,
-                        evaluation_time,
-                        candidate.asset_key,
-                        candidate.partition_key,
-                    ):
-                        if child not in all_nodes:
-                            queue.enqueue(child)
-                            all_nodes.add(child)
+                    deferred_partition_keys_by_asset_key[candidate.asset_key].add(
+                        candidate.partition_key
+                    )
+                    # e.g. self-dependent assets have children on the same level, which must be
+                    # enqueued before the next item is dequeued
+                    _enqueue(
+                        self._get_children_partitions_of_partition_keys(
+                            dynamic_partitions_store,
+                            evaluation_time,
+                            candidate.asset_key,
+                            [candidate.partition_key],
+                            {
+                                child_asset_key
+                                for child_asset_key in self.get_children(candidate.asset_key)
+                                if queue.get_level(child_asset_key) <= level
+                            },
+                        )
+                    )
+
+            if len(queue) == 0 or queue.peek_level() > level:
+                for asset_key, partition_keys in deferred_partition_keys_by_asset_key.items():
+                    _enqueue(
+                        self._get_children_partitions_of_partition_keys(
+                            dynamic_partitions_store,
+                            evaluation_time,
+                            asset_key,
+                            partition_keys,
+                            {
+                                child_asset_key
+                                for child_asset_key in self.get_children(asset_key)
+                                if queue.get_level(child_asset_key) > level
+                            },
+                        )
+                    )
+                deferred_partition_keys_by_asset_key.clear()
 
         return result
 
+    def _get_children_partitions_of_partition_keys(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        current_time: datetime,
+        asset_key: AssetKey,
+        partition_keys: Iterable[Optional[str]],
+        child_asset_keys: AbstractSet[AssetKey],
+    ) -> AbstractSet[AssetKeyPartitionKey]:
+        """Returns every partition of the given children of an asset that depends on any of the
+        given partitions of that asset, mapping all of the partitions at once.
+        """
+        if not child_asset_keys:
+            return set()
+
+        partitions_def = self.get_partitions_def(asset_key)
+        partition_keys = set(partition_keys)
+        # a None partition key maps to every partition of each child
+        partitions_subset = (
+            partitions_def.empty_subset().with_partition_keys(cast(Set[str], partition_keys))
+            if partitions_def is not None and None not in partition_keys
+            else None
+        )
+
+        result: Set[AssetKeyPartitionKey] = set()
+        for child_asset_key in child_asset_keys:
+            child_partitions_def = self.get_partitions_def(child_asset_key)
+            if child_partitions_def is None:
+                result.add(AssetKeyPartitionKey(child_asset_key))
+            elif partitions_subset is None:
+                result.update(
+                    AssetKeyPartitionKey(child_asset_key, child_partition_key)
+                    for child_partition_key in child_partitions_def.get_partition_keys(
+                        dynamic_partitions_store=dynamic_partitions_store
+                    )
+                )
+            else:
+                result.update(
+                    AssetKeyPartitionKey(child_asset_key, child_partition_key)
+                    for child_partition_key in self.get_child_partitions_subset_of_parent(
+                        dynamic_partitions_store,
+                        partitions_subset,
+                        asset_key,
+                        child_asset_key,
+                        current_time,
+                    ).get_partition_keys()
+                )
+        return result
+
     def split_asset_keys_by_repository(
         self, asset_keys: AbstractSet[AssetKey]
     ) -> Sequence[AbstractSet[AssetKey]]:
@@ -793,6 +956,20 @@ def enqueue(self, asset_partition: AssetKeyPartitionKey) -> None:
     def dequeue(self) -> Iterable[AssetKeyPartitionKey]:
         return heappop(self._heap).multi_asset_partition
 
+    def peek_level(self) -> int:
+        """Returns the level of the item that will be dequeued next."""
+        return self._heap[0].level
+
+    def get_level(self, asset_key: AssetKey) -> int:
+        """Returns the level at which partitions of the given asset are dequeued. Partitions are
+        only dequeued after all partitions on lower levels.
+        """
+        return max(
+            self._toposort_level_by_asset_key[required_asset_key]
+            for required_asset_key in self._asset_graph.get_required_multi_asset_keys(asset_key)
+            | {asset_key}
+        )
+
     def _queue_item(
         self, asset_partition: AssetKeyPartitionKey
     ) -> "ToposortedPriorityQueue.QueueItem":
@@ -801,13 +978,9 @@ def _queue_item(
         required_multi_asset_keys = self._asset_graph.get_required_multi_asset_keys(asset_key) | {
             asset_key
         }
-        level = max(
-            self._toposort_level_by_asset_key[required_asset_key]
-            for required_asset_key in required_multi_asset_keys
-        )
 
         return ToposortedPriorityQueue.QueueItem(
-            level,
+            self.get_level(asset_key),
             sort_key_for_asset_partition(self._asset_graph, asset_partition),
             [
                 AssetKeyPartitionKey(ak, asset_partition.partition_key)
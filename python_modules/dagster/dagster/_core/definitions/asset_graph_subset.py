@@ -72,17 +72,40 @@ def __contains__(self, asset_partition: AssetKeyPartitionKey) -> bool:
                 partitions_subset is not None and asset_partition.partition_key in partitions_subset
             )
 
-    def to_storage_dict(
+    def get_serializable_partitions_def_ids_by_asset_key(
         self, dynamic_partitions_store: DynamicPartitionsStore
+    ) -> Mapping[AssetKey, str]:
+        return {
+            key: value.partitions_def.get_serializable_unique_identifier(
+                dynamic_partitions_store=dynamic_partitions_store
+            )
+            for key, value in self.partitions_subsets_by_asset_key.items()
+        }
+
+    def to_storage_dict(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        serializable_partitions_def_ids_by_asset_key: Optional[Mapping[AssetKey, str]] = None,
     ) -> Mapping[str, object]:
+        """Args:
+        serializable_partitions_def_ids_by_asset_key (Optional[Mapping[AssetKey, str]]):
+            Precomputed serializable partitions def ids, which can be shared between subsets of
+            the same asset graph to avoid recomputing them. Ids for asset keys that are missing
+            from the mapping are computed.
+        """
+        partitions_def_ids_by_asset_key = serializable_partitions_def_ids_by_asset_key or {}
         return {
             "partitions_subsets_by_asset_key": {
                 key.to_user_string(): value.serialize()
                 for key, value in self.partitions_subsets_by_asset_key.items()
             },
             "serializable_partitions_def_ids_by_asset_key": {
-                key.to_user_string(): value.partitions_def.get_serializable_unique_identifier(
-                    dynamic_partitions_store=dynamic_partitions_store
+                key.to_user_string(): (
+                    partitions_def_ids_by_asset_key[key]
+                    if key in partitions_def_ids_by_asset_key
+                    else value.partitions_def.get_serializable_unique_identifier(
+                        dynamic_partitions_store=dynamic_partitions_store
+                    )
                 )
                 for key, value in self.partitions_subsets_by_asset_key.items()
             },
@@ -621,6 +621,10 @@ class AutoMaterializeAssetEvaluation(NamedTuple):
             tuples, where the first element is the condition and the second element is the
             serialized subset of partitions that the condition applies to. If it's not partitioned,
             the second element will be None.
+        num_queries: The number of queries issued against the instance while evaluating the
+            asset, if known.
+        query_duration: The time in seconds spent on queries against the instance while
+            evaluating the asset, if known.
     """
 
     asset_key: AssetKey
@@ -631,6 +635,8 @@ class AutoMaterializeAssetEvaluation(NamedTuple):
     num_skipped: int
     num_discarded: int
     run_ids: Set[str] = set()
+    num_queries: Optional[int] = None
+    query_duration: Optional[float] = None
 
     @staticmethod
     def from_rule_evaluation_results(
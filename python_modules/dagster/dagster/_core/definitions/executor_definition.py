@@ -6,7 +6,7 @@
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._builtins import Int
+from dagster._builtins import Bool, Int
 from dagster._config import Field, Noneable, Selector, UserConfigSchema
 from dagster._core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
@@ -340,6 +340,13 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        reuse_processes=check.opt_bool_param(
+            config.get("reuse_processes"), "reuse_processes", default=False
+        ),
+        max_steps_per_process=check.opt_int_elem(config, "max_steps_per_process"),
+        prioritize_critical_path=check.opt_bool_param(
+            config.get("prioritize_critical_path"), "prioritize_critical_path", default=False
+        ),
     )
 
 
@@ -392,6 +399,33 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "reuse_processes": Field(
+            Bool,
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived subprocesses instead of starting a new"
+                " subprocess for each step, so that user code is only imported once per"
+                " subprocess. Resources are still initialized for each step."
+            ),
+        ),
+        "max_steps_per_process": Field(
+            Noneable(Int),
+            default_value=None,
+            description=(
+                "If `reuse_processes` is enabled, the number of steps each subprocess executes"
+                " before it is replaced by a new one. By default, subprocesses are never replaced."
+            ),
+        ),
+        "prioritize_critical_path": Field(
+            Bool,
+            is_required=False,
+            description=(
+                "When more steps are ready than can run concurrently, start the steps with the"
+                " longest chain of downstream steps first. Chains are weighted by the step"
+                " durations of the most recent successful run of the job, if there is one."
+                " Steps are still ordered by the `dagster/priority` tag first."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -29,6 +29,7 @@
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, deprecated, deprecated_param, public
+from dagster._core.definitions.partition_key_index import PartitionKeyIndex, bitmap_count
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.run_request import (
     AddDynamicPartitionsRequest,
@@ -44,6 +45,7 @@
 )
 
 from ..errors import (
+    DagsterDefinitionChangedDeserializationError,
     DagsterInvalidDefinitionError,
     DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
@@ -987,6 +989,20 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
             return self
         return self.with_partition_keys(other.get_partition_keys())
 
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self
+        return self.partitions_def.empty_subset().with_partition_keys(
+            set(self.get_partition_keys()) & set(other.get_partition_keys())
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self.partitions_def.empty_subset()
+        return self.partitions_def.empty_subset().with_partition_keys(
+            set(self.get_partition_keys()) - set(other.get_partition_keys())
+        )
+
     @abstractmethod
     def serialize(self) -> str:
         ...
@@ -1068,27 +1084,84 @@ class DefaultPartitionsSubset(PartitionsSubset[T_str]):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
     SERIALIZATION_VERSION = 1
+    # Subsets can also be serialized as a compressed bitmap over the ordered partition keys of the
+    # partitions definition (see `serialize_bitmap`), which is much more compact for definitions
+    # with many partitions, but can only be deserialized against the same partition keys.
+    BITMAP_SERIALIZATION_VERSION = 2
 
     def __init__(
-        self, partitions_def: PartitionsDefinition[T_str], subset: Optional[Set[T_str]] = None
+        self,
+        partitions_def: PartitionsDefinition[T_str],
+        subset: Optional[Set[T_str]] = None,
+        key_index: Optional[PartitionKeyIndex] = None,
+        bitmap: Optional[int] = None,
     ):
         check.opt_set_param(subset, "subset")
+        check.opt_inst_param(key_index, "key_index", PartitionKeyIndex)
+        check.opt_int_param(bitmap, "bitmap")
+        check.param_invariant(
+            (key_index is None) == (bitmap is None) and not (subset and bitmap is not None),
+            "bitmap",
+            "A subset must be backed either by a set of partition keys, or by a key index and"
+            " bitmap",
+        )
         self._partitions_def = partitions_def
-        self._subset = subset or set()
+        # When backed by a bitmap over the partition keys of a PartitionKeyIndex, the set of
+        # partition keys is only built if needed
+        self._keys: Optional[Set[T_str]] = None if bitmap is not None else (subset or set())
+        self._key_index = key_index
+        self._bitmap = bitmap
+
+    @classmethod
+    def from_bitmap(
+        cls,
+        partitions_def: PartitionsDefinition[T_str],
+        key_index: PartitionKeyIndex,
+        bitmap: int,
+    ) -> "DefaultPartitionsSubset[T_str]":
+        return cls(partitions_def, key_index=key_index, bitmap=bitmap)
+
+    @property
+    def _subset(self) -> Set[T_str]:
+        if self._keys is None:
+            self._keys = cast(
+                Set[T_str],
+                set(
+                    check.not_none(self._key_index).get_partition_keys(check.not_none(self._bitmap))
+                ),
+            )
+        return self._keys
+
+    def _has_same_key_index(self, key_index: Optional[PartitionKeyIndex]) -> bool:
+        return (
+            self._key_index is not None
+            and key_index is not None
+            and self._key_index.has_same_partition_keys(key_index)
+        )
+
+    def _get_bitmap(self, key_index: PartitionKeyIndex) -> int:
+        if self._has_same_key_index(key_index):
+            return check.not_none(self._bitmap)
+        return key_index.get_bitmap(self._subset)
 
     def get_partition_keys_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Iterable[str]:
-        return (
-            set(
-                self._partitions_def.get_partition_keys(
-                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        partition_keys = self._partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        if self._key_index is not None and self._has_same_key_index(
+            PartitionKeyIndex(partition_keys)
+        ):
+            return set(
+                self._key_index.get_partition_keys(
+                    self._key_index.get_full_bitmap() & ~check.not_none(self._bitmap)
                 )
             )
-            - self._subset
-        )
+
+        return set(partition_keys) - self._subset
 
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
         return self._subset
@@ -1122,26 +1195,107 @@ def get_partition_key_ranges(
     def with_partition_keys(
         self, partition_keys: Iterable[T_str]
     ) -> "DefaultPartitionsSubset[T_str]":
+        if self._key_index is not None and self._bitmap is not None:
+            partition_keys = list(partition_keys)
+            if self._key_index.contains_all(partition_keys):
+                return DefaultPartitionsSubset.from_bitmap(
+                    self._partitions_def,
+                    self._key_index,
+                    self._bitmap | self._key_index.get_bitmap(partition_keys),
+                )
+
         return DefaultPartitionsSubset(
             self._partitions_def,
             self._subset | set(partition_keys),
         )
 
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if isinstance(other, DefaultPartitionsSubset) and self._has_same_key_index(
+            other._key_index
+        ):
+            return DefaultPartitionsSubset.from_bitmap(
+                self._partitions_def,
+                check.not_none(self._key_index),
+                check.not_none(self._bitmap) | check.not_none(other._bitmap),
+            )
+        return super(DefaultPartitionsSubset, self).__or__(other)
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if isinstance(other, DefaultPartitionsSubset) and self._has_same_key_index(
+            other._key_index
+        ):
+            return DefaultPartitionsSubset.from_bitmap(
+                self._partitions_def,
+                check.not_none(self._key_index),
+                check.not_none(self._bitmap) & check.not_none(other._bitmap),
+            )
+        return super(DefaultPartitionsSubset, self).__and__(other)
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if isinstance(other, DefaultPartitionsSubset) and self._has_same_key_index(
+            other._key_index
+        ):
+            return DefaultPartitionsSubset.from_bitmap(
+                self._partitions_def,
+                check.not_none(self._key_index),
+                check.not_none(self._bitmap) & ~check.not_none(other._bitmap),
+            )
+        return super(DefaultPartitionsSubset, self).__sub__(other)
+
     def serialize(self) -> str:
         # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
         # Any time the serialization format changes, we should increment the version number.
         return json.dumps({"version": self.SERIALIZATION_VERSION, "subset": list(self._subset)})
 
+    def serialize_bitmap(self, key_index: PartitionKeyIndex) -> str:
+        """Serializes the subset as a bitmap over the partition keys of the given index, which must
+        be the partition keys of the partitions definition. Keys that are not in the index are not
+        serialized.
+        """
+        return json.dumps(
+            {
+                "version": self.BITMAP_SERIALIZATION_VERSION,
+                "partition_keys_hash": key_index.partition_keys_hash,
+                "bitmap": key_index.serialize_bitmap(self._get_bitmap(key_index)),
+            }
+        )
+
     @classmethod
     def from_serialized(
-        cls, partitions_def: PartitionsDefinition[T_str], serialized: str
+        cls,
+        partitions_def: PartitionsDefinition[T_str],
+        serialized: str,
+        key_index: Optional[PartitionKeyIndex] = None,
     ) -> "PartitionsSubset[T_str]":
+        # key_index holds the partition keys of partitions_def. Bitmaps over the keys of a named
+        # DynamicPartitionsDefinition can only be deserialized when it is given, since those keys
+        # are fetched from a DynamicPartitionsStore.
         # Check the version number, so only valid versions can be deserialized.
         data = json.loads(serialized)
 
         if isinstance(data, list):
             # backwards compatibility
             return cls(subset=set(data), partitions_def=partitions_def)
+        elif data.get("version") == cls.BITMAP_SERIALIZATION_VERSION:
+            if key_index is None:
+                if (
+                    isinstance(partitions_def, DynamicPartitionsDefinition)
+                    and partitions_def.name is not None
+                ):
+                    raise DagsterInvalidInvocationError(
+                        "Deserializing a partition subset bitmap of the dynamic partitions"
+                        f" definition '{partitions_def.name}' requires a key index of its"
+                        " current partition keys."
+                    )
+                key_index = PartitionKeyIndex(partitions_def.get_partition_keys())
+            if data.get("partition_keys_hash") != key_index.partition_keys_hash:
+                raise DagsterDefinitionChangedDeserializationError(
+                    "Attempted to deserialize a partition subset bitmap over partition keys that"
+                    " differ from the current partition keys of the partitions definition."
+                )
+            return cls.from_bitmap(
+                partitions_def, key_index, key_index.deserialize_bitmap(data["bitmap"])
+            )
         else:
             if data.get("version") != cls.SERIALIZATION_VERSION:
                 raise DagsterInvalidDeserializationVersionError(
@@ -1162,8 +1316,13 @@ def can_deserialize(
             return serialized_partitions_def_class_name == partitions_def.__class__.__name__
 
         data = json.loads(serialized)
-        return isinstance(data, list) or (
-            data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
+        return (
+            isinstance(data, list)
+            or (data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION)
+            or (
+                data.get("bitmap") is not None
+                and data.get("version") == cls.BITMAP_SERIALIZATION_VERSION
+            )
         )
 
     @property
@@ -1171,14 +1330,19 @@ def partitions_def(self) -> PartitionsDefinition[T_str]:
         return self._partitions_def
 
     def __eq__(self, other: object) -> bool:
-        return (
+        if not (
             isinstance(other, DefaultPartitionsSubset)
             and self._partitions_def == other._partitions_def
-            and self._subset == other._subset
-        )
+        ):
+            return False
+        if self._has_same_key_index(other._key_index):
+            return self._bitmap == other._bitmap
+        return self._subset == other._subset
 
     def __len__(self) -> int:
-        return len(self._subset)
+        if self._keys is None:
+            return bitmap_count(check.not_none(self._bitmap))
+        return len(self._keys)
 
     def __contains__(self, value) -> bool:
         return value in self._subset
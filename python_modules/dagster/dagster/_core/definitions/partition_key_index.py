@@ -0,0 +1,97 @@
+import base64
+import hashlib
+import json
+import zlib
+from itertools import compress
+from typing import Dict, Iterable, Optional, Sequence
+
+import dagster._check as check
+
+# maps the ASCII digits of a binary string to the bytes 0 and 1, so the string can be used as
+# selectors for itertools.compress
+_BINARY_DIGIT_TO_SELECTOR = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class PartitionKeyIndex:
+    """An ordered sequence of partition keys, used to represent subsets of those keys as bitmaps.
+
+    A bitmap is an int in which bit i is set iff the i-th partition key is in the subset. Unions,
+    intersections, differences and counts of bitmaps over the same index are computed a machine
+    word at a time, instead of a partition key at a time as with sets of keys.
+    """
+
+    def __init__(self, partition_keys: Sequence[str]):
+        self._partition_keys = check.sequence_param(partition_keys, "partition_keys")
+        self._positions: Optional[Dict[str, int]] = None
+        self._partition_keys_hash: Optional[str] = None
+
+    @property
+    def partition_keys(self) -> Sequence[str]:
+        return self._partition_keys
+
+    @property
+    def partition_keys_hash(self) -> str:
+        """A hash of the ordered partition keys, matching the serializable unique identifier of a
+        static or dynamic partitions definition with these keys. Bitmaps are only meaningful
+        against an index with the same hash.
+        """
+        if self._partition_keys_hash is None:
+            self._partition_keys_hash = hashlib.sha1(
+                json.dumps(list(self._partition_keys)).encode("utf-8")
+            ).hexdigest()
+        return self._partition_keys_hash
+
+    def __len__(self) -> int:
+        return len(self._partition_keys)
+
+    def _get_positions(self) -> Dict[str, int]:
+        if self._positions is None:
+            positions: Dict[str, int] = {}
+            for position, partition_key in enumerate(self._partition_keys):
+                positions.setdefault(partition_key, position)
+            self._positions = positions
+        return self._positions
+
+    def has_same_partition_keys(self, other: "PartitionKeyIndex") -> bool:
+        return self is other or list(self._partition_keys) == list(other.partition_keys)
+
+    def contains_all(self, partition_keys: Iterable[str]) -> bool:
+        positions = self._get_positions()
+        return all(partition_key in positions for partition_key in partition_keys)
+
+    def get_bitmap(self, partition_keys: Iterable[str]) -> int:
+        """Returns the bitmap of the given partition keys. Keys that are not in the index are
+        ignored.
+        """
+        positions = self._get_positions()
+        # set bits in a buffer rather than or-ing ints together, since every operation on an int
+        # costs time proportional to its size
+        buffer = bytearray((len(self._partition_keys) + 7) // 8)
+        for partition_key in partition_keys:
+            position = positions.get(partition_key)
+            if position is not None:
+                buffer[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(buffer, "little")
+
+    def get_full_bitmap(self) -> int:
+        return (1 << len(self._partition_keys)) - 1
+
+    def get_partition_keys(self, bitmap: int) -> Sequence[str]:
+        """Returns the partition keys in the given bitmap, in index order."""
+        selectors = bin(bitmap)[:1:-1].encode("ascii").translate(_BINARY_DIGIT_TO_SELECTOR)
+        return list(compress(self._partition_keys, selectors))
+
+    def serialize_bitmap(self, bitmap: int) -> str:
+        # zlib compresses runs of set or unset bits well, which is the common case for partitions
+        # that are materialized or backfilled in ranges
+        data = bitmap.to_bytes((len(self._partition_keys) + 7) // 8, "little")
+        return base64.b64encode(zlib.compress(data)).decode("ascii")
+
+    def deserialize_bitmap(self, serialized: str) -> int:
+        bitmap = int.from_bytes(zlib.decompress(base64.b64decode(serialized)), "little")
+        return bitmap & self.get_full_bitmap()
+
+
+def bitmap_count(bitmap: int) -> int:
+    """Returns the number of set bits in the given bitmap."""
+    return bin(bitmap).count("1")
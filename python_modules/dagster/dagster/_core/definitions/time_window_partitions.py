@@ -1,6 +1,9 @@
+import bisect
 import functools
 import hashlib
+import heapq
 import json
+import math
 import re
 from datetime import datetime
 from enum import Enum
@@ -533,6 +536,57 @@ def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence
                 break
         return result
 
+    @functools.lru_cache(maxsize=5)
+    def _get_fixed_partition_interval(self) -> Optional[Tuple[float, float]]:
+        """If every partition has the same duration, returns that duration in seconds, along with the
+        timestamp of a partition boundary. Otherwise, returns None.
+        """
+        # in timezones with daylight savings time, partitions that span a transition are shorter or
+        # longer than the rest
+        if self.timezone != "UTC":
+            return None
+
+        minutely_match = re.fullmatch(r"\*(?:/(\d+))? \* \* \* \*", self.cron_schedule)
+        if minutely_match:
+            step = int(minutely_match.group(1) or 1)
+            # steps that don't divide the hour reset at the start of every hour
+            interval = step * 60 if 60 % step == 0 else None
+        elif self.schedule_type == ScheduleType.HOURLY:
+            interval = 60 * 60
+        elif self.schedule_type == ScheduleType.DAILY:
+            interval = 24 * 60 * 60
+        elif self.schedule_type == ScheduleType.WEEKLY:
+            interval = 7 * 24 * 60 * 60
+        else:
+            interval = None
+
+        if interval is None:
+            return None
+
+        return float(interval), next(iter(self._iterate_time_windows(self.start))).start.timestamp()
+
+    def get_num_partitions_in_time_window(self, time_window: TimeWindow) -> int:
+        """Returns the number of partitions that start within the given time window. Unlike
+        get_partition_keys_in_time_window, does not format partition keys, and for definitions
+        whose partitions all have the same duration, does not iterate over partitions.
+        """
+        if time_window.start >= time_window.end:
+            return 0
+
+        fixed_partition_interval = self._get_fixed_partition_interval()
+        if fixed_partition_interval is not None:
+            interval, boundary_timestamp = fixed_partition_interval
+            return math.ceil(
+                (time_window.end.timestamp() - boundary_timestamp) / interval
+            ) - math.ceil((time_window.start.timestamp() - boundary_timestamp) / interval)
+
+        num_partitions = 0
+        for partition_time_window in self._iterate_time_windows(time_window.start):
+            if partition_time_window.start >= time_window.end:
+                break
+            num_partitions += 1
+        return num_partitions
+
     def get_partition_key_range_for_time_window(self, time_window: TimeWindow) -> PartitionKeyRange:
         start_partition_key = self.get_partition_key_for_timestamp(time_window.start.timestamp())
         end_partition_key = self.get_partition_key_for_timestamp(
@@ -1365,6 +1419,65 @@ def inner(
     return inner
 
 
+def _union_time_windows(
+    time_windows: Sequence[TimeWindow], other_time_windows: Sequence[TimeWindow]
+) -> List[TimeWindow]:
+    """Returns the union of two sorted sequences of time windows, as a sorted list of disjoint,
+    non-adjacent time windows.
+    """
+    result: List[TimeWindow] = []
+    for time_window in heapq.merge(time_windows, other_time_windows, key=lambda tw: tw.start):
+        if result and time_window.start <= result[-1].end:
+            if time_window.end > result[-1].end:
+                result[-1] = TimeWindow(result[-1].start, time_window.end)
+        else:
+            result.append(time_window)
+    return result
+
+
+def _intersect_time_windows(
+    time_windows: Sequence[TimeWindow], other_time_windows: Sequence[TimeWindow]
+) -> List[TimeWindow]:
+    """Returns the intersection of two sorted sequences of disjoint time windows."""
+    result: List[TimeWindow] = []
+    i = j = 0
+    while i < len(time_windows) and j < len(other_time_windows):
+        start = max(time_windows[i].start, other_time_windows[j].start)
+        end = min(time_windows[i].end, other_time_windows[j].end)
+        if start < end:
+            result.append(TimeWindow(start, end))
+        if time_windows[i].end < other_time_windows[j].end:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_time_windows(
+    time_windows: Sequence[TimeWindow], other_time_windows: Sequence[TimeWindow]
+) -> List[TimeWindow]:
+    """Returns the parts of a sorted sequence of disjoint time windows that are not covered by
+    another sorted sequence of disjoint time windows.
+    """
+    result: List[TimeWindow] = []
+    j = 0
+    for time_window in time_windows:
+        while j < len(other_time_windows) and other_time_windows[j].end <= time_window.start:
+            j += 1
+
+        start = time_window.start
+        k = j
+        while k < len(other_time_windows) and other_time_windows[k].start < time_window.end:
+            if other_time_windows[k].start > start:
+                result.append(TimeWindow(start, other_time_windows[k].start))
+            start = max(start, other_time_windows[k].end)
+            k += 1
+
+        if start < time_window.end:
+            result.append(TimeWindow(start, time_window.end))
+    return result
+
+
 class TimeWindowPartitionsSubset(PartitionsSubset):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
@@ -1394,6 +1507,7 @@ def __init__(
         self._included_partition_keys = check.opt_nullable_set_param(
             included_partition_keys, "included_partition_keys", of_type=str
         )
+        self._included_time_window_starts: Optional[Sequence[datetime]] = None
 
     @property
     def included_time_windows(self) -> Sequence[TimeWindow]:
@@ -1406,6 +1520,26 @@ def included_time_windows(self) -> Sequence[TimeWindow]:
             self._included_time_windows = result_time_windows
         return self._included_time_windows
 
+    @property
+    def _has_only_valid_time_windows(self) -> bool:
+        # Subsets that are represented as a set of partition keys may contain keys that are not
+        # valid for the partitions definition, so operations on them are done on their keys
+        return not self._included_partition_keys
+
+    def _can_operate_on_time_windows(self, other: "PartitionsSubset") -> bool:
+        return (
+            isinstance(other, TimeWindowPartitionsSubset)
+            and self._partitions_def == other.partitions_def
+            and self._has_only_valid_time_windows
+            and other._has_only_valid_time_windows  # noqa: SLF001
+        )
+
+    def _get_num_partitions_in_time_windows(self, time_windows: Sequence[TimeWindow]) -> int:
+        return sum(
+            self._partitions_def.get_num_partitions_in_time_window(time_window)
+            for time_window in time_windows
+        )
+
     def _get_partition_time_windows_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
@@ -1419,36 +1553,9 @@ def _get_partition_time_windows_not_in_subset(
         if not first_tw or not last_tw:
             check.failed("No partitions found")
 
-        if len(self.included_time_windows) == 0:
-            return [TimeWindow(first_tw.start, last_tw.end)]
-
-        time_windows = []
-        if first_tw.start < self.included_time_windows[0].start:
-            time_windows.append(TimeWindow(first_tw.start, self.included_time_windows[0].start))
-
-        for i in range(len(self.included_time_windows) - 1):
-            if self.included_time_windows[i].start >= last_tw.end:
-                break
-            if self.included_time_windows[i].end < last_tw.end:
-                if self.included_time_windows[i + 1].start <= last_tw.end:
-                    time_windows.append(
-                        TimeWindow(
-                            self.included_time_windows[i].end,
-                            self.included_time_windows[i + 1].start,
-                        )
-                    )
-                else:
-                    time_windows.append(
-                        TimeWindow(
-                            self.included_time_windows[i].end,
-                            last_tw.end,
-                        )
-                    )
-
-        if last_tw.end > self.included_time_windows[-1].end:
-            time_windows.append(TimeWindow(self.included_time_windows[-1].end, last_tw.end))
-
-        return time_windows
+        return _subtract_time_windows(
+            [TimeWindow(first_tw.start, last_tw.end)], self.included_time_windows
+        )
 
     def get_partition_keys_not_in_subset(
         self,
@@ -1489,51 +1596,13 @@ def _add_partitions_to_time_windows(
         """Merges a set of partition keys into an existing set of time windows, returning the
         minimized set of time windows and the number of partitions added.
         """
-        result_windows = [*initial_windows]
+        # each time window is a single partition, and they are sorted by start time
         time_windows = self._partitions_def.time_windows_for_partition_keys(
             frozenset(partition_keys), validate=validate
         )
-        num_added_partitions = 0
-        for window in sorted(time_windows):
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window.start < included_window.end
-                gte_start_of_range = window.start >= included_window.start
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end == window.start
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end == result_windows[i + 1].start
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = TimeWindow(
-                            included_window.start, result_windows[i + 1].end
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = TimeWindow(included_window.start, window.end)
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = TimeWindow(window.start, result_windows[i + 1].end)
-                    else:
-                        result_windows.insert(i + 1, window)
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window.start == result_windows[0].start:
-                    result_windows[0] = TimeWindow(window.start, included_window.end)  # type: ignore
-                else:
-                    result_windows.insert(0, window)
-
-                num_added_partitions += 1
-
-        return result_windows, num_added_partitions
+        # a single partition is either entirely covered by the initial windows, or not at all
+        num_added_partitions = len(_subtract_time_windows(time_windows, initial_windows))
+        return _union_time_windows(initial_windows, time_windows), num_added_partitions
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowPartitionsSubset":
         # if we are representing things as a static set of keys, continue doing so
@@ -1555,6 +1624,104 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowParti
             included_time_windows=result_windows,
         )
 
+    def with_partition_key_range(
+        self,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "TimeWindowPartitionsSubset":
+        if not self._has_only_valid_time_windows:
+            return cast(
+                TimeWindowPartitionsSubset,
+                super(TimeWindowPartitionsSubset, self).with_partition_key_range(
+                    partition_key_range, dynamic_partitions_store=dynamic_partitions_store
+                ),
+            )
+
+        first_tw = self._partitions_def.get_first_partition_window()
+        last_tw = self._partitions_def.get_last_partition_window()
+        if not first_tw or not last_tw:
+            return self
+
+        # only the partitions in the range that are valid for the partitions definition are added
+        range_time_window = TimeWindow(
+            max(
+                self._partitions_def.time_window_for_partition_key(partition_key_range.start).start,
+                first_tw.start,
+            ),
+            min(
+                self._partitions_def.time_window_for_partition_key(partition_key_range.end).end,
+                last_tw.end,
+            ),
+        )
+        if range_time_window.start >= range_time_window.end:
+            return self
+
+        return self | TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=self._partitions_def.get_num_partitions_in_time_window(
+                range_time_window
+            ),
+            included_time_windows=[range_time_window],
+        )
+
+    def __or__(self, other: "PartitionsSubset") -> "TimeWindowPartitionsSubset":
+        if self is other:
+            return self
+        if not self._can_operate_on_time_windows(other):
+            return cast(
+                TimeWindowPartitionsSubset, super(TimeWindowPartitionsSubset, self).__or__(other)
+            )
+
+        other = cast(TimeWindowPartitionsSubset, other)
+        num_overlapping_partitions = self._get_num_partitions_in_time_windows(
+            _intersect_time_windows(self.included_time_windows, other.included_time_windows)
+        )
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=len(self) + len(other) - num_overlapping_partitions,
+            included_time_windows=_union_time_windows(
+                self.included_time_windows, other.included_time_windows
+            ),
+        )
+
+    def __and__(self, other: "PartitionsSubset") -> "TimeWindowPartitionsSubset":
+        if self is other:
+            return self
+        if not self._can_operate_on_time_windows(other):
+            return cast(
+                TimeWindowPartitionsSubset, super(TimeWindowPartitionsSubset, self).__and__(other)
+            )
+
+        other = cast(TimeWindowPartitionsSubset, other)
+        time_windows = _intersect_time_windows(
+            self.included_time_windows, other.included_time_windows
+        )
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=self._get_num_partitions_in_time_windows(time_windows),
+            included_time_windows=time_windows,
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "TimeWindowPartitionsSubset":
+        if self is other:
+            return cast(TimeWindowPartitionsSubset, self.empty_subset(self._partitions_def))
+        if not self._can_operate_on_time_windows(other):
+            return cast(
+                TimeWindowPartitionsSubset, super(TimeWindowPartitionsSubset, self).__sub__(other)
+            )
+
+        other = cast(TimeWindowPartitionsSubset, other)
+        num_overlapping_partitions = self._get_num_partitions_in_time_windows(
+            _intersect_time_windows(self.included_time_windows, other.included_time_windows)
+        )
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=len(self) - num_overlapping_partitions,
+            included_time_windows=_subtract_time_windows(
+                self.included_time_windows, other.included_time_windows
+            ),
+        )
+
     @classmethod
     def from_serialized(
         cls, partitions_def: PartitionsDefinition, serialized: str
@@ -1670,11 +1837,13 @@ def __contains__(self, partition_key: str) -> bool:
 
         time_window = self._partitions_def.time_window_for_partition_key(partition_key)
 
-        return any(
-            time_window.start >= included_time_window.start
-            and time_window.start < included_time_window.end
-            for included_time_window in self.included_time_windows
-        )
+        if self._included_time_window_starts is None:
+            self._included_time_window_starts = [tw.start for tw in self.included_time_windows]
+
+        # the included time windows are sorted and disjoint, so only the last window that starts at
+        # or before the partition can contain it
+        i = bisect.bisect_right(self._included_time_window_starts, time_window.start) - 1
+        return i >= 0 and time_window.start < self.included_time_windows[i].end
 
     def __repr__(self) -> str:
         return f"TimeWindowPartitionsSubset({self.get_partition_key_ranges()})"
@@ -594,6 +594,18 @@ def __init__(self, run_id):
         )
 
 
+class DagsterEventLogBatchWriteError(DagsterError):
+    """Raised when a batch of events was only partially written to the event log. The first
+    `num_stored_events` events of the batch were stored, and should not be written again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.num_stored_events = check.int_param(
+            kwargs.pop("num_stored_events"), "num_stored_events"
+        )
+        super(DagsterEventLogBatchWriteError, self).__init__(*args, **kwargs)
+
+
 class ScheduleExecutionError(DagsterUserCodeExecutionError):
     """Errors raised in a user process during the execution of schedule."""
 
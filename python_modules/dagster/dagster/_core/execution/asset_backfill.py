@@ -472,20 +472,31 @@ def from_asset_partitions(
         return cls.empty(target_subset, backfill_start_time)
 
     def serialize(self, dynamic_partitions_store: DynamicPartitionsStore) -> str:
+        # the other subsets are subsets of the target subset, so the partitions def ids of the
+        # target subset only need to be computed once, rather than once per subset
+        partitions_def_ids_by_asset_key = (
+            self.target_subset.get_serializable_partitions_def_ids_by_asset_key(
+                dynamic_partitions_store=dynamic_partitions_store
+            )
+        )
         storage_dict = {
             "requested_runs_for_target_roots": self.requested_runs_for_target_roots,
             "serialized_target_subset": self.target_subset.to_storage_dict(
-                dynamic_partitions_store=dynamic_partitions_store
+                dynamic_partitions_store=dynamic_partitions_store,
+                serializable_partitions_def_ids_by_asset_key=partitions_def_ids_by_asset_key,
             ),
             "latest_storage_id": self.latest_storage_id,
             "serialized_requested_subset": self.requested_subset.to_storage_dict(
-                dynamic_partitions_store=dynamic_partitions_store
+                dynamic_partitions_store=dynamic_partitions_store,
+                serializable_partitions_def_ids_by_asset_key=partitions_def_ids_by_asset_key,
             ),
             "serialized_materialized_subset": self.materialized_subset.to_storage_dict(
-                dynamic_partitions_store=dynamic_partitions_store
+                dynamic_partitions_store=dynamic_partitions_store,
+                serializable_partitions_def_ids_by_asset_key=partitions_def_ids_by_asset_key,
             ),
             "serialized_failed_subset": self.failed_and_downstream_subset.to_storage_dict(
-                dynamic_partitions_store=dynamic_partitions_store
+                dynamic_partitions_store=dynamic_partitions_store,
+                serializable_partitions_def_ids_by_asset_key=partitions_def_ids_by_asset_key,
             ),
         }
         return json.dumps(storage_dict)
@@ -737,7 +748,10 @@ def execute_asset_backfill_iteration(
             # finished in order to display the final partition statuses in the UI.
             updated_backfill = updated_backfill.with_status(BulkActionStatus.COMPLETED)
 
-        instance.update_backfill(updated_backfill)
+        # iterations that only wait on in-progress runs leave the backfill unchanged, so there is
+        # no need to rewrite it
+        if updated_backfill != backfill:
+            instance.update_backfill(updated_backfill)
 
     elif backfill.status == BulkActionStatus.CANCELING:
         if not instance.run_coordinator:
@@ -788,7 +802,8 @@ def execute_asset_backfill_iteration(
         if updated_asset_backfill_data.have_all_requested_runs_finished():
             updated_backfill = updated_backfill.with_status(BulkActionStatus.CANCELED)
 
-        instance.update_backfill(updated_backfill)
+        if updated_backfill != backfill:
+            instance.update_backfill(updated_backfill)
     else:
         check.failed(f"Unexpected backfill status: {backfill.status}")
 
@@ -30,12 +30,15 @@
     PlanOrchestrationContext,
 )
 from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
 from dagster._core.execution.retries import RetryMode, RetryState
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG, PRIORITY_TAG
+from dagster._core.utils import toposort
 from dagster._utils.interrupts import pop_captured_interrupt
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
 from .instance_concurrency_context import InstanceConcurrencyContext
+from .handle import ResolvedFromDynamicStepHandle, StepHandle
 from .outputs import StepOutputData, StepOutputHandle
 from .plan import ExecutionPlan
 from .step import ExecutionStep
@@ -45,6 +48,95 @@ def _default_sort_key(step: ExecutionStep) -> float:
     return int(step.tags.get(PRIORITY_TAG, 0)) * -1
 
 
+# weight used for steps with no recorded duration, so that unweighted plans are ordered by the
+# number of steps downstream of each step
+DEFAULT_STEP_WEIGHT = 1.0
+
+
+def _critical_path_key(step_key: str) -> str:
+    # mapped steps resolved from the same dynamic output share the weight and critical path length
+    # of their unresolved form, since the resolved step keys are not known when the plan is built
+    handle = StepHandle.parse_from_key(step_key)
+    if isinstance(handle, ResolvedFromDynamicStepHandle):
+        return handle.unresolved_form.to_key()
+    return step_key
+
+
+def get_step_durations_from_stats(
+    step_stats: Sequence[RunStepKeyStatsSnapshot],
+) -> Mapping[str, float]:
+    """Extract the durations of successful steps from the step stats of a previous run, for use
+    as weights in critical_path_sort_key_fn. Durations of mapped steps are averaged over each
+    mapping key.
+    """
+    durations: Dict[str, List[float]] = {}
+    for stats in step_stats:
+        if (
+            stats.status != StepEventStatus.SUCCESS
+            or stats.start_time is None
+            or stats.end_time is None
+        ):
+            continue
+        durations.setdefault(_critical_path_key(stats.step_key), []).append(
+            stats.end_time - stats.start_time
+        )
+
+    return {key: sum(values) / len(values) for key, values in durations.items()}
+
+
+def get_critical_path_lengths(
+    execution_plan: ExecutionPlan, step_weights: Optional[Mapping[str, float]] = None
+) -> Mapping[str, float]:
+    """For each step in the plan, compute the weight of the heaviest path from that step to the end
+    of the plan, including the step itself. Steps missing from step_weights are given
+    DEFAULT_STEP_WEIGHT.
+    """
+    step_weights = check.opt_mapping_param(step_weights, "step_weights", key_type=str)
+    step_deps = execution_plan.get_all_step_deps()
+
+    downstream: Dict[str, Set[str]] = {key: set() for key in step_deps}
+    for step_key, deps in step_deps.items():
+        for dep_key in deps:
+            downstream.setdefault(dep_key, set()).add(step_key)
+
+    path_lengths: Dict[str, float] = {}
+    for step_key_level in reversed(toposort(step_deps)):
+        for step_key in step_key_level:
+            longest_downstream = max(
+                (path_lengths[key] for key in downstream.get(step_key, set())), default=0.0
+            )
+            path_lengths[step_key] = (
+                step_weights.get(step_key, DEFAULT_STEP_WEIGHT) + longest_downstream
+            )
+
+    return path_lengths
+
+
+def critical_path_sort_key_fn(
+    execution_plan: ExecutionPlan, step_weights: Optional[Mapping[str, float]] = None
+) -> Callable[[ExecutionStep], float]:
+    """Build a sort key for ActiveExecution that dispatches steps on the heaviest remaining path
+    through the plan first, so that long chains of steps are not starved when the number of
+    concurrent steps is limited. Steps are still ordered by the dagster/priority tag first.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan being executed.
+        step_weights (Optional[Mapping[str, float]]): Expected durations of steps by step key,
+            for example from get_step_durations_from_stats. Defaults to giving each step the same
+            weight, which orders steps by their downstream depth.
+    """
+    path_lengths = get_critical_path_lengths(execution_plan, step_weights)
+    # any priority difference outweighs every critical path length
+    priority_scale = sum(path_lengths.values()) + 1
+
+    def _sort_key(step: ExecutionStep) -> float:
+        return _default_sort_key(step) * priority_scale - path_lengths.get(
+            _critical_path_key(step.key), 0.0
+        )
+
+    return _sort_key
+
+
 CONCURRENCY_CLAIM_BLOCKED_INTERVAL = 1
 
 
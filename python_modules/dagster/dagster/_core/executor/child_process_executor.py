@@ -1,18 +1,33 @@
 """Facilities for running arbitrary commands in child processes."""
 
 
+import multiprocessing.connection
 import os
 import queue
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import send_interrupt
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -92,6 +107,49 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
             )
 
 
+def _interrupt_on_event(term_event: Any, command_finished_event: threading.Event) -> None:
+    while not command_finished_event.is_set():
+        if term_event.wait(timeout=1.0):
+            if not command_finished_event.is_set():
+                send_interrupt()
+            return
+
+
+@contextmanager
+def _interrupt_on_event_while_executing(term_event: Any) -> Iterator[None]:
+    # Unlike start_termination_thread, the thread stops once the command finishes, so that a worker
+    # is never interrupted on behalf of a command that it has already executed
+    command_finished_event = threading.Event()
+    thread = threading.Thread(
+        target=_interrupt_on_event,
+        args=(term_event, command_finished_event),
+        name="kill-on-event",
+        daemon=True,
+    )
+    thread.start()
+    try:
+        yield
+    finally:
+        command_finished_event.set()
+
+
+def _execute_commands_in_worker_process(
+    command_queue: Queue, event_queue: Queue, term_event: Any, max_commands: Optional[int]
+) -> None:
+    """Executes ChildProcessCommands received over a queue one at a time, until it receives None or
+    has executed max_commands commands. Setting term_event interrupts the current command.
+    """
+    num_commands = 0
+    while max_commands is None or num_commands < max_commands:
+        command = command_queue.get()
+        if command is None:
+            return
+
+        with _interrupt_on_event_while_executing(term_event):
+            _execute_command_in_child_process(event_queue, command)
+        num_commands += 1
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -100,10 +158,10 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 
 
 def _poll_for_event(
-    process, event_queue
+    process, event_queue, block: bool = True
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
     try:
-        return event_queue.get(block=True, timeout=TICK)
+        return event_queue.get(block=block, timeout=TICK)
     except queue.Empty:
         if not process.is_alive():
             # There is a possibility that after the last queue.get the
@@ -118,8 +176,48 @@ def _poll_for_event(
     return None
 
 
+class ChildProcessEventWaiter:
+    """Lets a caller that interleaves several in-flight child process commands block until any of
+    them has an event to report or its process has died, instead of polling each of them in turn.
+
+    Commands executed with a waiter do not block when polling for events. Instead, their event
+    queue and process are registered with the waiter for as long as the command is executing.
+    """
+
+    def __init__(self):
+        self._wait_handles: Set[Any] = set()
+
+    @contextmanager
+    def watch(self, process, event_queue: Queue) -> Iterator[None]:
+        # the reader end of the queue's pipe becomes ready as soon as the child puts an event on
+        # the queue, and the process sentinel becomes ready when the child exits
+        wait_handles = {event_queue._reader, process.sentinel}  # type: ignore  # (private)
+        self._wait_handles |= wait_handles
+        try:
+            yield
+        finally:
+            self._wait_handles -= wait_handles
+
+    def wait(self, timeout: float) -> None:
+        """Block until a watched command has an event to report or its process has died, or until
+        the timeout elapses.
+        """
+        if self._wait_handles:
+            multiprocessing.connection.wait(list(self._wait_handles), timeout)
+        elif timeout > 0:
+            time.sleep(timeout)
+
+
+def _watch_for_events(
+    event_waiter: Optional[ChildProcessEventWaiter], process, event_queue: Queue
+) -> ContextManager[None]:
+    return event_waiter.watch(process, event_queue) if event_waiter else nullcontext()
+
+
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    event_waiter: Optional[ChildProcessEventWaiter] = None,
 ) -> Iterator[Optional["DagsterEvent"]]:
     """Execute a ChildProcessCommand in a new process.
 
@@ -143,6 +241,8 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        event_waiter (Optional[ChildProcessEventWaiter]): If set, polling for events does not
+            block, and the caller waits for events from all of its commands with the waiter.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
@@ -158,16 +258,17 @@ def execute_child_process_command(
 
         completed_properly = False
 
-        while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+        with _watch_for_events(event_waiter, process, event_queue):
+            while not completed_properly:
+                event = _poll_for_event(process, event_queue, block=event_waiter is None)
 
-            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-                break
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
 
-            yield event
+                yield event
 
-            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
-                completed_properly = True
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
 
         if not completed_properly:
             # TODO Figure out what to do about stderr/stdout
@@ -176,3 +277,145 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands one at a time. Created and
+    reused by a ChildProcessWorkerPool.
+    """
+
+    def __init__(
+        self, multiprocessing_ctx: MultiprocessingBaseContext, max_commands: Optional[int]
+    ):
+        self._command_queue = multiprocessing_ctx.Queue()
+        self._event_queue = multiprocessing_ctx.Queue()
+        # multiprocessing events can only be shared with a process when it is started, so each
+        # worker has a single event that is used to interrupt whichever command it is executing
+        self.term_event = multiprocessing_ctx.Event()
+        self._max_commands = max_commands
+        self._num_commands = 0
+        self._process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(self._command_queue, self._event_queue, self.term_event, max_commands),
+        )
+        self._process.start()
+
+    @property
+    def is_retired(self) -> bool:
+        return self._max_commands is not None and self._num_commands >= self._max_commands
+
+    def execute_command(
+        self,
+        command: ChildProcessCommand,
+        event_waiter: Optional[ChildProcessEventWaiter] = None,
+    ) -> Iterator[Optional["DagsterEvent"]]:
+        """Execute a ChildProcessCommand in this worker.
+
+        Yields the same objects as execute_child_process_command, and likewise raises a
+        ChildProcessCrashException if the worker dies before the command completes.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        self._num_commands += 1
+        self._command_queue.put(command)
+
+        completed_properly = False
+        with _watch_for_events(event_waiter, self._process, self._event_queue):
+            while not completed_properly:
+                event = _poll_for_event(
+                    self._process, self._event_queue, block=event_waiter is None
+                )
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
+
+        if not completed_properly:
+            raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def close(self, timeout: float) -> None:
+        if self._process.is_alive() and not self.is_retired:
+            self._command_queue.put(None)
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._command_queue.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of long-lived child processes, each of which executes ChildProcessCommands one at a
+    time.
+
+    Starting a new process for every command means paying for interpreter startup and for importing
+    user code over and over again, which can dominate the run time of many small commands. Workers
+    are started as they are needed and reused between commands. If max_commands_per_worker is set,
+    each worker exits after executing that many commands and is replaced by a new one.
+
+    The pool itself is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands_per_worker: Optional[int] = None,
+        shutdown_timeout: float = 15.0,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        check.invariant(
+            self._max_commands_per_worker is None or self._max_commands_per_worker > 0,
+            "max_commands_per_worker must be > 0",
+        )
+        self._shutdown_timeout = shutdown_timeout
+        self._workers: Set[ChildProcessWorker] = set()
+        self._idle_workers: List[ChildProcessWorker] = []
+
+    def acquire_worker(self) -> ChildProcessWorker:
+        """Returns an idle worker, starting a new one if there are none. The worker must be handed
+        back with release_worker once it has finished executing a command.
+        """
+        if self._idle_workers:
+            worker = self._idle_workers.pop()
+        else:
+            worker = ChildProcessWorker(self._multiprocessing_ctx, self._max_commands_per_worker)
+            self._workers.add(worker)
+
+        # clear any interrupt that was meant for the worker's previous command
+        worker.term_event.clear()
+        return worker
+
+    def release_worker(self, worker: ChildProcessWorker) -> None:
+        check.invariant(worker in self._workers, "Worker does not belong to this pool")
+
+        if worker.is_retired or not worker.is_alive:
+            # retired workers exit on their own once they have executed their last command
+            self._workers.discard(worker)
+            worker.close(self._shutdown_timeout)
+        else:
+            self._idle_workers.append(worker)
+
+    def close(self) -> None:
+        """Stops every worker in the pool, terminating any that do not exit in time."""
+        workers = list(self._workers)
+        self._workers.clear()
+        self._idle_workers.clear()
+        for worker in workers:
+            worker.close(self._shutdown_timeout)
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
@@ -3,7 +3,7 @@
 import sys
 from contextlib import ExitStack
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
 
 from dagster import (
     _check as check,
@@ -20,7 +20,11 @@
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster._core.execution.context.system import IStepContext, PlanOrchestrationContext
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
-from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.active import (
+    ActiveExecution,
+    critical_path_sort_key_fn,
+    get_step_durations_from_stats,
+)
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
@@ -29,6 +33,7 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
 from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
 from dagster._utils import get_run_crash_explanation, start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import TimerResult, format_duration, time_execution_scope
@@ -37,7 +42,10 @@
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessEventWaiter,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -47,6 +55,10 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+# The longest the executor waits for a child process to report an event before checking for
+# interrupts again
+MAX_WAIT_FOR_EVENTS_SECONDS = 0.1
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -55,7 +67,7 @@ def __init__(
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -74,7 +86,9 @@ def __init__(
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
+            # worker processes that are reused across steps handle termination themselves
+            if self.term_event is not None:
+                start_termination_thread(self.term_event)
             execution_plan = create_execution_plan(
                 job=recon_job,
                 run_config=self.run_config,
@@ -95,14 +109,15 @@ def execute(self) -> Iterator[DagsterEvent]:
                 step_key=self.step_key,
             )
 
-            yield from execute_plan_iterator(
-                execution_plan,
-                recon_job,
-                self.dagster_run,
-                run_config=self.run_config,
-                retry_mode=self.retry_mode.for_inner_plan(),
-                instance=instance,
-            )
+            with instance.buffered_event_log_writes():
+                yield from execute_plan_iterator(
+                    execution_plan,
+                    recon_job,
+                    self.dagster_run,
+                    run_config=self.run_config,
+                    retry_mode=self.retry_mode.for_inner_plan(),
+                    instance=instance,
+                )
 
 
 class MultiprocessExecutor(Executor):
@@ -113,6 +128,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        reuse_processes: bool = False,
+        max_steps_per_process: Optional[int] = None,
+        prioritize_critical_path: bool = False,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -138,6 +156,15 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._reuse_processes = check.bool_param(reuse_processes, "reuse_processes")
+        self._max_steps_per_process = check.opt_int_param(
+            max_steps_per_process, "max_steps_per_process"
+        )
+        if self._max_steps_per_process is not None:
+            check.invariant(self._max_steps_per_process > 0, "max_steps_per_process must be > 0")
+        self._prioritize_critical_path = check.bool_param(
+            prioritize_critical_path, "prioritize_critical_path"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -189,6 +216,15 @@ def execute(
         timer_result: Optional[TimerResult] = None
         with ExitStack() as stack:
             timer_result = stack.enter_context(time_execution_scope())
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx, max_commands_per_worker=self._max_steps_per_process
+                    )
+                )
+                if self._reuse_processes
+                else None
+            )
             instance_concurrency_context = stack.enter_context(
                 InstanceConcurrencyContext(plan_context.instance, plan_context.run_id)
             )
@@ -196,6 +232,11 @@ def execute(
                 ActiveExecution(
                     execution_plan,
                     retry_mode=self.retries,
+                    sort_key_fn=(
+                        _get_critical_path_sort_key_fn(plan_context, execution_plan)
+                        if self._prioritize_critical_path
+                        else None
+                    ),
                     max_concurrent=limit,
                     tag_concurrency_limits=tag_concurrency_limits,
                     instance_concurrency_context=instance_concurrency_context,
@@ -204,6 +245,8 @@ def execute(
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             term_events: Dict[str, Any] = {}
+            workers: Dict[str, ChildProcessWorker] = {}
+            event_waiter = ChildProcessEventWaiter()
             stopping: bool = False
 
             while (not stopping and not active_execution.is_complete) or active_iters:
@@ -219,6 +262,8 @@ def execute(
                     for key, event in term_events.items():
                         event.set()
 
+                made_progress = False
+
                 while not stopping:
                     steps = active_execution.get_steps_to_execute(
                         limit=(limit - len(active_iters)),
@@ -227,9 +272,15 @@ def execute(
                     if not steps:
                         break
 
+                    made_progress = True
+
                     for step in steps:
                         step_context = plan_context.for_step(step)
-                        term_events[step.key] = multiproc_ctx.Event()
+                        if worker_pool:
+                            workers[step.key] = worker_pool.acquire_worker()
+                            term_events[step.key] = workers[step.key].term_event
+                        else:
+                            term_events[step.key] = multiproc_ctx.Event()
                         active_iters[step.key] = execute_step_out_of_process(
                             multiproc_ctx,
                             job,
@@ -240,6 +291,8 @@ def execute(
                             self.retries,
                             active_execution.get_known_state(),
                             execution_plan.repository_load_data,
+                            worker=workers.get(step.key),
+                            event_waiter=event_waiter,
                         )
 
                 # process active iterators
@@ -250,6 +303,7 @@ def execute(
                         if event_or_none is None:
                             continue
                         else:
+                            made_progress = True
                             yield event_or_none
                             active_execution.handle_event(event_or_none)
 
@@ -279,13 +333,25 @@ def execute(
                         empty_iters.append(key)
 
                 # clear and mark complete finished iterators
+                if empty_iters:
+                    made_progress = True
                 for key in empty_iters:
                     del active_iters[key]
                     del term_events[key]
+                    if key in workers:
+                        check.not_none(worker_pool).release_worker(workers.pop(key))
                     active_execution.verify_complete(plan_context, key)
 
                 # process skipped and abandoned steps
-                yield from active_execution.plan_events_iterator(plan_context)
+                for plan_event in active_execution.plan_events_iterator(plan_context):
+                    made_progress = True
+                    yield plan_event
+
+                # rather than polling each child process in turn, block until any of them reports
+                # an event or dies, or until a step is due to be retried or to claim a
+                # concurrency slot
+                if not made_progress and (active_iters or not active_execution.is_complete):
+                    event_waiter.wait(_get_wait_for_events_timeout(active_execution))
 
             errs = {pid: err for pid, err in errors.items() if err}
 
@@ -327,6 +393,31 @@ def execute(
             )
 
 
+def _get_wait_for_events_timeout(active_execution: ActiveExecution) -> float:
+    sleep_interval = active_execution.sleep_interval()
+    if sleep_interval == 0:
+        # no retries or concurrency claims are pending
+        return MAX_WAIT_FOR_EVENTS_SECONDS
+    return max(min(sleep_interval, MAX_WAIT_FOR_EVENTS_SECONDS), 0)
+
+
+def _get_critical_path_sort_key_fn(
+    plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
+) -> Callable[[ExecutionStep], float]:
+    # weight steps by how long they took in the most recent successful run of the job
+    instance = plan_context.instance
+    previous_runs = instance.get_runs(
+        RunsFilter(job_name=plan_context.dagster_run.job_name, statuses=[DagsterRunStatus.SUCCESS]),
+        limit=1,
+    )
+    step_weights = (
+        get_step_durations_from_stats(instance.get_run_step_stats(previous_runs[0].run_id))
+        if previous_runs
+        else None
+    )
+    return critical_path_sort_key_fn(execution_plan, step_weights)
+
+
 def execute_step_out_of_process(
     multiproc_ctx: MultiprocessingBaseContext,
     recon_job: ReconstructableJob,
@@ -337,26 +428,37 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    worker: Optional[ChildProcessWorker] = None,
+    event_waiter: Optional[ChildProcessEventWaiter] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        term_event=None if worker else term_events[step.key],
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
     )
 
-    yield DagsterEvent.step_worker_starting(
-        step_context,
-        f'Launching subprocess for "{step.key}".',
-        metadata={},
-    )
+    if worker:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Sending "{step.key}" to a worker subprocess.',
+            metadata={},
+        )
+        child_process_iter = worker.execute_command(command, event_waiter)
+    else:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Launching subprocess for "{step.key}".',
+            metadata={},
+        )
+        child_process_iter = execute_child_process_command(multiproc_ctx, command, event_waiter)
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in child_process_iter:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
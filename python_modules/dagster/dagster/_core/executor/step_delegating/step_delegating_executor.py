@@ -1,13 +1,16 @@
 import os
 import sys
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, cast
 
 import pendulum
 
 import dagster._check as check
 from dagster._core.definitions.metadata import MetadataValue
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.active import ActiveExecution
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
@@ -15,6 +18,7 @@
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
+from dagster._core.instance import DagsterInstance
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._utils.error import serializable_error_info_from_exc_info
 
@@ -27,6 +31,10 @@
     os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0")
 )
 
+# If set, the executor watches the event log for new events and checks on its steps as soon as one
+# arrives, rather than waiting out the full sleep interval
+DEFAULT_WAKE_ON_NEW_EVENTS = bool(os.getenv("DAGSTER_STEP_DELEGATING_EXECUTOR_WAKE_ON_NEW_EVENTS"))
+
 
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
@@ -44,6 +52,7 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        wake_on_new_events: Optional[bool] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -67,18 +76,67 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._wake_on_new_events = check.opt_bool_param(
+            wake_on_new_events, "wake_on_new_events", default=DEFAULT_WAKE_ON_NEW_EVENTS
+        )
+        self._event_cursor: Optional[str] = None
+        self._new_events_available: Optional[threading.Event] = None
 
     @property
     def retries(self):
         return self._retries
 
-    def _pop_events(self, instance, run_id) -> Sequence[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
+    def _pop_events(self, instance: DagsterInstance, run_id: str) -> Sequence[DagsterEvent]:
+        # the cursor is a storage id, so each poll only reads the events that are new since the
+        # last one, instead of scanning past every earlier event in the run
+        connection = instance.get_records_for_run(
+            run_id, self._event_cursor, of_type=set(DagsterEventType)
+        )
+        self._event_cursor = connection.cursor
+        dagster_events = [record.event_log_entry.dagster_event for record in connection.records]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
+    @contextmanager
+    def _watch_for_new_events(self, instance: DagsterInstance, run_id: str) -> Iterator[None]:
+        if not self._wake_on_new_events:
+            yield
+            return
+
+        new_events_available = threading.Event()
+
+        def _on_new_event(_event: EventLogEntry, _cursor: str) -> None:
+            new_events_available.set()
+
+        try:
+            instance.watch_event_logs(run_id, self._event_cursor, _on_new_event)
+        except NotImplementedError:
+            # fall back to polling on storages that can't be watched
+            yield
+            return
+
+        self._new_events_available = new_events_available
+        try:
+            yield
+        finally:
+            self._new_events_available = None
+            instance.end_watch_event_logs(run_id, _on_new_event)
+
+    def _wait_for_new_events(self, active_execution: ActiveExecution) -> None:
+        # don't sleep past the time that a step is due to be retried or to claim a concurrency slot
+        sleep_seconds = self._sleep_seconds
+        sleep_interval = active_execution.sleep_interval()
+        if sleep_interval != 0:
+            sleep_seconds = max(min(sleep_seconds, sleep_interval), 0)
+
+        if self._new_events_available is None:
+            time.sleep(sleep_seconds)
+            return
+
+        # keep polling at the sleep interval, in case a notification is missed
+        self._new_events_available.wait(sleep_seconds)
+        self._new_events_available.clear()
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -102,7 +160,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        self._event_cursor = -1
+        self._event_cursor = None
 
         DagsterEvent.engine_event(
             plan_context,
@@ -111,7 +169,9 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         )
         with InstanceConcurrencyContext(
             plan_context.instance, plan_context.run_id
-        ) as instance_concurrency_context:
+        ) as instance_concurrency_context, self._watch_for_new_events(
+            plan_context.instance, plan_context.run_id
+        ):
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -313,4 +373,4 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             )
                         )
 
-                    time.sleep(self._sleep_seconds)
+                    self._wait_for_new_events(active_execution)
@@ -210,8 +210,12 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[int] = None,
     ) -> "SensorExecutionData":
-        pass
+        """Evaluates the given sensor. If a timeout is given, code locations that evaluate sensors
+        out of process stop waiting for the result after that many seconds. The evaluation itself
+        is not interrupted on the code server.
+        """
 
     @abstractmethod
     def get_external_notebook_data(self, notebook_path: str) -> bytes:
@@ -492,6 +496,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[int] = None,
     ) -> "SensorExecutionData":
         result = get_external_sensor_execution(
             self._get_repo_def(repository_handle.repository_name),
@@ -624,6 +629,7 @@ def __init__(
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                repository_snapshot_ids=list_repositories_response.repository_snapshot_ids,
             )
 
             self.external_repositories = {
@@ -839,8 +845,10 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[int] = None,
     ) -> "SensorExecutionData":
         from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
+        from dagster._grpc.client import DEFAULT_GRPC_TIMEOUT
 
         return sync_get_external_sensor_execution_data_grpc(
             self.client,
@@ -850,6 +858,7 @@ def get_external_sensor_execution_data(
             last_completion_time,
             last_run_key,
             cursor,
+            timeout=timeout if timeout is not None else DEFAULT_GRPC_TIMEOUT,
         )
 
     def get_external_partition_set_execution_param_data(
@@ -6,6 +6,7 @@
 import weakref
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from enum import Enum
 from tempfile import TemporaryDirectory
 from types import TracebackType
@@ -17,6 +18,7 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -77,6 +79,7 @@
 from .config import (
     DAGSTER_CONFIG_YAML_FILENAME,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS,
     get_default_tick_retention_settings,
     get_tick_retention_settings,
 )
@@ -127,6 +130,7 @@
     )
     from dagster._core.secrets import SecretsLoader
     from dagster._core.snap import ExecutionPlanSnapshot, JobSnapshot
+    from dagster._core.snap.dep_snapshot import DependencyStructureSnapshot
     from dagster._core.storage.compute_log_manager import ComputeLogManager
     from dagster._core.storage.daemon_cursor import DaemonCursorStorage
     from dagster._core.storage.event_log import EventLogStorage
@@ -136,6 +140,7 @@
         EventLogRecord,
         EventRecordsFilter,
     )
+    from dagster._core.storage.event_log.buffered_writer import BufferedEventLogWriter
     from dagster._core.storage.partition_status_cache import (
         AssetPartitionStatus,
         AssetStatusCacheValue,
@@ -429,6 +434,7 @@ def __init__(
         self._ref = check.opt_inst_param(ref, "ref", InstanceRef)
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self._event_log_writer: Optional["BufferedEventLogWriter"] = None
 
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         self._run_monitoring_enabled = run_monitoring_enabled
@@ -848,6 +854,12 @@ def code_server_reload_timeout(self) -> int:
     def wait_for_local_code_server_processes_on_shutdown(self) -> bool:
         return self.code_server_settings.get("wait_for_local_processes_on_shutdown", False)
 
+    @property
+    def code_server_max_concurrent_location_loads(self) -> int:
+        return self.code_server_settings.get(
+            "max_concurrent_location_loads", DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS
+        )
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         return self.run_monitoring_settings.get("max_resume_run_attempts", 0)
@@ -856,6 +868,10 @@ def run_monitoring_max_resume_run_attempts(self) -> int:
     def run_monitoring_poll_interval_seconds(self) -> int:
         return self.run_monitoring_settings.get("poll_interval_seconds", 120)
 
+    @property
+    def run_monitoring_num_health_check_workers(self) -> int:
+        return self.run_monitoring_settings.get("num_health_check_workers", 8)
+
     @property
     def cancellation_thread_poll_interval_seconds(self) -> int:
         return self.get_settings("run_monitoring").get(
@@ -870,6 +886,14 @@ def run_retries_enabled(self) -> bool:
     def run_retries_max_retries(self) -> int:
         return self.get_settings("run_retries").get("max_retries")
 
+    @property
+    def event_log_buffer_settings(self) -> Any:
+        return self.get_settings("event_log_buffer")
+
+    @property
+    def event_log_buffer_enabled(self) -> bool:
+        return self.event_log_buffer_settings.get("enabled", False)
+
     @property
     def auto_materialize_enabled(self) -> bool:
         return self.get_settings("auto_materialize").get("enabled", True)
@@ -995,6 +1019,12 @@ def get_run_record_by_id(self, run_id: str) -> Optional[RunRecord]:
     def get_job_snapshot(self, snapshot_id: str) -> "JobSnapshot":
         return self._run_storage.get_job_snapshot(snapshot_id)
 
+    @traced
+    def get_job_snapshot_dependency_structure(
+        self, snapshot_id: str
+    ) -> "DependencyStructureSnapshot":
+        return self._run_storage.get_job_snapshot_dependency_structure(snapshot_id)
+
     @traced
     def has_job_snapshot(self, snapshot_id: str) -> bool:
         return self._run_storage.has_job_snapshot(snapshot_id)
@@ -1224,10 +1254,10 @@ def _ensure_persisted_job_snapshot(
                     job_snapshot.lineage_snapshot.parent_snapshot_id == returned_job_snapshot_id
                 )
 
+        # storages skip snapshots that are already stored, so there is no need to check first
         job_snapshot_id = create_job_snapshot_id(job_snapshot)
-        if not self._run_storage.has_job_snapshot(job_snapshot_id):
-            returned_job_snapshot_id = self._run_storage.add_job_snapshot(job_snapshot)
-            check.invariant(job_snapshot_id == returned_job_snapshot_id)
+        returned_job_snapshot_id = self._run_storage.add_job_snapshot(job_snapshot)
+        check.invariant(job_snapshot_id == returned_job_snapshot_id)
 
         return job_snapshot_id
 
@@ -1260,12 +1290,10 @@ def _ensure_persisted_execution_plan_snapshot(
 
         execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
-        if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
-            returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
-                execution_plan_snapshot
-            )
-
-            check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
+        returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
+            execution_plan_snapshot
+        )
+        check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
 
         return execution_plan_snapshot_id
 
@@ -1904,12 +1932,12 @@ def get_status_by_partition(
         cached_value = get_and_update_asset_status_cache_value(self, asset_key, partitions_def)
 
         if isinstance(cached_value, AssetStatusCacheValue):
-            materialized_partitions = cached_value.deserialize_materialized_partition_subsets(
-                partitions_def
-            )
-            failed_partitions = cached_value.deserialize_failed_partition_subsets(partitions_def)
-            in_progress_partitions = cached_value.deserialize_in_progress_partition_subsets(
-                partitions_def
+            (
+                materialized_partitions,
+                failed_partitions,
+                in_progress_partitions,
+            ) = cached_value.deserialize_partition_subsets(
+                partitions_def, dynamic_partitions_store=self
             )
 
             status_by_partition = {}
@@ -1995,6 +2023,16 @@ def get_latest_storage_id_by_partition(
         """
         return self._event_storage.get_latest_storage_id_by_partition(asset_key, event_type)
 
+    @traced
+    def get_latest_storage_ids_by_partition(
+        self, asset_keys: Sequence[AssetKey], event_type: "DagsterEventType"
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id for each partition of each of the given asset keys.
+
+        Returns a mapping of asset key to a mapping of partition to storage id.
+        """
+        return self._event_storage.get_latest_storage_ids_by_partition(asset_keys, event_type)
+
     @public
     @traced
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
@@ -2102,7 +2140,10 @@ def store_event(self, event: "EventLogEntry") -> None:
     def handle_new_event(self, event: "EventLogEntry") -> None:
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        if self._event_log_writer:
+            self._event_log_writer.write(event)
+        else:
+            self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.get_dagster_event().is_job_event:
             self._run_storage.handle_run_event(run_id, event.get_dagster_event())
@@ -2110,6 +2151,37 @@ def handle_new_event(self, event: "EventLogEntry") -> None:
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    @contextmanager
+    def buffered_event_log_writes(self) -> Iterator[None]:
+        """Context manager that batches the event log writes made through this instance, if
+        enabled by the `event_log_buffer` instance setting. Run and step status events are written
+        through immediately, along with any events buffered before them.
+        """
+        from dagster._core.storage.event_log.buffered_writer import (
+            DEFAULT_FLUSH_INTERVAL_SECONDS,
+            DEFAULT_MAX_BUFFER_SIZE,
+            BufferedEventLogWriter,
+        )
+
+        if not self.event_log_buffer_enabled or self._event_log_writer:
+            yield
+            return
+
+        settings = self.event_log_buffer_settings
+        writer = BufferedEventLogWriter(
+            self._event_storage,
+            max_buffer_size=settings.get("max_buffer_size", DEFAULT_MAX_BUFFER_SIZE),
+            flush_interval_seconds=settings.get(
+                "flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+            ),
+        )
+        self._event_log_writer = writer
+        try:
+            yield
+        finally:
+            self._event_log_writer = None
+            writer.close()
+
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
 
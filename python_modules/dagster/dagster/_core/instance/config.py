@@ -167,6 +167,7 @@ def python_logs_config_schema() -> Field:
 
 
 DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT = 180
+DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS = 8
 
 
 def get_default_tick_retention_settings(
@@ -260,6 +261,26 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "max_concurrent_ticks_per_location": Field(
+                int,
+                is_required=False,
+                description=(
+                    "The maximum number of sensor ticks from a single code location that can be"
+                    " evaluated in parallel. Can be used to keep a code location with many sensors"
+                    " from using all of the threads. Only applies when use_threads is set."
+                ),
+            ),
+            "evaluation_timeout_seconds": Field(
+                int,
+                is_required=False,
+                description=(
+                    "How long the daemon waits for a sensor evaluation before it stops waiting"
+                    " and marks the tick as skipped. Only the daemon's gRPC request is"
+                    " cancelled: the code server keeps running the evaluation until it finishes,"
+                    " and its result is discarded. The sensor is evaluated again on its next"
+                    " tick."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -332,6 +353,7 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "poll_interval_seconds": Field(int, is_required=False),
                 "cancellation_thread_poll_interval_seconds": Field(int, is_required=False),
                 "free_slots_after_run_end_seconds": Field(int, is_required=False),
+                "num_health_check_workers": Field(int, is_required=False),
             },
         ),
         "run_retries": Field(
@@ -345,6 +367,15 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "local_startup_timeout": Field(int, is_required=False),
                 "reload_timeout": Field(int, is_required=False),
                 "wait_for_local_processes_on_shutdown": Field(bool, is_required=False),
+                "max_concurrent_location_loads": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "event_log_buffer": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_buffer_size": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
             },
             is_required=False,
         ),
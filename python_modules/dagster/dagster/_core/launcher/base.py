@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import NamedTuple, Optional
+from typing import Mapping, NamedTuple, Optional, Sequence
 
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.origin import JobPythonOrigin
@@ -96,6 +96,22 @@ def check_run_worker_health(self, run: DagsterRun) -> CheckRunHealthResult:
             "This run launcher does not support run monitoring. Please disable it on your instance."
         )
 
+    @property
+    def supports_bulk_check_run_worker_health(self) -> bool:
+        """Whether the run launcher supports bulk_check_run_worker_health."""
+        return False
+
+    def bulk_check_run_worker_health(
+        self, runs: Sequence[DagsterRun]
+    ) -> Mapping[str, CheckRunHealthResult]:
+        """Check the health of the run workers of many runs at once, for example with a single
+        query to the system that runs them, keyed by run ID. Runs that are missing from the result
+        are checked individually with check_run_worker_health.
+        """
+        raise NotImplementedError(
+            "This run launcher does not support checking the health of run workers in bulk."
+        )
+
     def get_run_worker_debug_info(self, run: DagsterRun) -> Optional[str]:
         return None
 
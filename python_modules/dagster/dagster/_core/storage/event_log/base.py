@@ -16,6 +16,7 @@
 import dagster._check as check
 from dagster._core.assets import AssetDetails
 from dagster._core.definitions.events import AssetKey
+from dagster._core.errors import DagsterEventLogBatchWriteError
 from dagster._core.event_api import EventHandlerFn, EventLogRecord, EventRecordsFilter
 from dagster._core.events import DagsterEventType
 from dagster._core.execution.stats import (
@@ -226,6 +227,26 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, in order. Storages that support multi-row writes should
+        override this method.
+
+        If the batch is only partially written, raises a `DagsterEventLogBatchWriteError` with the
+        number of leading events that were stored, so that callers retry only the rest.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for i, event in enumerate(events):
+            try:
+                self.store_event(event)
+            except Exception as e:
+                if i == 0:
+                    raise
+                raise DagsterEventLogBatchWriteError(
+                    f"Stored {i} of {len(events)} events before failing.", num_stored_events=i
+                ) from e
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -389,6 +410,18 @@ def get_latest_storage_id_by_partition(
     ) -> Mapping[str, int]:
         pass
 
+    def get_latest_storage_ids_by_partition(
+        self, asset_keys: Sequence[AssetKey], event_type: DagsterEventType
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id for each partition of each of the given asset keys.
+
+        Storages that can fetch these for many asset keys in a single query should override this.
+        """
+        return {
+            asset_key: self.get_latest_storage_id_by_partition(asset_key, event_type)
+            for asset_key in asset_keys
+        }
+
     @abstractmethod
     def get_latest_tags_by_partition(
         self,
@@ -0,0 +1,103 @@
+import logging
+import threading
+from typing import List
+
+import dagster._check as check
+from dagster._core.errors import DagsterEventLogBatchWriteError
+from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
+
+from .base import EventLogStorage
+
+DEFAULT_MAX_BUFFER_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Events that other processes synchronize on (e.g. an executor waiting for a step worker to
+# finish, or a run monitor checking the run status), which are always written through to storage,
+# along with everything buffered before them.
+SYNCHRONOUS_EVENT_TYPES = {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+}
+
+
+def is_synchronous_event(event: EventLogEntry) -> bool:
+    dagster_event = event.dagster_event
+    if not dagster_event:
+        return False
+    return dagster_event.is_job_event or dagster_event.event_type in SYNCHRONOUS_EVENT_TYPES
+
+
+class BufferedEventLogWriter:
+    """Buffers event log writes in memory and writes them to the event log storage in batches,
+    using `EventLogStorage.store_events`.
+
+    The buffer is flushed when it reaches `max_buffer_size` events, every `flush_interval_seconds`
+    from a background thread, whenever a synchronous event (a run or step status change) is
+    written, and on close. Events are always flushed in the order in which they were written.
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._max_buffer_size = check.int_param(max_buffer_size, "max_buffer_size")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+
+        self._lock = threading.RLock()
+        self._buffer: List[EventLogEntry] = []
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="event-log-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def write(self, event: EventLogEntry) -> None:
+        check.inst_param(event, "event", EventLogEntry)
+        with self._lock:
+            self._buffer.append(event)
+            if len(self._buffer) >= self._max_buffer_size or is_synchronous_event(event):
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        events = self._buffer
+        self._buffer = []
+        try:
+            self._event_log_storage.store_events(events)
+        except DagsterEventLogBatchWriteError as e:
+            # the leading events were stored, so only keep the rest buffered for the next flush
+            self._buffer = events[e.num_stored_events :] + self._buffer
+            raise
+        except Exception:
+            # none of the events were stored, so keep them buffered for the next flush
+            self._buffer = events + self._buffer
+            raise
+
+    def _flush_loop(self) -> None:
+        while not self._shutdown_event.wait(self._flush_interval_seconds):
+            try:
+                self.flush()
+            except Exception:
+                logging.exception("Exception while flushing buffered event log writes.")
+
+    def close(self) -> None:
+        self._shutdown_event.set()
+        self._flush_thread.join()
+        self.flush()
@@ -1,9 +1,11 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import AbstractSet, Callable, Dict, List, MutableMapping, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
@@ -22,29 +24,37 @@ class CallbackAfterCursor(NamedTuple):
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that multiplexes every watched run_id onto a single polling thread.
+
+    Each poll fetches the new events for all watched run_ids in one query (see
+    `SqlEventLogStorage.get_records_for_runs`), so the number of queries issued does not grow with
+    the number of watched runs. The poll period backs off from INIT_POLL_PERIOD to MAX_POLL_PERIOD
+    while no new events are found, and is reset when a run starts being watched or when `notify`
+    is called, e.g. by storages that receive push notifications for new events.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        ORDER: _dict_lock -> watched_run.callback_fn_list_lock
+        INVARIANTS: _dict_lock protects _run_id_to_watched_run_dict
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(self, event_log_storage: SqlEventLogStorage):
         self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
+            event_log_storage, "event_log_storage", SqlEventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
+        # INVARIANT: dict_lock protects _run_id_to_watched_run_dict
         self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._run_id_to_watched_run_dict: MutableMapping[str, SqlPollingWatchedRun] = {}
         self._disposed = False
 
+        self._wake_event = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+            _has_run_id = run_id in self._run_id_to_watched_run_dict
         return _has_run_id
 
     def watch_run(
@@ -54,22 +64,42 @@ def watch_run(
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
         with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+            if run_id not in self._run_id_to_watched_run_dict:
+                # events at or before the cursor of the first callback are never dispatched, so
+                # there is no need to fetch them
+                self._run_id_to_watched_run_dict[run_id] = SqlPollingWatchedRun(
+                    run_id, EventLogCursor.parse(cursor).storage_id() if cursor else None
+                )
+            self._run_id_to_watched_run_dict[run_id].add_callback(cursor, callback)
+
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-event-watch", daemon=True
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._thread.start()
+
+        self._wake_event.set()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+            if run_id in self._run_id_to_watched_run_dict:
+                self._run_id_to_watched_run_dict[run_id].remove_callback(handler)
+                if not self._run_id_to_watched_run_dict[run_id].has_callbacks:
+                    del self._run_id_to_watched_run_dict[run_id]
+
+    def notify(self, run_ids: Optional[AbstractSet[str]] = None):
+        """Signal that new events may be available, waking the polling thread if any of the given
+        run_ids (or any run, if no run_ids are given) are being watched.
+        """
+        with self._dict_lock:
+            if run_ids is None:
+                should_wake = bool(self._run_id_to_watched_run_dict)
+            else:
+                should_wake = any(run_id in self._run_id_to_watched_run_dict for run_id in run_ids)
+        if should_wake:
+            self._wake_event.set()
 
     def __del__(self):
         self.close()
@@ -77,42 +107,90 @@ def __del__(self):
     def close(self):
         if not self._disposed:
             self._disposed = True
+            self._should_thread_exit.set()
+            self._wake_event.set()
+            if self._thread and self._thread is not threading.current_thread():
+                self._thread.join()
             with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+                self._run_id_to_watched_run_dict = {}
+
+    def _run(self):
+        """Polling function to update Observers with EventLogEntrys from Event Log DB.
+        Wakes every poll period, or when notified, &
+            1. executes a single SELECT query to get new EventLogEntrys for every watched run_id
+            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
+        Tracks the last storage id seen for each run_id, so that only new records are retrieved.
+        """
+        wait_time = INIT_POLL_PERIOD
+        while True:
+            was_notified = self._wake_event.wait(wait_time)
+            if self._should_thread_exit.is_set():
+                return
+            self._wake_event.clear()
+
+            try:
+                has_new_records = self._poll()
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
+                has_new_records = False
+
+            wait_time = (
+                INIT_POLL_PERIOD
+                if has_new_records or was_notified
+                else min(wait_time * 2, MAX_POLL_PERIOD)
+            )
+
+    def _poll(self) -> bool:
+        with self._dict_lock:
+            watched_runs = list(self._run_id_to_watched_run_dict.values())
+
+        if not watched_runs:
+            return False
+
+        records = self._event_log_storage.get_records_for_runs(
+            {watched_run.run_id: watched_run.storage_id for watched_run in watched_runs}
+        )
 
+        records_by_run_id: Dict[str, List[EventLogRecord]] = {}
+        for record in records:
+            records_by_run_id.setdefault(record.event_log_entry.run_id, []).append(record)
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+        for watched_run in watched_runs:
+            watched_run.process_records(records_by_run_id.get(watched_run.run_id, []))
+
+        return bool(records)
+
+
+class SqlPollingWatchedRun:
+    """The state of a single run_id watched by a SqlPollingEventWatcher.
 
     Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
         the callbacks have a cursor associated; this means that the callbacks should be
         only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
 
     LOCKING INFO:
         INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
-        )
+    def __init__(self, run_id: str, storage_id: Optional[int] = None):
         self._run_id = check.str_param(run_id, "run_id")
         self._callback_fn_list_lock: threading.Lock = threading.Lock()
         self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        self._storage_id = check.opt_int_param(storage_id, "storage_id")
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    @property
+    def storage_id(self) -> Optional[int]:
+        """The storage id of the last record fetched for this run, if any."""
+        return self._storage_id
 
     @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
+    def has_callbacks(self) -> bool:
+        with self._callback_fn_list_lock:
+            return bool(self._callback_fn_list)
 
     def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
         """Observer has started watching this run.
@@ -131,8 +209,6 @@ def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
         """Observer has stopped watching this run;
             Remove a callback from the list of callbacks to execute on new EventLogEntrys.
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
         Args:
             callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
         """
@@ -143,31 +219,21 @@ def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
                 for callback_with_cursor in self._callback_fn_list
                 if callback_with_cursor.callback != callback
             ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
 
-    def run(self):
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+    def process_records(self, records: List[EventLogRecord]):
+        """Fires each callback on the given records, which must be the records for this run after
+        `storage_id`, in storage id order.
         """
-        cursor = None
-        wait_time = INIT_POLL_PERIOD
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+        for event_record in records:
+            self._storage_id = event_record.storage_id
+            with self._callback_fn_list_lock:
+                for callback_with_cursor in self._callback_fn_list:
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < event_record.storage_id
+                    ):
+                        callback_with_cursor.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
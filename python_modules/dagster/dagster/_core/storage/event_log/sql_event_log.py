@@ -2,6 +2,7 @@
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from datetime import datetime
+from itertools import groupby
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -34,6 +35,7 @@
 )
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
 from dagster._core.errors import (
+    DagsterEventLogBatchWriteError,
     DagsterEventLogInvalidForRun,
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
@@ -141,21 +143,33 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(**self._get_event_insert_values(event))
+
+    def _is_indexed_event(self, event: EventLogEntry) -> bool:
+        """Whether the event is written to a secondary table, and so requires its storage id."""
+        if not event.dagster_event:
+            return False
+        if event.dagster_event_type in ASSET_EVENTS and event.dagster_event.asset_key:
+            return True
+        return event.dagster_event_type in ASSET_CHECK_EVENTS
+
+    def _get_event_insert_values(self, event: EventLogEntry) -> Dict[str, Any]:
         dagster_event_type = None
         asset_key_str = None
         partition = None
         step_key = event.step_key
-        if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
-            step_key = event.dagster_event.step_key
-            if event.dagster_event.asset_key:
-                check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-                asset_key_str = event.dagster_event.asset_key.to_string()
-            if event.dagster_event.partition:
-                partition = event.dagster_event.partition
-
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+        dagster_event = event.dagster_event
+        if dagster_event:
+            dagster_event_type = dagster_event.event_type_value
+            step_key = dagster_event.step_key
+            if dagster_event.asset_key:
+                check.inst_param(dagster_event.asset_key, "asset_key", AssetKey)
+                asset_key_str = dagster_event.asset_key.to_string()
+            if dagster_event.partition:
+                partition = dagster_event.partition
+
+        return dict(
             run_id=event.run_id,
             event=serialize_value(event),
             dagster_event_type=dagster_event_type,
@@ -342,43 +356,50 @@ def add_asset_event_tags(
                     ],
                 )
 
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        if not (event.dagster_event and event.dagster_event.asset_key):
+            return []
+
+        if event.dagster_event.is_step_materialization:
+            tags = event.dagster_event.step_materialization_data.materialization.tags
+        elif event.dagster_event.is_asset_observation:
+            tags = event.dagster_event.asset_observation_data.asset_observation.tags
+        else:
+            tags = None
+
+        if not tags:
+            return []
+
+        check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info
+                # set in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
+
     def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         check.int_param(event_id, "event_id")
 
-        if event.dagster_event and event.dagster_event.asset_key:
-            if event.dagster_event.is_step_materialization:
-                tags = event.dagster_event.step_materialization_data.materialization.tags
-            elif event.dagster_event.is_asset_observation:
-                tags = event.dagster_event.asset_observation_data.asset_observation.tags
-            else:
-                tags = None
-
-            if not tags or not self.has_table(AssetEventTagsTable.name):
-                # If tags table does not exist, silently exit. This is to support OSS
-                # users who have not yet run the migration to create the table.
-                # On read, we will throw an error if the table does not exist.
-                return
-
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-            asset_key_str = event.dagster_event.asset_key.to_string()
+        tag_rows = self._get_asset_event_tag_rows(event, event_id)
+        if not tag_rows or not self.has_table(AssetEventTagsTable.name):
+            # If tags table does not exist, silently exit. This is to support OSS
+            # users who have not yet run the migration to create the table.
+            # On read, we will throw an error if the table does not exist.
+            return
 
-            with self.index_connection() as conn:
-                conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
-                )
+        with self.index_connection() as conn:
+            conn.execute(AssetEventTagsTable.insert(), tag_rows)
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
@@ -413,6 +434,112 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, preserving their order in the event log.
+
+        Consecutive events for the same run are written to the event log table using multi-row
+        inserts in a single transaction, and the secondary asset tables are updated once per batch.
+
+        If a write fails after the event log rows for some runs were committed, raises a
+        `DagsterEventLogBatchWriteError` with the number of leading events that were stored, so
+        that they are not written again when the rest of the batch is retried.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        num_stored_events = 0
+        for run_id, run_events_iter in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events_iter)
+            try:
+                with self._run_batch_connection(run_id) as conn:
+                    event_ids = self._insert_event_rows(conn, run_events)
+                num_stored_events += len(run_events)
+                self._store_event_batch_indices(run_events, event_ids)
+            except Exception as e:
+                if num_stored_events == 0:
+                    raise
+                raise DagsterEventLogBatchWriteError(
+                    f"Stored {num_stored_events} of {len(events)} events before failing.",
+                    num_stored_events=num_stored_events,
+                ) from e
+
+    def _run_batch_connection(self, run_id: str) -> ContextManager[Connection]:
+        """Connection used to write a batch of events for a run. The rows for the batch must be
+        committed together, so storages whose connections autocommit each statement should
+        override this to open a transaction.
+        """
+        return self.run_connection(run_id)
+
+    def _insert_event_rows(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts the given events into the event log table, in order. Events that are not indexed
+        into any secondary table are written using multi-row inserts. Events that require a storage
+        id (asset and asset check events) are inserted individually, flushing any pending rows
+        first so that storage ids remain monotonic in the order of the batch.
+        """
+        event_ids: List[Optional[int]] = [None] * len(events)
+        pending_rows: List[Dict[str, Any]] = []
+        for i, event in enumerate(events):
+            values = self._get_event_insert_values(event)
+            if not self._is_indexed_event(event):
+                pending_rows.append(values)
+                continue
+
+            if pending_rows:
+                conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+                pending_rows = []
+            result = conn.execute(SqlEventLogStorageTable.insert().values(**values))
+            event_ids[i] = result.inserted_primary_key[0]
+
+        if pending_rows:
+            conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+
+        return event_ids
+
+    def _store_event_batch_indices(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        asset_events: List[Tuple[EventLogEntry, int]] = []
+        for event, event_id in zip(events, event_ids):
+            if not self._is_indexed_event(event):
+                continue
+
+            if event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
+                continue
+
+            if event_id is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
+            asset_events.append((event, event_id))
+
+        if not asset_events:
+            return
+
+        # Each event type writes a fixed set of columns on the asset key row, so only the latest
+        # event of each type for a given asset key needs to be applied, in batch order, to reach
+        # the same final state as applying every event.
+        latest_by_key_and_type: Dict[Tuple[str, str], int] = {}
+        for i, (event, _) in enumerate(asset_events):
+            dagster_event = check.not_none(event.dagster_event)
+            asset_key_str = check.not_none(dagster_event.asset_key).to_string()
+            latest_by_key_and_type[(asset_key_str, dagster_event.event_type_value)] = i
+        for i in sorted(latest_by_key_and_type.values()):
+            self.store_asset_event(*asset_events[i])
+
+        tag_rows = [
+            row
+            for event, event_id in asset_events
+            for row in self._get_asset_event_tag_rows(event, event_id)
+        ]
+        if tag_rows and self.has_table(AssetEventTagsTable.name):
+            with self.index_connection() as conn:
+                conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
     def get_records_for_run(
         self,
         run_id,
@@ -506,6 +633,53 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(
+        self, storage_id_by_run_id: Mapping[str, Optional[int]]
+    ) -> Sequence[EventLogRecord]:
+        """Get the new records for a set of runs in a single query, in storage id order. Used by
+        event watchers to fetch events for every watched run at once.
+
+        Args:
+            storage_id_by_run_id (Mapping[str, Optional[int]]): For each run, the storage id after
+                which records should be returned. If None, all records for the run are returned.
+        """
+        check.mapping_param(storage_id_by_run_id, "storage_id_by_run_id", key_type=str)
+        if not storage_id_by_run_id:
+            return []
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(
+                db.or_(
+                    *[
+                        (
+                            db.and_(
+                                SqlEventLogStorageTable.c.run_id == run_id,
+                                SqlEventLogStorageTable.c.id > storage_id,
+                            )
+                            if storage_id is not None
+                            else SqlEventLogStorageTable.c.run_id == run_id
+                        )
+                        for run_id, storage_id in storage_id_by_run_id.items()
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
+                continue
+            records.append(EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry))
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -1783,6 +1957,47 @@ def get_latest_storage_id_by_partition(
             latest_materialization_storage_id_by_partition[cast(str, row[0])] = cast(int, row[1])
         return latest_materialization_storage_id_by_partition
 
+    def get_latest_storage_ids_by_partition(
+        self, asset_keys: Sequence[AssetKey], event_type: DagsterEventType
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        check.sequence_param(asset_keys, "asset_keys", AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+
+        assets_details = self._get_assets_details(asset_keys)
+        query = self._add_assets_wipe_filter_to_query(query, assets_details, asset_keys)
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        latest_storage_ids_by_partition: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for row in rows:
+            asset_key = AssetKey.from_db_string(cast(Optional[str], row[0]))
+            if asset_key:
+                latest_storage_ids_by_partition[asset_key][cast(str, row[1])] = cast(int, row[2])
+        return latest_storage_ids_by_partition
+
     def get_latest_tags_by_partition(
         self,
         asset_key: AssetKey,
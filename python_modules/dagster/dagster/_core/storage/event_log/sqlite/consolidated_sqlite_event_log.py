@@ -2,7 +2,7 @@
 import os
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
@@ -151,27 +151,46 @@ def supports_global_concurrency_limits(self) -> bool:
 
     def on_modified(self):
         keys = [
-            (run_id, callback)
+            (run_id, callback, cursor)
             for run_id, callback_dict in self._watchers.items()
-            for callback, _ in callback_dict.items()
+            for callback, cursor in callback_dict.items()
         ]
-        for run_id, callback in keys:
-            cursor = self._watchers[run_id][callback]
+        if not keys:
+            return
+
+        # fetch the new events for every watched run in a single query, starting after the
+        # earliest cursor of any callback on the run
+        storage_id_by_run_id: Dict[str, Optional[int]] = {}
+        for run_id, _, cursor in keys:
+            storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
+            if run_id not in storage_id_by_run_id:
+                storage_id_by_run_id[run_id] = storage_id
+            elif storage_id is None or storage_id_by_run_id[run_id] is None:
+                storage_id_by_run_id[run_id] = None
+            else:
+                storage_id_by_run_id[run_id] = min(storage_id_by_run_id[run_id], storage_id)
+
+        records_by_run_id = defaultdict(list)
+        for record in self.get_records_for_runs(storage_id_by_run_id):
+            records_by_run_id[record.event_log_entry.run_id].append(record)
+
+        for run_id, callback, cursor in keys:
+            storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
+            for record in records_by_run_id[run_id]:
+                if storage_id is not None and record.storage_id <= storage_id:
+                    continue
+
+                # the watch may have ended in an earlier callback
+                if callback not in self._watchers.get(run_id, {}):
+                    break
+
+                # update cursor
+                record_cursor = str(EventLogCursor.from_storage_id(record.storage_id))
+                self._watchers[run_id][callback] = record_cursor
 
-            # fetch events
-            connection = self.get_records_for_run(run_id, cursor)
-
-            # update cursor
-            if connection.cursor:
-                self._watchers[run_id][callback] = connection.cursor
-
-            for record in connection.records:
                 status = None
                 try:
-                    status = callback(
-                        record.event_log_entry,
-                        str(EventLogCursor.from_storage_id(record.storage_id)),
-                    )
+                    status = callback(record.event_log_entry, record_cursor)
                 except Exception:
                     logging.exception("Exception in callback for event watch on run %s.", run_id)
 
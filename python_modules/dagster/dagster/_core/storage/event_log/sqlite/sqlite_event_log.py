@@ -8,7 +8,17 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterable, Iterator, Optional, Sequence
+from itertools import groupby
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -23,7 +33,7 @@
 from dagster._config import StringSource
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.events import AssetKey
-from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.errors import DagsterEventLogBatchWriteError, DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
 from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
@@ -263,6 +273,76 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, None)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its shard in a single transaction, and
+        replicate any asset events in the central index shard.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        num_stored_events = 0
+        for run_id, run_events_iter in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events_iter)
+            try:
+                with self.run_connection(run_id) as conn:
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),
+                        [self._get_event_insert_values(event) for event in run_events],
+                    )
+                num_stored_events += len(run_events)
+                self._store_run_event_batch_indices(run_events)
+            except Exception as e:
+                if num_stored_events == 0:
+                    raise
+                raise DagsterEventLogBatchWriteError(
+                    f"Stored {num_stored_events} of {len(events)} events before failing.",
+                    num_stored_events=num_stored_events,
+                ) from e
+
+    def _store_run_event_batch_indices(self, run_events: Sequence[EventLogEntry]) -> None:
+        asset_events = [
+            event
+            for event in run_events
+            if event.is_dagster_event and event.dagster_event.asset_key  # type: ignore
+        ]
+        for event in asset_events:
+            check.invariant(
+                event.dagster_event_type in ASSET_EVENTS,
+                "Can only store asset materializations, materialization_planned, and"
+                " observations in index database",
+            )
+
+        # mirror the asset events in the cross-run index database
+        event_ids: Sequence[Optional[int]] = []
+        if asset_events:
+            with self.index_connection() as conn:
+                event_ids = self._insert_event_rows(conn, asset_events)
+        self._store_event_batch_indices(asset_events, event_ids)
+
+        for event in run_events:
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, None)
+
+    def get_records_for_runs(
+        self, storage_id_by_run_id: Mapping[str, Optional[int]]
+    ) -> Sequence[EventLogRecord]:
+        """Overridden method to fetch the records from each run's shard, since run events are not
+        replicated in the index shard.
+        """
+        check.mapping_param(storage_id_by_run_id, "storage_id_by_run_id", key_type=str)
+
+        records = []
+        for run_id, storage_id in storage_id_by_run_id.items():
+            cursor = (
+                EventLogCursor.from_storage_id(storage_id).to_string()
+                if storage_id is not None
+                else None
+            )
+            records.extend(self.get_records_for_run(run_id, cursor=cursor).records)
+        return records
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -50,6 +50,7 @@
         TickData,
         TickStatus,
     )
+    from dagster._core.snap.dep_snapshot import DependencyStructureSnapshot
     from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
     from dagster._core.snap.job_snapshot import JobSnapshot
     from dagster._core.storage.dagster_run import (
@@ -269,6 +270,11 @@ def add_job_snapshot(
     def get_job_snapshot(self, job_snapshot_id: str) -> "JobSnapshot":
         return self._storage.run_storage.get_job_snapshot(job_snapshot_id)
 
+    def get_job_snapshot_dependency_structure(
+        self, job_snapshot_id: str
+    ) -> "DependencyStructureSnapshot":
+        return self._storage.run_storage.get_job_snapshot_dependency_structure(job_snapshot_id)
+
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         return self._storage.run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id)
 
@@ -403,6 +409,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_events(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -492,6 +501,13 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type
         )
 
+    def get_latest_storage_ids_by_partition(
+        self, asset_keys: Sequence["AssetKey"], event_type: "DagsterEventType"
+    ) -> Mapping["AssetKey", Mapping[str, int]]:
+        return self._storage.event_log_storage.get_latest_storage_ids_by_partition(
+            asset_keys, event_type
+        )
+
     def get_latest_tags_by_partition(
         self,
         asset_key: "AssetKey",
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, cast
 
 from dagster import (
     AssetKey,
@@ -15,12 +15,15 @@
     MultiPartitionsDefinition,
 )
 from dagster._core.definitions.partition import (
+    DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
 )
+from dagster._core.definitions.partition_key_index import PartitionKeyIndex
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._core.errors import DagsterDefinitionChangedDeserializationError
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
 from dagster._core.storage.tags import (
@@ -144,28 +147,138 @@ def from_db_string(db_string: str) -> Optional["AssetStatusCacheValue"]:
         return cached_data
 
     def deserialize_materialized_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
-        if not self.serialized_materialized_partition_subset:
-            return partitions_def.empty_subset()
-
-        return partitions_def.deserialize_subset(self.serialized_materialized_partition_subset)
+        return _deserialize_cached_partitions_subset(
+            partitions_def,
+            self.serialized_materialized_partition_subset,
+            _get_partition_key_index(partitions_def, dynamic_partitions_store),
+        )
 
     def deserialize_failed_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
-        if not self.serialized_failed_partition_subset:
-            return partitions_def.empty_subset()
-
-        return partitions_def.deserialize_subset(self.serialized_failed_partition_subset)
+        return _deserialize_cached_partitions_subset(
+            partitions_def,
+            self.serialized_failed_partition_subset,
+            _get_partition_key_index(partitions_def, dynamic_partitions_store),
+        )
 
     def deserialize_in_progress_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
-        if not self.serialized_in_progress_partition_subset:
-            return partitions_def.empty_subset()
+        return _deserialize_cached_partitions_subset(
+            partitions_def,
+            self.serialized_in_progress_partition_subset,
+            _get_partition_key_index(partitions_def, dynamic_partitions_store),
+        )
 
-        return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
+    def deserialize_partition_subsets(
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]:
+        """Returns the materialized, failed and in progress partition subsets. Prefer this to
+        deserializing each subset separately, since the partition keys of the definition are only
+        fetched once.
+
+        The subsets of a named DynamicPartitionsDefinition are cached as bitmaps over its partition
+        keys, so the dynamic_partitions_store is required to deserialize them.
+        """
+        key_index = _get_partition_key_index(partitions_def, dynamic_partitions_store)
+        return (
+            _deserialize_cached_partitions_subset(
+                partitions_def, self.serialized_materialized_partition_subset, key_index
+            ),
+            _deserialize_cached_partitions_subset(
+                partitions_def, self.serialized_failed_partition_subset, key_index
+            ),
+            _deserialize_cached_partitions_subset(
+                partitions_def, self.serialized_in_progress_partition_subset, key_index
+            ),
+        )
+
+
+def _get_partition_key_index(
+    partitions_def: PartitionsDefinition, dynamic_partitions_store: Optional[DynamicPartitionsStore]
+) -> Optional[PartitionKeyIndex]:
+    """The status subsets of static and dynamic partitions definitions are cached as bitmaps over
+    the partition keys of the definition. These stay small for definitions with many partitions,
+    and are updated with bitwise operations instead of by building sets of partition keys.
+    """
+    if isinstance(partitions_def, StaticPartitionsDefinition) or (
+        isinstance(partitions_def, DynamicPartitionsDefinition)
+        and partitions_def.name is not None
+        and dynamic_partitions_store is not None
+    ):
+        return PartitionKeyIndex(
+            partitions_def.get_partition_keys(dynamic_partitions_store=dynamic_partitions_store)
+        )
+    return None
+
+
+def _deserialize_partitions_subset(
+    partitions_def: PartitionsDefinition,
+    serialized: Optional[str],
+    key_index: Optional[PartitionKeyIndex],
+) -> PartitionsSubset:
+    if key_index is None:
+        return (
+            partitions_def.deserialize_subset(serialized)
+            if serialized
+            else partitions_def.empty_subset()
+        )
+    if not serialized:
+        return DefaultPartitionsSubset.from_bitmap(partitions_def, key_index, 0)
+    # values cached before subsets were cached as bitmaps are lists of partition keys
+    return DefaultPartitionsSubset.from_serialized(partitions_def, serialized, key_index)
+
+
+def _deserialize_cached_partitions_subset(
+    partitions_def: PartitionsDefinition,
+    serialized: Optional[str],
+    key_index: Optional[PartitionKeyIndex],
+) -> PartitionsSubset:
+    if not serialized:
+        return _deserialize_partitions_subset(partitions_def, None, key_index)
+    try:
+        return _deserialize_partitions_subset(partitions_def, serialized, key_index)
+    except DagsterDefinitionChangedDeserializationError:
+        # the partition keys changed since the value was cached, so the cached bitmap is stale.
+        # The value is rebuilt on its next update.
+        return partitions_def.empty_subset()
+
+
+def _serialize_partitions_subset(
+    subset: PartitionsSubset, key_index: Optional[PartitionKeyIndex]
+) -> str:
+    if key_index is None:
+        return subset.serialize()
+    return cast(DefaultPartitionsSubset, subset).serialize_bitmap(key_index)
+
+
+def _get_validated_partitions_subset(
+    partitions_def: PartitionsDefinition,
+    partition_keys: Set[str],
+    dynamic_partitions_store: DynamicPartitionsStore,
+    key_index: Optional[PartitionKeyIndex],
+) -> PartitionsSubset:
+    if key_index is not None:
+        # keys that are not in the index are not partitions of the definition, and are dropped
+        return DefaultPartitionsSubset.from_bitmap(
+            partitions_def, key_index, key_index.get_bitmap(partition_keys)
+        )
+    if not partition_keys:
+        return partitions_def.empty_subset()
+    return partitions_def.empty_subset().with_partition_keys(
+        get_validated_partition_keys(dynamic_partitions_store, partitions_def, partition_keys)
+    )
 
 
 def get_materialized_multipartitions(
@@ -245,18 +358,13 @@ def _build_status_cache(
             if count > 0
         ]
 
-    serialized_materialized_partition_subset = partitions_def.empty_subset()
-
-    serialized_materialized_partition_subset = (
-        serialized_materialized_partition_subset.with_partition_keys(
-            get_validated_partition_keys(
-                dynamic_partitions_store, partitions_def, set(materialized_keys)
-            )
-        )
+    key_index = _get_partition_key_index(partitions_def, dynamic_partitions_store)
+    materialized_subset = _get_validated_partitions_subset(
+        partitions_def, set(materialized_keys), dynamic_partitions_store, key_index
     )
 
     failed_subset, in_progress_subset, cursor = build_failed_and_in_progress_partition_subset(
-        instance, asset_key, partitions_def, dynamic_partitions_store
+        instance, asset_key, partitions_def, dynamic_partitions_store, key_index=key_index
     )
 
     return AssetStatusCacheValue(
@@ -264,9 +372,13 @@ def _build_status_cache(
         partitions_def_id=partitions_def.get_serializable_unique_identifier(
             dynamic_partitions_store=dynamic_partitions_store
         ),
-        serialized_materialized_partition_subset=serialized_materialized_partition_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        serialized_materialized_partition_subset=_serialize_partitions_subset(
+            materialized_subset, key_index
+        ),
+        serialized_failed_partition_subset=_serialize_partitions_subset(failed_subset, key_index),
+        serialized_in_progress_partition_subset=_serialize_partitions_subset(
+            in_progress_subset, key_index
+        ),
         earliest_in_progress_materialization_event_id=cursor,
     )
 
@@ -276,13 +388,17 @@ def build_failed_and_in_progress_partition_subset(
     asset_key: AssetKey,
     partitions_def: PartitionsDefinition,
     dynamic_partitions_store: DynamicPartitionsStore,
+    key_index: Optional[PartitionKeyIndex] = None,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
     incomplete_materializations = instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations(
         asset_key
     )
 
     if not incomplete_materializations:
-        return partitions_def.empty_subset(), partitions_def.empty_subset(), None
+        empty_subset = _get_validated_partitions_subset(
+            partitions_def, set(), dynamic_partitions_store, key_index
+        )
+        return empty_subset, empty_subset, None
 
     finished_runs = {
         r.run_id: r.status
@@ -309,21 +425,11 @@ def build_failed_and_in_progress_partition_subset(
                 cursor = event_id
 
     return (
-        (
-            partitions_def.empty_subset().with_partition_keys(
-                get_validated_partition_keys(
-                    dynamic_partitions_store, partitions_def, new_failed_partitions
-                )
-            )
-            if new_failed_partitions
-            else partitions_def.empty_subset()
+        _get_validated_partitions_subset(
+            partitions_def, new_failed_partitions, dynamic_partitions_store, key_index
         ),
-        (
-            partitions_def.empty_subset().with_partition_keys(
-                get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
-            )
-            if in_progress_partitions
-            else partitions_def.empty_subset()
+        _get_validated_partitions_subset(
+            partitions_def, in_progress_partitions, dynamic_partitions_store, key_index
         ),
         cursor,
     )
@@ -336,8 +442,9 @@ def _get_updated_failed_and_in_progress_partition_subset(
     current_cached_subset: PartitionsSubset,
     unevaluated_event_records: Sequence[EventLogRecord],
     dynamic_partitions_store: DynamicPartitionsStore,
+    key_index: Optional[PartitionKeyIndex] = None,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
-    current_failed_partitions = set(current_cached_subset.get_partition_keys())
+    materialized_partitions = set()
 
     cursor = None
     incomplete_materialization_records: Dict[str, EventLogRecord] = {}
@@ -353,7 +460,7 @@ def _get_updated_failed_and_in_progress_partition_subset(
             if event.partition:
                 incomplete_materialization_records.pop(event.partition, None)
                 # if we have a new materialization for a partition, that negates the old failure
-                current_failed_partitions.discard(event.partition)
+                materialized_partitions.add(event.partition)
 
     new_failed_partitions = set()
     in_progress_partitions = set()
@@ -380,14 +487,30 @@ def _get_updated_failed_and_in_progress_partition_subset(
                     # If the run is not finished, keep track of the event id so we can check on it next time
                     cursor = record.storage_id
 
-    return (
-        partitions_def.empty_subset().with_partition_keys(
+    if key_index is not None:
+        materialized_subset = _get_validated_partitions_subset(
+            partitions_def, materialized_partitions, dynamic_partitions_store, key_index
+        )
+        new_failed_subset = _get_validated_partitions_subset(
+            partitions_def, new_failed_partitions, dynamic_partitions_store, key_index
+        )
+        failed_subset = (
+            cast(DefaultPartitionsSubset, current_cached_subset) - materialized_subset
+        ) | new_failed_subset
+    else:
+        failed_subset = partitions_def.empty_subset().with_partition_keys(
             get_validated_partition_keys(
-                instance, partitions_def, new_failed_partitions | current_failed_partitions
+                dynamic_partitions_store,
+                partitions_def,
+                new_failed_partitions
+                | (set(current_cached_subset.get_partition_keys()) - materialized_partitions),
             )
-        ),
-        partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
+        )
+
+    return (
+        failed_subset,
+        _get_validated_partitions_subset(
+            partitions_def, in_progress_partitions, dynamic_partitions_store, key_index
         ),
         cursor,
     )
@@ -447,12 +570,9 @@ def _get_updated_status_cache(
             dynamic_partitions_store=dynamic_partitions_store
         )
     )
-    materialized_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(
-            stored_cache_value.serialized_materialized_partition_subset
-        )
-        if stored_cache_value and stored_cache_value.serialized_materialized_partition_subset
-        else partitions_def.empty_subset()
+    key_index = _get_partition_key_index(partitions_def, dynamic_partitions_store)
+    materialized_subset = _deserialize_partitions_subset(
+        partitions_def, stored_cache_value.serialized_materialized_partition_subset, key_index
     )
     newly_materialized_partitions = set()
 
@@ -466,16 +586,12 @@ def _get_updated_status_cache(
         elif not record.event_log_entry.dagster_event.is_asset_materialization_planned:
             check.failed("Expected materialization or materialization planned event")
 
-    materialized_subset = materialized_subset.with_partition_keys(
-        get_validated_partition_keys(
-            dynamic_partitions_store, partitions_def, newly_materialized_partitions
-        )
+    materialized_subset = materialized_subset | _get_validated_partitions_subset(
+        partitions_def, newly_materialized_partitions, dynamic_partitions_store, key_index
     )
 
-    failed_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(stored_cache_value.serialized_failed_partition_subset)
-        if stored_cache_value and stored_cache_value.serialized_failed_partition_subset
-        else partitions_def.empty_subset()
+    failed_subset = _deserialize_partitions_subset(
+        partitions_def, stored_cache_value.serialized_failed_partition_subset, key_index
     )
 
     (
@@ -489,14 +605,19 @@ def _get_updated_status_cache(
         failed_subset,
         unevaluated_event_records,
         dynamic_partitions_store=dynamic_partitions_store,
+        key_index=key_index,
     )
 
     return AssetStatusCacheValue(
         latest_storage_id=latest_storage_id,
         partitions_def_id=stored_cache_value.partitions_def_id,
-        serialized_materialized_partition_subset=materialized_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        serialized_materialized_partition_subset=_serialize_partitions_subset(
+            materialized_subset, key_index
+        ),
+        serialized_failed_partition_subset=_serialize_partitions_subset(failed_subset, key_index),
+        serialized_in_progress_partition_subset=_serialize_partitions_subset(
+            in_progress_subset, key_index
+        ),
         earliest_in_progress_materialization_event_id=new_cursor,
     )
 
@@ -538,14 +659,26 @@ def _get_fresh_asset_status_cache_value(
                 dynamic_partitions_store=dynamic_partitions_store,
             )
     else:
-        updated_cache_value = _get_updated_status_cache(
-            instance=instance,
-            asset_key=asset_key,
-            partitions_def=partitions_def,
-            stored_cache_value=stored_cache_value,
-            dynamic_partitions_store=dynamic_partitions_store,
-            latest_materialization_storage_id=latest_materialization_storage_id,
-        )
+        try:
+            updated_cache_value = _get_updated_status_cache(
+                instance=instance,
+                asset_key=asset_key,
+                partitions_def=partitions_def,
+                stored_cache_value=stored_cache_value,
+                dynamic_partitions_store=dynamic_partitions_store,
+                latest_materialization_storage_id=latest_materialization_storage_id,
+            )
+        except DagsterDefinitionChangedDeserializationError:
+            # a cached bitmap does not match the current partition keys, so rebuild the value
+            updated_cache_value = _build_status_cache(
+                instance=instance,
+                asset_key=asset_key,
+                partitions_def=partitions_def,
+                latest_storage_id=max(
+                    stored_cache_value.latest_storage_id, latest_materialization_storage_id or 0
+                ),
+                dynamic_partitions_store=dynamic_partitions_store,
+            )
 
     return updated_cache_value
 
@@ -7,6 +7,7 @@
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnapshot
+from dagster._core.snap.dep_snapshot import DependencyStructureSnapshot
 from dagster._core.storage.dagster_run import (
     DagsterRun,
     JobBucket,
@@ -239,7 +240,8 @@ def add_job_snapshot(self, job_snapshot: JobSnapshot, snapshot_id: Optional[str]
         Pipeline snapshots are content-addressable, meaning
         that the ID for a snapshot is a hash based on the
         body of the snapshot. This function returns
-        that snapshot ID.
+        that snapshot ID. If a snapshot with the same ID is already stored, it is not written
+        again.
 
         Args:
             job_snapshot (PipelineSnapshot)
@@ -263,6 +265,20 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnapshot:
             PipelineSnapshot
         """
 
+    def get_job_snapshot_dependency_structure(
+        self, job_snapshot_id: str
+    ) -> DependencyStructureSnapshot:
+        """Fetch the dependency structure of a snapshot by ID. Storages can override this to avoid
+        loading the rest of the snapshot, e.g. the config schema.
+
+        Args:
+            job_snapshot_id (str)
+
+        Returns:
+            DependencyStructureSnapshot
+        """
+        return self.get_job_snapshot(job_snapshot_id).dep_structure_snapshot
+
     @abstractmethod
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         """Check to see if storage contains an execution plan snapshot.
@@ -283,7 +299,8 @@ def add_execution_plan_snapshot(
         Execution plan snapshots are content-addressable, meaning
         that the ID for a snapshot is a hash based on the
         body of the snapshot. This function returns
-        that snapshot ID.
+        that snapshot ID. If a snapshot with the same ID is already stored, it is not written
+        again.
 
         Args:
             execution_plan_snapshot (ExecutionPlanSnapshot)
@@ -1,8 +1,9 @@
 import logging
+import threading
 import uuid
 import zlib
 from abc import abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from enum import Enum
 from typing import (
@@ -42,6 +43,7 @@
     create_execution_plan_snapshot_id,
     create_job_snapshot_id,
 )
+from dagster._core.snap.dep_snapshot import DependencyStructureSnapshot
 from dagster._core.storage.sql import SqlAlchemyQuery
 from dagster._core.storage.sqlalchemy_compat import (
     db_fetch_mappings,
@@ -59,10 +61,13 @@
 from dagster._serdes import (
     deserialize_value,
     serialize_value,
+    unpack_value,
 )
-from dagster._seven import JSONDecodeError
+from dagster._seven import JSONDecodeError, json
 from dagster._utils import PrintFn, utc_datetime_from_timestamp
+from dagster._utils.cached_method import cached_method
 from dagster._utils.merger import merge_dicts
+from dagster._utils.warnings import disable_dagster_warnings
 
 from ..dagster_run import (
     DagsterRun,
@@ -97,6 +102,40 @@ class SnapshotType(Enum):
     EXECUTION_PLAN = "EXECUTION_PLAN"
 
 
+# The number of deserialized snapshots to keep in memory per run storage. Snapshots are
+# content-addressed, so a cached snapshot never goes stale.
+SNAPSHOT_CACHE_SIZE = 64
+
+
+class SnapshotCache:
+    """Thread-safe LRU cache of deserialized snapshots, keyed by snapshot id."""
+
+    def __init__(self, max_size: int = SNAPSHOT_CACHE_SIZE):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._snapshots: "OrderedDict[str, Union[JobSnapshot, ExecutionPlanSnapshot]]" = (
+            OrderedDict()
+        )
+
+    def get(self, snapshot_id: str) -> Optional[Union[JobSnapshot, ExecutionPlanSnapshot]]:
+        with self._lock:
+            snapshot = self._snapshots.get(snapshot_id)
+            if snapshot is not None:
+                self._snapshots.move_to_end(snapshot_id)
+            return snapshot
+
+    def set(self, snapshot_id: str, snapshot: Union[JobSnapshot, ExecutionPlanSnapshot]) -> None:
+        with self._lock:
+            self._snapshots[snapshot_id] = snapshot
+            self._snapshots.move_to_end(snapshot_id)
+            while len(self._snapshots) > self._max_size:
+                self._snapshots.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+
 class SqlRunStorage(RunStorage):
     """Base class for SQL based run storages."""
 
@@ -539,6 +578,10 @@ def delete_run(self, run_id: str) -> None:
         with self.connect() as conn:
             conn.execute(query)
 
+    @cached_method
+    def _get_snapshot_cache(self) -> SnapshotCache:
+        return SnapshotCache()
+
     def has_job_snapshot(self, job_snapshot_id: str) -> bool:
         check.str_param(job_snapshot_id, "job_snapshot_id")
         return self._has_snapshot_id(job_snapshot_id)
@@ -550,7 +593,7 @@ def add_job_snapshot(self, job_snapshot: JobSnapshot, snapshot_id: Optional[str]
         if not snapshot_id:
             snapshot_id = create_job_snapshot_id(job_snapshot)
 
-        return self._add_snapshot(
+        return self._add_snapshot_if_missing(
             snapshot_id=snapshot_id,
             snapshot_obj=job_snapshot,
             snapshot_type=SnapshotType.PIPELINE,
@@ -560,9 +603,49 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnapshot:
         check.str_param(job_snapshot_id, "job_snapshot_id")
         return self._get_snapshot(job_snapshot_id)  # type: ignore  # (allowed to return None?)
 
+    def get_job_snapshot_dependency_structure(
+        self, job_snapshot_id: str
+    ) -> DependencyStructureSnapshot:
+        check.str_param(job_snapshot_id, "job_snapshot_id")
+
+        cached_snapshot = self._get_snapshot_cache().get(job_snapshot_id)
+        if isinstance(cached_snapshot, JobSnapshot):
+            return cached_snapshot.dep_structure_snapshot
+
+        query = db_select([SnapshotsTable.c.snapshot_body]).where(
+            SnapshotsTable.c.snapshot_id == job_snapshot_id
+        )
+        row = self.fetchone(query)
+        if not row:
+            return None  # type: ignore  # (allowed to return None?)
+
+        decoded_str = _defensively_decode_snapshot_body(logging, row["snapshot_body"])  # type: ignore
+        if decoded_str is None:
+            return None  # type: ignore  # (allowed to return None?)
+
+        # only unpack the dependency structure, leaving the rest of the snapshot (e.g. the config
+        # schema, which is usually most of it) as plain json
+        try:
+            packed_snapshot = json.loads(decoded_str)
+        except JSONDecodeError:
+            logging.warning("get-pipeline-snapshot: Could not parse json in snapshot table.")
+            return None  # type: ignore  # (allowed to return None?)
+
+        # job snapshots are stored under their legacy serdes name
+        if (
+            not isinstance(packed_snapshot, dict)
+            or packed_snapshot.get("__class__") != "PipelineSnapshot"
+        ):
+            return None  # type: ignore  # (allowed to return None?)
+
+        with disable_dagster_warnings():
+            return unpack_value(
+                packed_snapshot["dep_structure_snapshot"], DependencyStructureSnapshot
+            )
+
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
-        return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
+        return self._has_snapshot_id(execution_plan_snapshot_id)
 
     def add_execution_plan_snapshot(
         self, execution_plan_snapshot: ExecutionPlanSnapshot, snapshot_id: Optional[str] = None
@@ -573,7 +656,7 @@ def add_execution_plan_snapshot(
         if not snapshot_id:
             snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
-        return self._add_snapshot(
+        return self._add_snapshot_if_missing(
             snapshot_id=snapshot_id,
             snapshot_obj=execution_plan_snapshot,
             snapshot_type=SnapshotType.EXECUTION_PLAN,
@@ -583,6 +666,19 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)  # type: ignore  # (allowed to return None?)
 
+    def _add_snapshot_if_missing(
+        self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType
+    ) -> str:
+        # skip serializing and compressing snapshots that have already been stored. The table is
+        # checked rather than the snapshot cache, since the cache is not shared across processes
+        # and may hold snapshots that were wiped by another process
+        if self._has_snapshot_id(snapshot_id):
+            return snapshot_id
+
+        self._add_snapshot(snapshot_id, snapshot_obj, snapshot_type)
+        self._get_snapshot_cache().set(snapshot_id, snapshot_obj)
+        return snapshot_id
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
@@ -623,13 +719,23 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnapshot]:
+        snapshot_cache = self._get_snapshot_cache()
+        cached_snapshot = snapshot_cache.get(snapshot_id)
+        if cached_snapshot is not None:
+            return cached_snapshot  # type: ignore
+
         query = db_select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
 
-        return defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]]) if row else None  # type: ignore
+        snapshot = defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
+        if snapshot is not None:
+            snapshot_cache.set(snapshot_id, snapshot)
+        return snapshot  # type: ignore
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -805,6 +911,7 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+        self._get_snapshot_cache().clear()
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
@@ -857,7 +964,10 @@ def add_backfill(self, partition_backfill: PartitionBackfill) -> None:
     def update_backfill(self, partition_backfill: PartitionBackfill) -> None:
         check.inst_param(partition_backfill, "partition_backfill", PartitionBackfill)
         backfill_id = partition_backfill.backfill_id
-        if not self.get_backfill(backfill_id):
+        # check for the backfill without loading its body, which can be large for asset backfills
+        if not self.fetchone(
+            db_select([BulkActionsTable.c.key]).where(BulkActionsTable.c.key == backfill_id)
+        ):
             raise DagsterInvariantViolationError(
                 f"Backfill {backfill_id} is not present in storage"
             )
@@ -923,27 +1033,33 @@ def defensively_unpack_execution_plan_snapshot_query(
     # minimal checking here because sqlalchemy returns a different type based on what version of
     # SqlAlchemy you are using
 
+    decoded_str = _defensively_decode_snapshot_body(logger, row[0])
+    if decoded_str is None:
+        return None
+
+    try:
+        return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnapshot))
+    except JSONDecodeError:
+        logger.warning("get-pipeline-snapshot: Could not parse json in snapshot table.")
+        return None
+
+
+def _defensively_decode_snapshot_body(logger: logging.Logger, snapshot_body: Any) -> Optional[str]:
     def _warn(msg: str) -> None:
         logger.warning(f"get-pipeline-snapshot: {msg}")
 
-    if not isinstance(row[0], bytes):
+    if not isinstance(snapshot_body, bytes):
         _warn("First entry in row is not a binary type.")
         return None
 
     try:
-        uncompressed_bytes = zlib.decompress(row[0])
+        uncompressed_bytes = zlib.decompress(snapshot_body)
     except zlib.error:
         _warn("Could not decompress bytes stored in snapshot table.")
         return None
 
     try:
-        decoded_str = uncompressed_bytes.decode("utf-8")
+        return uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
         _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
         return None
-
-    try:
-        return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnapshot))
-    except JSONDecodeError:
-        _warn("Could not parse json in snapshot table.")
-        return None
@@ -4,6 +4,7 @@
 import time
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
 from itertools import count
 from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Set, TypeVar, Union
@@ -36,6 +37,7 @@
 )
 from dagster._core.host_representation.origin import (
     GrpcServerCodeLocationOrigin,
+    InProcessCodeLocationOrigin,
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.instance import DagsterInstance
@@ -454,11 +456,13 @@ def __init__(
         read_only: bool = False,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         code_server_log_level: str = "INFO",
+        load_in_background: bool = False,
     ):
         self._stack = ExitStack()
 
         check.opt_str_param(version, "version")
         check.bool_param(read_only, "read_only")
+        check.bool_param(load_in_background, "load_in_background")
 
         self._instance = check.inst_param(instance, "instance", DagsterInstance)
         self._workspace_load_target = check.opt_inst_param(
@@ -496,12 +500,25 @@ def __init__(
             )
 
         self._location_entry_dict: Dict[str, CodeLocationEntry] = {}
-        self._update_workspace(
-            {
-                origin.location_name: self._load_location(origin, reload=False)
-                for origin in self._origins
-            }
-        )
+
+        # Serializes loads of the whole workspace, so that a reload waits for a background load
+        # that is still in progress
+        self._load_lock = threading.Lock()
+        self._shutdown_event = threading.Event()
+
+        origins = self._origins
+        self._seed_loading_entries(origins)
+        if load_in_background:
+            self._load_thread: Optional[threading.Thread] = threading.Thread(
+                target=self._load_locations,
+                args=(origins, False),
+                name="workspace-load",
+            )
+            self._load_thread.daemon = True
+            self._load_thread.start()
+        else:
+            self._load_thread = None
+            self._load_locations(origins, reload=False)
 
     @property
     def workspace_load_target(self) -> Optional[WorkspaceLoadTarget]:
@@ -667,46 +684,135 @@ def shutdown_code_location(self, name: str) -> None:
             self._location_entry_dict[name].origin.shutdown_server()
 
     def refresh_workspace(self) -> None:
-        updated_locations = {
-            origin.location_name: self._load_location(origin, reload=False)
-            for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
+        self._load_locations(self._origins, reload=False)
 
     def reload_workspace(self) -> None:
-        updated_locations = {
-            origin.location_name: self._load_location(origin, reload=True)
-            for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
-
-    def _update_workspace(self, new_locations: Dict[str, CodeLocationEntry]):
-        # minimize lock time by only holding while swapping data old to new
-        with self._lock:
-            previous_events = self._watch_thread_shutdown_events
-            self._watch_thread_shutdown_events = {}
+        self._load_locations(self._origins, reload=True)
 
-            previous_threads = self._watch_threads
-            self._watch_threads = {}
+    def wait_for_workspace_to_load(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until a load that was started in the background has finished. Returns False if
+        the load is still in progress after `timeout` seconds.
+        """
+        if self._load_thread:
+            self._load_thread.join(timeout)
+            return not self._load_thread.is_alive()
+        return True
 
-            previous_locations = self._location_entry_dict
-            self._location_entry_dict = new_locations
+    def _seed_loading_entries(self, origins: Sequence[CodeLocationOrigin]) -> None:
+        # Show locations that are new to the workspace as loading until they finish
+        with self._lock:
+            for origin in origins:
+                if origin.location_name not in self._location_entry_dict:
+                    self._location_entry_dict[origin.location_name] = CodeLocationEntry(
+                        origin=origin,
+                        code_location=None,
+                        load_error=None,
+                        load_status=CodeLocationLoadStatus.LOADING,
+                        display_metadata=origin.get_display_metadata(),
+                        update_timestamp=time.time(),
+                    )
+
+    def _load_locations(self, origins: Sequence[CodeLocationOrigin], reload: bool) -> None:
+        """Load each origin and swap it into the workspace as soon as it finishes, so that the
+        locations that have loaded can be used while slower ones are still starting up.
+
+        Locations that are served over gRPC are loaded concurrently, bounded by the
+        `code_servers.max_concurrent_location_loads` instance setting. In-process locations import
+        user code into this process, so they are loaded one at a time.
+        """
+        with self._load_lock:
+            self._seed_loading_entries(origins)
+
+            location_names = {origin.location_name for origin in origins}
+            with self._lock:
+                removed_location_names = [
+                    name for name in self._location_entry_dict if name not in location_names
+                ]
+
+            for location_name in removed_location_names:
+                self._set_location_entry(location_name, None)
+
+            self._load_and_set_location_entries(origins, reload)
+
+    def _load_and_set_location_entries(
+        self, origins: Sequence[CodeLocationOrigin], reload: bool
+    ) -> None:
+        if not origins:
+            return
+
+        logger = logging.getLogger("dagster.workspace")
+        start_time = time.time()
+        num_loaded = 0
+
+        def _on_location_loaded(entry: Optional[CodeLocationEntry]) -> None:
+            nonlocal num_loaded
+            if entry is None:
+                return
+            if self._shutdown_event.is_set():
+                # the workspace was closed while this location was loading
+                if entry.code_location:
+                    entry.code_location.cleanup()
+                return
+
+            self._set_location_entry(entry.origin.location_name, entry)
+            num_loaded += 1
+            logger.info(
+                f"{'Failed to load' if entry.load_error else 'Loaded'} code location"
+                f" {entry.origin.location_name} ({num_loaded}/{len(origins)}) after"
+                f" {time.time() - start_time:.2f} seconds"
+            )
 
-            # start monitoring for new locations
-            for entry in self._location_entry_dict.values():
+        grpc_origins = [
+            origin for origin in origins if not isinstance(origin, InProcessCodeLocationOrigin)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=self._instance.code_server_max_concurrent_location_loads,
+            thread_name_prefix="workspace_location_loader",
+        ) as executor:
+            futures = [
+                executor.submit(self._load_location_unless_shutdown, origin, reload)
+                for origin in grpc_origins
+            ]
+
+            for origin in origins:
+                if isinstance(origin, InProcessCodeLocationOrigin):
+                    _on_location_loaded(self._load_location_unless_shutdown(origin, reload))
+
+            for future in as_completed(futures):
+                _on_location_loaded(future.result())
+
+    def _load_location_unless_shutdown(
+        self, origin: CodeLocationOrigin, reload: bool
+    ) -> Optional[CodeLocationEntry]:
+        if self._shutdown_event.is_set():
+            return None
+        return self._load_location(origin, reload)
+
+    def _set_location_entry(self, name: str, entry: Optional[CodeLocationEntry]) -> None:
+        # minimize lock time by only holding while swapping the old entry for the new one
+        with self._lock:
+            previous_event = self._watch_thread_shutdown_events.pop(name, None)
+            previous_thread = self._watch_threads.pop(name, None)
+            previous_entry = self._location_entry_dict.get(name)
+
+            if entry:
+                # assign in place so that locations keep their position in the workspace
+                self._location_entry_dict[name] = entry
+                # start monitoring the new location
                 if isinstance(entry.origin, GrpcServerCodeLocationOrigin):
                     self._start_watch_thread(entry.origin)
+            elif previous_entry:
+                del self._location_entry_dict[name]
 
-        # clean up previous locations
-        for event in previous_events.values():
-            event.set()
+        # clean up the previous location
+        if previous_event:
+            previous_event.set()
 
-        for watch_thread in previous_threads.values():
-            watch_thread.join()
+        if previous_thread:
+            previous_thread.join()
 
-        for entry in previous_locations.values():
-            if entry.code_location:
-                entry.code_location.cleanup()
+        if previous_entry and previous_entry.code_location:
+            previous_entry.code_location.cleanup()
 
     def create_request_context(self, source: Optional[object] = None) -> WorkspaceRequestContext:
         return WorkspaceRequestContext(
@@ -747,7 +853,16 @@ def __enter__(self):
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self._update_workspace({})  # update to empty to close all current locations
+        # stop any background load from adding locations, then close all current locations
+        self._shutdown_event.set()
+        if self._load_thread:
+            self._load_thread.join()
+
+        with self._lock:
+            location_names = list(self._location_entry_dict)
+        for location_name in location_names:
+            self._set_location_entry(location_name, None)
+
         self._stack.close()
 
     def copy_for_test_instance(self, instance: DagsterInstance) -> "WorkspaceProcessContext":
@@ -114,7 +114,7 @@ def run_iteration(
             else AssetDaemonCursor.empty()
         )
 
-        run_requests, new_cursor, evaluations = AssetDaemonContext(
+        asset_daemon_context = AssetDaemonContext(
             asset_graph=asset_graph,
             target_asset_keys=target_asset_keys,
             instance=instance,
@@ -127,15 +127,27 @@ def run_iteration(
             auto_observe=True,
             respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
             logger=self._logger,
-        ).evaluate()
+        )
+        run_requests, new_cursor, evaluations = asset_daemon_context.evaluate()
 
+        instance_queryer = asset_daemon_context.instance_queryer
         self._logger.info(
             f"Tick produced {len(run_requests)} run{'s' if len(run_requests) != 1 else ''} and"
             f" {len(evaluations)} asset evaluation{'s' if len(evaluations) != 1 else ''} for"
-            f" evaluation ID {new_cursor.evaluation_id}"
+            f" evaluation ID {new_cursor.evaluation_id}, issuing {instance_queryer.num_queries}"
+            f" quer{'ies' if instance_queryer.num_queries != 1 else 'y'} in"
+            f" {instance_queryer.query_duration:.2f} seconds"
         )
 
-        evaluations_by_asset_key = {evaluation.asset_key: evaluation for evaluation in evaluations}
+        query_stats_by_asset_key = asset_daemon_context.query_stats_by_asset_key
+        evaluations_by_asset_key = {}
+        for evaluation in evaluations:
+            num_queries, query_duration = query_stats_by_asset_key.get(
+                evaluation.asset_key, (None, None)
+            )
+            evaluations_by_asset_key[evaluation.asset_key] = evaluation._replace(
+                num_queries=num_queries, query_duration=query_duration
+            )
 
         for run_request in run_requests:
             yield
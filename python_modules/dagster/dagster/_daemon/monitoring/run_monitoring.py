@@ -1,7 +1,8 @@
 import logging
 import sys
 import time
-from typing import Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Mapping, Optional, Sequence
 
 import pendulum
 
@@ -10,9 +11,10 @@
     _check as check,
 )
 from dagster._core.events import DagsterEventType, EngineEventData
-from dagster._core.launcher import WorkerStatus
+from dagster._core.launcher import CheckRunHealthResult, WorkerStatus
 from dagster._core.storage.dagster_run import (
     IN_PROGRESS_RUN_STATUSES,
+    DagsterRun,
     DagsterRunStatus,
     RunRecord,
     RunsFilter,
@@ -104,16 +106,58 @@ def count_resume_run_attempts(instance: DagsterInstance, run_id: str) -> int:
     return len([event for event in events if event.message == RESUME_RUN_LOG_MESSAGE])
 
 
+def get_run_worker_health_results(
+    instance: DagsterInstance, runs: Sequence[DagsterRun], logger: logging.Logger
+) -> Mapping[str, CheckRunHealthResult]:
+    """Check the health of the run workers of many runs, keyed by run ID. Uses a single bulk check if
+    the run launcher supports it, and checks any remaining runs concurrently in a thread pool.
+    Runs whose health check fails are left out of the result.
+    """
+    run_launcher = instance.run_launcher
+    if not runs or not run_launcher.supports_check_run_worker_health:
+        return {}
+
+    results: Dict[str, CheckRunHealthResult] = {}
+    if run_launcher.supports_bulk_check_run_worker_health:
+        try:
+            results.update(run_launcher.bulk_check_run_worker_health(runs))
+        except Exception:
+            logger.exception(
+                "Failure checking the health of run workers in bulk, checking each run instead"
+            )
+
+    remaining_runs = [run for run in runs if run.run_id not in results]
+    if not remaining_runs:
+        return results
+
+    with ThreadPoolExecutor(
+        max_workers=instance.run_monitoring_num_health_check_workers,
+        thread_name_prefix="run_monitoring_health_check_worker",
+    ) as executor:
+        futures = {
+            run.run_id: executor.submit(run_launcher.check_run_worker_health, run)
+            for run in remaining_runs
+        }
+        for run_id, future in futures.items():
+            # failed checks are retried by monitor_started_run, which reports the error
+            if not future.exception():
+                results[run_id] = future.result()
+
+    return results
+
+
 def monitor_started_run(
     instance: DagsterInstance,
     workspace: IWorkspace,
     run_record: RunRecord,
     logger: logging.Logger,
+    check_health_result: Optional[CheckRunHealthResult] = None,
 ) -> None:
     run = run_record.dagster_run
     check.invariant(run.status == DagsterRunStatus.STARTED)
     if instance.run_launcher.supports_check_run_worker_health:
-        check_health_result = instance.run_launcher.check_run_worker_health(run)
+        if check_health_result is None:
+            check_health_result = instance.run_launcher.check_run_worker_health(run)
         if check_health_result.status not in [WorkerStatus.RUNNING, WorkerStatus.SUCCESS]:
             num_prev_attempts = count_resume_run_attempts(instance, run.run_id)
             recheck_run = check.not_none(instance.get_run_by_id(run.run_id))
@@ -179,6 +223,18 @@ def execute_run_monitoring_iteration(
 
     logger.info(f"Collected {len(run_records)} runs for monitoring")
     workspace = workspace_process_context.create_request_context()
+
+    # check the health of every started run up front, rather than one run at a time
+    health_check_results = get_run_worker_health_results(
+        instance,
+        [
+            run_record.dagster_run
+            for run_record in run_records
+            if run_record.dagster_run.status == DagsterRunStatus.STARTED
+        ],
+        logger,
+    )
+
     for run_record in run_records:
         try:
             logger.info(f"Checking run {run_record.dagster_run.run_id}")
@@ -189,7 +245,13 @@ def execute_run_monitoring_iteration(
             ):
                 monitor_starting_run(instance, run_record, logger)
             elif run_record.dagster_run.status == DagsterRunStatus.STARTED:
-                monitor_started_run(instance, workspace, run_record, logger)
+                monitor_started_run(
+                    instance,
+                    workspace,
+                    run_record,
+                    logger,
+                    health_check_results.get(run_record.dagster_run.run_id),
+                )
             elif (
                 instance.run_monitoring_cancel_timeout_seconds > 0
                 and run_record.dagster_run.status == DagsterRunStatus.CANCELING
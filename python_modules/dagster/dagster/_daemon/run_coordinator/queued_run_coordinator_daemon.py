@@ -3,7 +3,8 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from dagster import (
     DagsterEvent,
@@ -35,6 +36,97 @@
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
+# Queued runs are reloaded from run storage in full at this interval, in case an update was missed
+# by the incremental refreshes in between
+QUEUED_RUNS_RELOAD_INTERVAL_SECONDS = 300
+
+# Incremental refreshes also reload runs that were updated this long before the latest update that
+# has been seen, so that updates that commit out of order or come from hosts with skewed clocks are
+# not missed
+QUEUED_RUNS_REFRESH_OVERLAP_SECONDS = 30
+
+
+class QueuedRunsIndex:
+    """In-memory index of the queued runs in run storage.
+
+    Loading every queued run on each daemon iteration gets slow once there are many thousands of
+    them, so the index is loaded once and then refreshed with only the runs whose status or tags
+    have changed since the last refresh, using the update timestamp of each run as a cursor.
+    """
+
+    def __init__(
+        self,
+        reload_interval_seconds: float = QUEUED_RUNS_RELOAD_INTERVAL_SECONDS,
+        refresh_overlap_seconds: float = QUEUED_RUNS_REFRESH_OVERLAP_SECONDS,
+    ):
+        self._reload_interval_seconds = reload_interval_seconds
+        self._refresh_overlap_seconds = refresh_overlap_seconds
+        self._lock = threading.Lock()
+        self._queued_runs_by_run_id: Dict[str, Tuple[int, DagsterRun]] = {}
+        self._cursor: Optional[datetime] = None
+        self._last_load_time: Optional[float] = None
+
+    def refresh(self, instance: DagsterInstance) -> None:
+        now = time.time()
+        if (
+            self._cursor is None
+            or self._last_load_time is None
+            or now - self._last_load_time >= self._reload_interval_seconds
+        ):
+            self._load(instance, now)
+            return
+
+        updated_run_records = instance.get_run_records(
+            filters=RunsFilter(
+                updated_after=self._cursor - timedelta(seconds=self._refresh_overlap_seconds)
+            ),
+            order_by="update_timestamp",
+            ascending=True,
+        )
+        with self._lock:
+            for run_record in updated_run_records:
+                if run_record.dagster_run.status == DagsterRunStatus.QUEUED:
+                    self._queued_runs_by_run_id[run_record.dagster_run.run_id] = (
+                        run_record.storage_id,
+                        run_record.dagster_run,
+                    )
+                else:
+                    self._queued_runs_by_run_id.pop(run_record.dagster_run.run_id, None)
+                self._cursor = max(self._cursor, run_record.update_timestamp)
+
+    def _load(self, instance: DagsterInstance, now: float) -> None:
+        # read the cursor first, so that runs updated while the queued runs are loading are picked
+        # up by the next refresh
+        latest_run_records = instance.get_run_records(
+            limit=1, order_by="update_timestamp", ascending=False
+        )
+        queued_run_records = instance.get_run_records(
+            filters=RunsFilter(statuses=[DagsterRunStatus.QUEUED])
+        )
+        with self._lock:
+            self._queued_runs_by_run_id = {
+                run_record.dagster_run.run_id: (run_record.storage_id, run_record.dagster_run)
+                for run_record in queued_run_records
+            }
+            self._cursor = latest_run_records[0].update_timestamp if latest_run_records else None
+            self._last_load_time = now
+
+    def discard(self, run_id: str) -> None:
+        """Removes a run that is known to no longer be queued."""
+        with self._lock:
+            self._queued_runs_by_run_id.pop(run_id, None)
+
+    def get_queued_runs(self) -> Sequence[DagsterRun]:
+        """Returns the queued runs in the order in which they were created."""
+        with self._lock:
+            return [
+                run
+                for _, run in sorted(
+                    self._queued_runs_by_run_id.values(),
+                    key=lambda storage_id_and_run: storage_id_and_run[0],
+                )
+            ]
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -46,6 +138,7 @@ def __init__(self, interval_seconds) -> None:
         self._executor: Optional[ThreadPoolExecutor] = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
+        self._queued_runs_index = QueuedRunsIndex()
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -260,11 +353,8 @@ def _get_runs_to_dequeue(
         return batch
 
     def _get_queued_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        queued_runs_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
-
-        # Reversed for fifo ordering
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+        self._queued_runs_index.refresh(instance)
+        return self._queued_runs_index.get_queued_runs()
 
     def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
         return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
@@ -296,16 +386,23 @@ def _dequeue_run(
         fixed_iteration_time: Optional[float],
     ) -> bool:
         # double check that the run is still queued before dequeing
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        run_id = run.run_id
+        run = instance.get_run_by_id(run_id)
 
         now = fixed_iteration_time or time.time()
 
+        if run is None:
+            self._logger.info("Run %s was deleted while queued, skipping", run_id)
+            self._queued_runs_index.discard(run_id)
+            return False
+
         if run.status != DagsterRunStatus.QUEUED:
             self._logger.info(
                 "Run %s is now %s instead of QUEUED, skipping",
                 run.run_id,
                 run.status,
             )
+            self._queued_runs_index.discard(run.run_id)
             return False
 
         # Very old (pre 0.10.0) runs and programatically submitted runs may not have an
@@ -326,6 +423,7 @@ def _dequeue_run(
         )
 
         instance.report_dagster_event(launch_started_event, run_id=run.run_id)
+        self._queued_runs_index.discard(run.run_id)
 
         run = check.not_none(instance.get_run_by_id(run.run_id))
 
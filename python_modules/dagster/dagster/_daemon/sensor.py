@@ -6,10 +6,12 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
+from itertools import zip_longest
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Dict,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -21,6 +23,7 @@
     cast,
 )
 
+import grpc
 import pendulum
 from typing_extensions import Self, TypeAlias
 
@@ -35,7 +38,7 @@
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorExecutionData
 from dagster._core.definitions.utils import validate_tags
-from dagster._core.errors import DagsterError
+from dagster._core.errors import DagsterError, DagsterUserCodeUnreachableError
 from dagster._core.host_representation.code_location import CodeLocation
 from dagster._core.host_representation.external import ExternalJob, ExternalSensor
 from dagster._core.host_representation.external_data import ExternalTargetData
@@ -295,6 +298,8 @@ def execute_sensor_iteration_loop(
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
+                max_concurrent_ticks_per_location=settings.get("max_concurrent_ticks_per_location"),
+                evaluation_timeout=settings.get("evaluation_timeout_seconds"),
             )
             # Yield to check for heartbeats in case there were no yields within
             # execute_sensor_iteration
@@ -321,6 +326,8 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    max_concurrent_ticks_per_location: Optional[int] = None,
+    evaluation_timeout: Optional[int] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -403,7 +410,15 @@ def execute_sensor_iteration(
         yield
         return
 
-    for external_sensor in sensors.values():
+    # count the ticks from each location that are still being evaluated from previous iterations,
+    # so that a location with many slow sensors can't take up all of the threads
+    in_flight_ticks_by_location: Dict[str, int] = defaultdict(int)
+    if sensor_tick_futures:
+        for selector_id, future in sensor_tick_futures.items():
+            if selector_id in sensors and not future.done():
+                in_flight_ticks_by_location[sensors[selector_id].handle.location_name] += 1
+
+    for external_sensor in _interleave_sensors_by_location(sensors.values(), all_sensor_states):
         sensor_name = external_sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
         sensor_state = all_sensor_states.get(external_sensor.selector_id)
@@ -430,6 +445,13 @@ def execute_sensor_iteration(
             ):
                 continue
 
+            location_name = external_sensor.handle.location_name
+            if (
+                max_concurrent_ticks_per_location is not None
+                and in_flight_ticks_by_location[location_name] >= max_concurrent_ticks_per_location
+            ):
+                continue
+
             future = threadpool_executor.submit(
                 _process_tick,
                 workspace_process_context,
@@ -440,8 +462,10 @@ def execute_sensor_iteration(
                 sensor_debug_crash_flags,
                 tick_retention_settings,
                 submit_threadpool_executor,
+                evaluation_timeout,
             )
             sensor_tick_futures[external_sensor.selector_id] = future
+            in_flight_ticks_by_location[location_name] += 1
             yield
 
         else:
@@ -456,9 +480,37 @@ def execute_sensor_iteration(
                 sensor_debug_crash_flags,
                 tick_retention_settings,
                 submit_threadpool_executor=None,
+                evaluation_timeout=evaluation_timeout,
             )
 
 
+def _interleave_sensors_by_location(
+    external_sensors: Iterable[ExternalSensor],
+    sensor_states: Mapping[str, InstigatorState],
+) -> Sequence[ExternalSensor]:
+    """Orders sensors so that consecutive sensors come from different code locations in turn, with
+    the least recently evaluated sensors of each code location first. Since ticks are evaluated in
+    the order that they are submitted, this keeps a code location with many sensors from delaying
+    the sensors of other code locations.
+    """
+
+    def _last_tick_start_timestamp(external_sensor: ExternalSensor) -> float:
+        sensor_state = sensor_states.get(external_sensor.selector_id)
+        instigator_data = _sensor_instigator_data(sensor_state) if sensor_state else None
+        return (instigator_data.last_tick_start_timestamp or 0) if instigator_data else 0
+
+    sensors_by_location: Dict[str, List[ExternalSensor]] = defaultdict(list)
+    for external_sensor in sorted(external_sensors, key=_last_tick_start_timestamp):
+        sensors_by_location[external_sensor.handle.location_name].append(external_sensor)
+
+    return [
+        external_sensor
+        for location_sensors in zip_longest(*sensors_by_location.values())
+        for external_sensor in location_sensors
+        if external_sensor is not None
+    ]
+
+
 def _process_tick(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -468,6 +520,7 @@ def _process_tick(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    evaluation_timeout: Optional[int] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -481,6 +534,7 @@ def _process_tick(
             sensor_debug_crash_flags,
             tick_retention_settings,
             submit_threadpool_executor,
+            evaluation_timeout,
         )
     )
 
@@ -494,6 +548,7 @@ def _process_tick_generator(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    evaluation_timeout: Optional[int] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
@@ -538,6 +593,7 @@ def _process_tick_generator(
                 sensor_state,
                 submit_threadpool_executor,
                 sensor_debug_crash_flags,
+                evaluation_timeout,
             )
 
     except Exception:
@@ -653,6 +709,14 @@ def _get_code_location_for_sensor(
     )
 
 
+def _is_deadline_exceeded(error: DagsterUserCodeUnreachableError) -> bool:
+    cause = error.__cause__
+    return (
+        isinstance(cause, grpc.RpcError)
+        and cause.code() == grpc.StatusCode.DEADLINE_EXCEEDED  # type: ignore  # (bad stubs)
+    )
+
+
 def _evaluate_sensor(
     workspace_process_context: IWorkspaceProcessContext,
     context: SensorLaunchContext,
@@ -660,6 +724,7 @@ def _evaluate_sensor(
     state: InstigatorState,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+    evaluation_timeout: Optional[int] = None,
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
@@ -667,14 +732,33 @@ def _evaluate_sensor(
     repository_handle = external_sensor.handle.repository_handle
     instigator_data = _sensor_instigator_data(state)
 
-    sensor_runtime_data = code_location.get_external_sensor_execution_data(
-        instance,
-        repository_handle,
-        external_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
-    )
+    try:
+        sensor_runtime_data = code_location.get_external_sensor_execution_data(
+            instance,
+            repository_handle,
+            external_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+            timeout=evaluation_timeout,
+        )
+    except DagsterUserCodeUnreachableError as e:
+        if evaluation_timeout is None or not _is_deadline_exceeded(e):
+            raise
+
+        skip_reason = (
+            f"Sensor evaluation did not finish within {evaluation_timeout} seconds, so its"
+            " result was not used."
+        )
+        context.logger.warning(f"{skip_reason} Skipping tick for sensor {external_sensor.name}.")
+        # keep the current cursor, so that the next tick picks up where this one would have
+        context.update_state(
+            TickStatus.SKIPPED,
+            skip_reason=skip_reason,
+            cursor=instigator_data.cursor if instigator_data else None,
+        )
+        yield
+        return
 
     yield
 
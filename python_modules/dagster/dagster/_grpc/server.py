@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import math
@@ -262,6 +263,12 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # The loaded repositories don't change for the lifetime of the server, so their serialized
+        # snapshots are computed once, keyed by repository name and defer_snapshots
+        self._serialized_external_repository_data: Dict[Tuple[str, bool], str] = {}
+        self._serialized_external_repository_data_lock = threading.Lock()
+        self._repository_snapshot_ids: Dict[str, str] = {}
+
         self._entry_point = (
             check.sequence_param(entry_point, "entry_point", of_type=str)
             if entry_point is not None
@@ -451,6 +458,10 @@ def ListRepositories(self, request, _context) -> api_pb2.ListRepositoriesReply:
                     container_image=self._container_image,
                     container_context=self._container_context,
                     dagster_library_versions=DagsterLibraryRegistry.get(),
+                    repository_snapshot_ids={
+                        repository_name: self._get_repository_snapshot_id(repository_name)
+                        for repository_name in loaded_repositories.definitions_by_name
+                    },
                 )
             )
         except Exception:
@@ -597,6 +608,34 @@ def ExternalPipelineSubsetSnapshot(
             serialized_external_pipeline_subset_result=serialized_external_pipeline_subset_result
         )
 
+    def _get_serialized_external_repository_data_for_name(
+        self, repository_name: str, defer_snapshots: bool
+    ) -> str:
+        key = (repository_name, defer_snapshots)
+        with self._serialized_external_repository_data_lock:
+            if key not in self._serialized_external_repository_data:
+                repository_def = check.not_none(self._loaded_repositories).definitions_by_name[
+                    repository_name
+                ]
+                self._serialized_external_repository_data[key] = serialize_value(
+                    external_repository_data_from_def(
+                        repository_def, defer_snapshots=defer_snapshots
+                    )
+                )
+            return self._serialized_external_repository_data[key]
+
+    def _get_repository_snapshot_id(self, repository_name: str) -> str:
+        """A hash of the serialized ExternalRepositoryData that StreamingExternalRepository returns
+        for the repository, which clients can use to avoid fetching a snapshot they already have.
+        """
+        if repository_name not in self._repository_snapshot_ids:
+            self._repository_snapshot_ids[repository_name] = hashlib.sha256(
+                self._get_serialized_external_repository_data_for_name(
+                    repository_name, defer_snapshots=False
+                ).encode("utf-8")
+            ).hexdigest()
+        return self._repository_snapshot_ids[repository_name]
+
     def _get_serialized_external_repository_data(self, request):
         try:
             repository_origin = deserialize_value(
@@ -604,11 +643,9 @@ def _get_serialized_external_repository_data(self, request):
                 ExternalRepositoryOrigin,
             )
 
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
+            self._get_repo_for_origin(repository_origin)
+            return self._get_serialized_external_repository_data_for_name(
+                repository_origin.repository_name, defer_snapshots=request.defer_snapshots
             )
         except Exception:
             return serialize_value(
@@ -313,6 +313,9 @@ class ListRepositoriesResponse(
             ("container_image", Optional[str]),
             ("container_context", Optional[Mapping[str, Any]]),
             ("dagster_library_versions", Optional[Mapping[str, str]]),
+            # sha256 of the serialized ExternalRepositoryData for each repository. None if the
+            # server predates snapshot ids
+            ("repository_snapshot_ids", Optional[Mapping[str, str]]),
         ],
     )
 ):
@@ -325,6 +328,7 @@ def __new__(
         container_image: Optional[str] = None,
         container_context: Optional[Mapping] = None,
         dagster_library_versions: Optional[Mapping[str, str]] = None,
+        repository_snapshot_ids: Optional[Mapping[str, str]] = None,
     ):
         return super(ListRepositoriesResponse, cls).__new__(
             cls,
@@ -352,6 +356,9 @@ def __new__(
             dagster_library_versions=check.opt_nullable_mapping_param(
                 dagster_library_versions, "dagster_library_versions"
             ),
+            repository_snapshot_ids=check.opt_nullable_mapping_param(
+                repository_snapshot_ids, "repository_snapshot_ids", key_type=str, value_type=str
+            ),
         )
 
 
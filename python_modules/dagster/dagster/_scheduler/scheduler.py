@@ -36,6 +36,7 @@
 from dagster._core.telemetry import SCHEDULED_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.workspace import CodeLocationLoadStatus
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._seven.compat.pendulum import to_timezone
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags
@@ -241,6 +242,9 @@ def launch_scheduled_runs(
                     f" schedules due to the following error: {location_entry.load_error}"
                 )
             error_locations.add(location_entry.origin.location_name)
+        elif location_entry.load_status == CodeLocationLoadStatus.LOADING:
+            # don't clean up auto running state for locations that haven't finished loading
+            error_locations.add(location_entry.origin.location_name)
 
     # Remove any schedule states that were previously created with AUTOMATICALLY_RUNNING
     # and can no longer be found in the workspace (so that if they are later added
@@ -13,6 +13,8 @@
   (in memory, not human readable, etc) just handle the json case effectively.
 """
 import collections.abc
+import os
+import re
 from abc import ABC, abstractmethod
 from enum import Enum
 from functools import partial
@@ -47,6 +49,11 @@
 
 from .errors import DeserializationError, SerdesUsageError, SerializationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ###################################################################################################
 # Types
 ###################################################################################################
@@ -186,6 +193,13 @@ def create() -> "WhitelistMap":
 
 _WHITELIST_MAP: Final[WhitelistMap] = WhitelistMap.create()
 
+# Parse JSON with orjson, if it is installed and enabled with the DAGSTER_SERDES_USE_ORJSON env var
+_USE_ORJSON: bool = orjson is not None and bool(os.getenv("DAGSTER_SERDES_USE_ORJSON"))
+
+# orjson parses integers that don't fit in 64 bits as floats, so payloads with long runs of digits
+# are parsed with the standard library instead
+_ORJSON_UNSAFE_DIGITS_PATTERN = re.compile(r"\d{19}")
+
 T = TypeVar("T")
 U = TypeVar("U")
 T_Type = TypeVar("T_Type", bound=Type[object])
@@ -418,6 +432,8 @@ def get_storage_name(self) -> str:
 
 EMPTY_VALUES_TO_SKIP: Tuple[None, List[Any], Dict[Any, Any], Set[Any]] = (None, [], {}, set())
 
+_JSON_SCALAR_TYPES: AbstractSet[type] = frozenset((int, float, str, bool))
+
 
 class NamedTupleSerializer(Serializer, Generic[T_NamedTuple]):
     # NOTE: See `whitelist_for_serdes` docstring for explanations of parameters.
@@ -438,6 +454,13 @@ def __init__(
         self.old_fields = old_fields or {}
         self.skip_when_empty_fields = skip_when_empty_fields or set()
         self.field_serializers = field_serializers or {}
+        # built on first use, see `_build_fields_unpacker` and `_build_packer`
+        self._fields_unpacker: Optional[
+            Callable[[Dict[str, UnpackedValue], WhitelistMap, UnpackContext], T_NamedTuple]
+        ] = None
+        self._packer: Optional[
+            Callable[[T_NamedTuple, WhitelistMap, str], Dict[str, JsonSerializableValue]]
+        ] = None
 
     def unpack(
         self,
@@ -447,34 +470,9 @@ def unpack(
     ) -> T_NamedTuple:
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
-            unpacked: Dict[str, PackableValue] = {}
-            for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
-                # Naively implements backwards compatibility by filtering arguments that aren't present in
-                # the constructor. If a property is present in the serialized object, but doesn't exist in
-                # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
-                    # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
-                    if custom:
-                        unpacked[loaded_name] = custom.unpack(
-                            value,
-                            whitelist_map=whitelist_map,
-                            context=context,
-                        )
-                    elif context.observed_unknown_serdes_values:
-                        unpacked[loaded_name] = context.assert_no_unknown_values(value)
-                    else:
-                        unpacked[loaded_name] = cast(PackableValue, value)
-
-                else:
-                    context.clear_ignored_unknown_values(value)
-
-            # False positive type error here due to an eccentricity of `NamedTuple`-- calling `NamedTuple`
-            # directly acts as a class factory, which is not true for `NamedTuple` subclasses (which act
-            # like normal constructors). Because we have no subclass info here, the type checker thinks
-            # we are invoking the class factory and complains about arguments.
-            return self.klass(**unpacked)  # type: ignore
+            if self._fields_unpacker is None:
+                self._fields_unpacker = self._build_fields_unpacker()
+            return self._fields_unpacker(unpacked_dict, whitelist_map, context)
         except Exception as exc:
             value = self.handle_unpack_error(exc, context, unpacked_dict)
             if isinstance(context, UnpackContext):
@@ -482,6 +480,86 @@ def unpack(
                 context.clear_ignored_unknown_values(unpacked_dict)
             return value
 
+    def _build_fields_unpacker(
+        self,
+    ) -> Callable[[Dict[str, UnpackedValue], WhitelistMap, UnpackContext], T_NamedTuple]:
+        """Build a function that constructs the domain object from a dict of unpacked fields.
+
+        Storage names, constructor params and field serializers are resolved once per class here,
+        rather than for every field of every object that is unpacked.
+        """
+        klass = self.klass
+        field_serializers = self.field_serializers
+
+        # Naively implements backwards compatibility by filtering arguments that aren't present in
+        # the constructor. If a property is present in the serialized object, but doesn't exist in
+        # the version of the class loaded into memory, that property will be completely ignored.
+        constructor_param_names = set(self.constructor_param_names)
+        loaded_names_by_storage_name = {name: name for name in constructor_param_names}
+        for storage_name, loaded_name in self.loaded_field_names.items():
+            if loaded_name in constructor_param_names:
+                loaded_names_by_storage_name[storage_name] = loaded_name
+            else:
+                loaded_names_by_storage_name.pop(storage_name, None)
+        fields_by_storage_name: Dict[str, Tuple[str, Optional[FieldSerializer]]] = {
+            storage_name: (loaded_name, field_serializers.get(loaded_name))
+            for storage_name, loaded_name in loaded_names_by_storage_name.items()
+        }
+
+        def _unpack_fields(
+            unpacked_dict: Dict[str, UnpackedValue],
+            whitelist_map: WhitelistMap,
+            context: UnpackContext,
+        ) -> T_NamedTuple:
+            unpacked: Dict[str, PackableValue] = {}
+            for key, value in unpacked_dict.items():
+                field = fields_by_storage_name.get(key)
+                if field is None:
+                    context.clear_ignored_unknown_values(value)
+                    continue
+
+                # custom unpack regardless of hook vs recursive descent
+                loaded_name, custom = field
+                if custom:
+                    unpacked[loaded_name] = custom.unpack(
+                        value,
+                        whitelist_map=whitelist_map,
+                        context=context,
+                    )
+                elif context.observed_unknown_serdes_values:
+                    unpacked[loaded_name] = context.assert_no_unknown_values(value)
+                else:
+                    unpacked[loaded_name] = value  # type: ignore  # (skip `cast` call on hot path)
+
+            # False positive type error here due to an eccentricity of `NamedTuple`-- calling
+            # `NamedTuple` directly acts as a class factory, which is not true for `NamedTuple`
+            # subclasses (which act like normal constructors). Because we have no subclass info
+            # here, the type checker thinks we are invoking the class factory and complains about
+            # arguments.
+            return klass(**unpacked)  # type: ignore
+
+        if field_serializers or any(
+            storage_name != loaded_name
+            for storage_name, loaded_name in loaded_names_by_storage_name.items()
+        ):
+            return _unpack_fields
+
+        # Common case: fields are stored under their own names and have no custom serializers, so
+        # if every stored field is a constructor param and nothing unknown has been observed, the
+        # dict can be passed straight to the constructor.
+        def _unpack_fields_by_name(
+            unpacked_dict: Dict[str, UnpackedValue],
+            whitelist_map: WhitelistMap,
+            context: UnpackContext,
+        ) -> T_NamedTuple:
+            if context.observed_unknown_serdes_values or not constructor_param_names.issuperset(
+                unpacked_dict
+            ):
+                return _unpack_fields(unpacked_dict, whitelist_map, context)
+            return klass(**unpacked_dict)  # type: ignore
+
+        return _unpack_fields_by_name
+
     # Hook: Modify the contents of the unpacked dict before domain object construction during
     # deserialization.
     def before_unpack(
@@ -506,6 +584,80 @@ def pack(
         value: T_NamedTuple,
         whitelist_map: WhitelistMap,
         descent_path: str,
+    ) -> Dict[str, JsonSerializableValue]:
+        if self._packer is None:
+            self._packer = self._build_packer()
+        return self._packer(value, whitelist_map, descent_path)
+
+    def _build_packer(
+        self,
+    ) -> Callable[[T_NamedTuple, WhitelistMap, str], Dict[str, JsonSerializableValue]]:
+        """Build a function that packs an instance of the class into a json-serializable dict.
+
+        Storage names, field serializers and hooks are resolved once per class here, rather than
+        for every field of every object that is packed.
+        """
+        klass = self.klass
+        storage_name = self.get_storage_name()
+        old_fields = self.old_fields
+        after_pack = (
+            self.after_pack
+            if type(self).after_pack is not NamedTupleSerializer.after_pack
+            else None
+        )
+        field_packers = [
+            (
+                key,
+                self.storage_field_names.get(key, key),
+                self.field_serializers.get(key),
+                key in self.skip_when_empty_fields,
+            )
+            for key in klass._fields
+        ]
+
+        def _pack(
+            value: T_NamedTuple,
+            whitelist_map: WhitelistMap,
+            descent_path: str,
+        ) -> Dict[str, JsonSerializableValue]:
+            # namedtuples are iterated in field order, so we can zip them with the precomputed
+            # field packers unless we've been handed a different class registered under this name
+            if value.__class__ is not klass:
+                return self._pack_fields(value, whitelist_map, descent_path)
+
+            packed: Dict[str, JsonSerializableValue] = {"__class__": storage_name}
+            for (key, storage_key, custom, skip_when_empty), inner_value in zip(
+                field_packers, value
+            ):
+                if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                if custom is None and (
+                    inner_value.__class__ in _JSON_SCALAR_TYPES or inner_value is None
+                ):
+                    packed[storage_key] = inner_value
+                elif custom:
+                    packed[storage_key] = custom.pack(
+                        inner_value,
+                        whitelist_map=whitelist_map,
+                        descent_path=f"{descent_path}.{key}",
+                    )
+                else:
+                    packed[storage_key] = _pack_value(
+                        inner_value,
+                        whitelist_map=whitelist_map,
+                        descent_path=f"{descent_path}.{key}",
+                    )
+            if old_fields:
+                packed.update(old_fields)
+            return after_pack(**packed) if after_pack else packed
+
+        return _pack
+
+    def _pack_fields(
+        self,
+        value: T_NamedTuple,
+        whitelist_map: WhitelistMap,
+        descent_path: str,
     ) -> Dict[str, JsonSerializableValue]:
         packed: Dict[str, JsonSerializableValue] = {}
         packed["__class__"] = self.get_storage_name()
@@ -663,28 +815,35 @@ def _pack_value(
 ) -> JsonSerializableValue:
     # this is a hot code path so we handle the common base cases without isinstance
     tval = type(val)
-    if tval in (int, float, str, bool) or val is None:
-        return cast(JsonSerializableValue, val)
+    if tval in _JSON_SCALAR_TYPES or val is None:
+        return val  # type: ignore  # (skip `cast` call on hot path)
     if tval is list:
         return [
-            _pack_value(item, whitelist_map, f"{descent_path}[{idx}]")
-            for idx, item in enumerate(cast(list, val))
+            (
+                item
+                if item.__class__ in _JSON_SCALAR_TYPES or item is None
+                else _pack_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            )
+            for idx, item in enumerate(val)  # type: ignore  # (skip `cast` call on hot path)
         ]
     if tval is dict:
         return {
-            key: _pack_value(value, whitelist_map, f"{descent_path}.{key}")
-            for key, value in cast(dict, val).items()
+            key: (
+                value
+                if value.__class__ in _JSON_SCALAR_TYPES or value is None
+                else _pack_value(value, whitelist_map, f"{descent_path}.{key}")
+            )
+            for key, value in val.items()  # type: ignore  # (skip `cast` call on hot path)
         }
 
     # inlined is_named_tuple_instance
     if isinstance(val, tuple) and hasattr(val, "_fields"):
-        klass_name = val.__class__.__name__
-        if not whitelist_map.has_tuple_serializer(klass_name):
+        serializer = whitelist_map.tuple_serializers.get(val.__class__.__name__)
+        if serializer is None:
             raise SerializationError(
                 "Can only serialize whitelisted namedtuples, received"
                 f" {val}.\nDescent path: {descent_path}",
             )
-        serializer = whitelist_map.get_tuple_serializer(klass_name)
         return serializer.pack(cast(NamedTuple, val), whitelist_map, descent_path)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
@@ -786,9 +945,7 @@ def deserialize_value(
     # Never issue warnings when deserializing deprecated objects.
     with disable_dagster_warnings():
         context = UnpackContext()
-        unpacked_value = seven.json.loads(
-            val, object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context)
-        )
+        unpacked_value = _load_and_unpack(val, whitelist_map, context)
         unpacked_value = context.finalize_unpack(unpacked_value)
         if as_type and not (
             is_named_tuple_instance(unpacked_value)
@@ -802,6 +959,44 @@ def deserialize_value(
     return unpacked_value
 
 
+def _load_and_unpack(
+    val: str, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    if _USE_ORJSON and not _ORJSON_UNSAFE_DIGITS_PATTERN.search(val):
+        try:
+            loaded_value = orjson.loads(val)  # type: ignore  # (orjson is optional)
+        except orjson.JSONDecodeError:  # type: ignore  # (orjson is optional)
+            # orjson is stricter than the standard library parser (e.g. it rejects NaN and control
+            # characters in strings), so fall back to it for anything orjson can't parse
+            pass
+        else:
+            return _unpack_loaded_value(loaded_value, whitelist_map, context)
+
+    return seven.json.loads(
+        val, object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context)
+    )
+
+
+def _unpack_loaded_value(
+    val: JsonSerializableValue,
+    whitelist_map: WhitelistMap,
+    context: UnpackContext,
+) -> UnpackedValue:
+    # Like `_unpack_value`, but replaces containers in place since the value was freshly loaded
+    tval = type(val)
+    if tval is list:
+        for idx, item in enumerate(val):  # type: ignore  # (skip `cast` call on hot path)
+            if item.__class__ in (list, dict):
+                val[idx] = _unpack_loaded_value(item, whitelist_map, context)  # type: ignore
+        return val
+    if tval is dict:
+        for key, value in val.items():  # type: ignore  # (skip `cast` call on hot path)
+            if value.__class__ in (list, dict):
+                val[key] = _unpack_loaded_value(value, whitelist_map, context)  # type: ignore
+        return _unpack_object(val, whitelist_map, context)  # type: ignore
+    return val
+
+
 class UnknownSerdesValue:
     def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
         self.message = message
@@ -811,7 +1006,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext):
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_tuple_deserializer(klass_name):
+        deserializer = whitelist_map.tuple_deserializers.get(klass_name)
+        if deserializer is None:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -820,7 +1016,6 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
             )
 
         val.pop("__class__")
-        deserializer = whitelist_map.get_tuple_deserializer(klass_name)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
@@ -917,11 +1112,18 @@ def _unpack_value(
     whitelist_map: WhitelistMap,
     context: UnpackContext,
 ) -> UnpackedValue:
+    # this is a hot code path so we only recurse into containers
     if isinstance(val, list):
-        return [_unpack_value(item, whitelist_map, context) for item in val]
+        return [
+            _unpack_value(item, whitelist_map, context) if isinstance(item, (list, dict)) else item
+            for item in val
+        ]
 
     if isinstance(val, dict):
-        unpacked_vals = {k: _unpack_value(v, whitelist_map, context) for k, v in val.items()}
+        unpacked_vals = {
+            k: _unpack_value(v, whitelist_map, context) if isinstance(v, (list, dict)) else v
+            for k, v in val.items()
+        }
         return _unpack_object(unpacked_vals, whitelist_map, context)
 
     return val
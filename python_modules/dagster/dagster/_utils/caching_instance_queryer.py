@@ -1,4 +1,6 @@
+import time
 from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
@@ -7,6 +9,8 @@
     Dict,
     FrozenSet,
     Iterable,
+    Iterator,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -72,6 +76,7 @@ def __init__(
         self._asset_partition_versions_updated_after_cursor_cache: Dict[
             AssetKeyPartitionKey, int
         ] = {}
+        self._latest_storage_ids_by_partition_cache: Dict[AssetKey, Mapping[str, int]] = {}
 
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
 
@@ -82,6 +87,9 @@ def __init__(
             self._instance.auto_materialize_respect_materialization_data_versions
         )
 
+        self._num_queries = 0
+        self._query_duration = 0.0
+
     @property
     def instance(self) -> DagsterInstance:
         return self._instance
@@ -94,6 +102,25 @@ def asset_graph(self) -> AssetGraph:
     def evaluation_time(self) -> datetime:
         return self._evaluation_time
 
+    @property
+    def num_queries(self) -> int:
+        """The number of queries that have been issued against the instance so far."""
+        return self._num_queries
+
+    @property
+    def query_duration(self) -> float:
+        """The total time, in seconds, spent on queries against the instance so far."""
+        return self._query_duration
+
+    @contextmanager
+    def _timed_query(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._num_queries += 1
+            self._query_duration += time.perf_counter() - start
+
     ####################
     # QUERY BATCHING
     ####################
@@ -103,12 +130,13 @@ def prefetch_asset_partition_counts(
     ):
         """For performance, batches together queries for selected assets."""
         if after_cursor is not None:
-            self._asset_partition_count_cache[after_cursor] = dict(
-                self.instance.get_materialization_count_by_partition(
-                    asset_keys=asset_keys,
-                    after_cursor=after_cursor,
+            with self._timed_query():
+                self._asset_partition_count_cache[after_cursor] = dict(
+                    self.instance.get_materialization_count_by_partition(
+                        asset_keys=asset_keys,
+                        after_cursor=after_cursor,
+                    )
                 )
-            )
 
     def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
         """For performance, batches together queries for selected assets."""
@@ -116,13 +144,31 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
         if len(keys_to_fetch) == 0:
             return
         # get all asset records for selected assets that aren't already cached
-        asset_records = self.instance.get_asset_records(list(keys_to_fetch))
+        with self._timed_query():
+            asset_records = self.instance.get_asset_records(list(keys_to_fetch))
         for asset_record in asset_records:
             self._asset_record_cache[asset_record.asset_entry.asset_key] = asset_record
         for key in asset_keys:
             if key not in self._asset_record_cache:
                 self._asset_record_cache[key] = None
 
+    def prefetch_latest_storage_ids_by_partition(self, asset_keys: Iterable[AssetKey]):
+        """For performance, batches together queries for the latest storage id of each partition
+        of the selected partitioned assets, with one query per event type.
+        """
+        keys_to_fetch_by_event_type: Dict[DagsterEventType, List[AssetKey]] = defaultdict(list)
+        for key in asset_keys:
+            if key not in self._latest_storage_ids_by_partition_cache:
+                keys_to_fetch_by_event_type[self._event_type_for_key(key)].append(key)
+
+        for event_type, keys_to_fetch in keys_to_fetch_by_event_type.items():
+            with self._timed_query():
+                self._latest_storage_ids_by_partition_cache.update(
+                    self.instance.get_latest_storage_ids_by_partition(
+                        keys_to_fetch, event_type=event_type
+                    )
+                )
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -138,19 +184,21 @@ def get_failed_or_in_progress_subset(self, *, asset_key: AssetKey) -> Partitions
 
         partitions_def = check.not_none(self.asset_graph.get_partitions_def(asset_key))
         asset_record = self.get_asset_record(asset_key)
-        cache_value = get_and_update_asset_status_cache_value(
-            instance=self.instance,
-            asset_key=asset_key,
-            partitions_def=partitions_def,
-            dynamic_partitions_loader=self,
-            asset_record=asset_record,
-        )
+        with self._timed_query():
+            cache_value = get_and_update_asset_status_cache_value(
+                instance=self.instance,
+                asset_key=asset_key,
+                partitions_def=partitions_def,
+                dynamic_partitions_loader=self,
+                asset_record=asset_record,
+            )
         if cache_value is None:
             return partitions_def.empty_subset()
 
-        return cache_value.deserialize_failed_partition_subsets(
-            partitions_def
-        ) | cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+        _, failed_subset, in_progress_subset = cache_value.deserialize_partition_subsets(
+            partitions_def, dynamic_partitions_store=self
+        )
+        return failed_subset | in_progress_subset
 
     ####################
     # ASSET RECORDS / STORAGE IDS
@@ -161,9 +209,10 @@ def has_cached_asset_record(self, asset_key: AssetKey) -> bool:
 
     def get_asset_record(self, asset_key: AssetKey) -> Optional["AssetRecord"]:
         if asset_key not in self._asset_record_cache:
-            self._asset_record_cache[asset_key] = next(
-                iter(self.instance.get_asset_records([asset_key])), None
-            )
+            with self._timed_query():
+                self._asset_record_cache[asset_key] = next(
+                    iter(self.instance.get_asset_records([asset_key])), None
+                )
         return self._asset_record_cache[asset_key]
 
     def _event_type_for_key(self, asset_key: AssetKey) -> DagsterEventType:
@@ -193,18 +242,19 @@ def _get_latest_materialization_or_observation_record(
                 return None
             return asset_record.asset_entry.last_materialization_record
 
-        records = self.instance.get_event_records(
-            EventRecordsFilter(
-                event_type=self._event_type_for_key(asset_partition.asset_key),
-                asset_key=asset_partition.asset_key,
-                asset_partitions=(
-                    [asset_partition.partition_key] if asset_partition.partition_key else None
+        with self._timed_query():
+            records = self.instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=self._event_type_for_key(asset_partition.asset_key),
+                    asset_key=asset_partition.asset_key,
+                    asset_partitions=(
+                        [asset_partition.partition_key] if asset_partition.partition_key else None
+                    ),
+                    before_cursor=before_cursor,
                 ),
-                before_cursor=before_cursor,
-            ),
-            ascending=False,
-            limit=1,
-        )
+                ascending=False,
+                limit=1,
+            )
         return next(iter(records), None)
 
     @cached_method
@@ -218,15 +268,16 @@ def get_latest_storage_id_for_event_type(
         """
         from dagster._core.event_api import EventRecordsFilter
 
-        latest_record = next(
-            iter(
-                self.instance.get_event_records(
-                    event_records_filter=EventRecordsFilter(event_type=event_type),
-                    limit=1,
-                )
-            ),
-            None,
-        )
+        with self._timed_query():
+            latest_record = next(
+                iter(
+                    self.instance.get_event_records(
+                        event_records_filter=EventRecordsFilter(event_type=event_type),
+                        limit=1,
+                    )
+                ),
+                None,
+            )
         if latest_record is not None:
             return latest_record.storage_id
         return None
@@ -249,12 +300,19 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
             asset_partition: latest_record.storage_id if latest_record is not None else None
         }
         if self.asset_graph.is_partitioned(asset_key):
+            if asset_key not in self._latest_storage_ids_by_partition_cache:
+                with self._timed_query():
+                    self._latest_storage_ids_by_partition_cache[asset_key] = (
+                        self.instance.get_latest_storage_id_by_partition(
+                            asset_key, event_type=self._event_type_for_key(asset_key)
+                        )
+                    )
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
-                    for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
-                    ).items()
+                    for partition_key, storage_id in self._latest_storage_ids_by_partition_cache[
+                        asset_key
+                    ].items()
                 }
             )
         return latest_storage_ids
@@ -354,14 +412,16 @@ def next_version_record(
     ) -> Optional["EventLogRecord"]:
         from dagster._core.event_api import EventRecordsFilter
 
-        for record in self.instance.get_event_records(
-            EventRecordsFilter(
-                event_type=DagsterEventType.ASSET_OBSERVATION,
-                asset_key=asset_key,
-                after_cursor=after_cursor,
-            ),
-            ascending=True,
-        ):
+        with self._timed_query():
+            records = self.instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_OBSERVATION,
+                    asset_key=asset_key,
+                    after_cursor=after_cursor,
+                ),
+                ascending=True,
+            )
+        for record in records:
             record_version = extract_data_version_from_entry(record.event_log_entry)
             if record_version is not None and record_version != data_version:
                 return record
@@ -375,7 +435,8 @@ def next_version_record(
 
     @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
-        return self.instance.get_run_record_by_id(run_id)
+        with self._timed_query():
+            return self.instance.get_run_record_by_id(run_id)
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
@@ -397,9 +458,10 @@ def _get_planned_materializations_for_run_from_events(
         Args:
             run_id (str): The run id
         """
-        materializations_planned = self.instance.get_records_for_run(
-            run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
-        ).records
+        with self._timed_query():
+            materializations_planned = self.instance.get_records_for_run(
+                run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
+            ).records
         return set(cast(AssetKey, record.asset_key) for record in materializations_planned)
 
     def get_planned_materializations_for_run(self, run_id: str) -> AbstractSet[AssetKey]:
@@ -441,10 +503,11 @@ def get_current_materializations_for_run(self, *, run_id: str) -> AbstractSet[As
         Args:
             run_id (str): The run id
         """
-        materializations = self.instance.get_records_for_run(
-            run_id=run_id,
-            of_type=DagsterEventType.ASSET_MATERIALIZATION,
-        ).records
+        with self._timed_query():
+            materializations = self.instance.get_records_for_run(
+                run_id=run_id,
+                of_type=DagsterEventType.ASSET_MATERIALIZATION,
+            ).records
         return set(cast(AssetKey, record.asset_key) for record in materializations)
 
     ####################
@@ -459,11 +522,12 @@ def get_active_backfill_target_asset_graph_subset(self) -> AssetGraphSubset:
         from dagster._core.execution.asset_backfill import AssetBackfillData
         from dagster._core.execution.backfill import BulkActionStatus
 
-        asset_backfills = [
-            backfill
-            for backfill in self.instance.get_backfills(status=BulkActionStatus.REQUESTED)
-            if backfill.is_asset_backfill
-        ]
+        with self._timed_query():
+            asset_backfills = [
+                backfill
+                for backfill in self.instance.get_backfills(status=BulkActionStatus.REQUESTED)
+                if backfill.is_asset_backfill
+            ]
 
         result = AssetGraphSubset(self.asset_graph)
         for asset_backfill in asset_backfills:
@@ -499,11 +563,12 @@ def get_materialized_partition_counts(
             after_cursor not in self._asset_partition_count_cache
             or asset_key not in self._asset_partition_count_cache[after_cursor]
         ):
-            self._asset_partition_count_cache[after_cursor][asset_key] = (
-                self.instance.get_materialization_count_by_partition(
-                    asset_keys=[asset_key], after_cursor=after_cursor
-                )[asset_key]
-            )
+            with self._timed_query():
+                self._asset_partition_count_cache[after_cursor][asset_key] = (
+                    self.instance.get_materialization_count_by_partition(
+                        asset_keys=[asset_key], after_cursor=after_cursor
+                    )[asset_key]
+                )
         return self._asset_partition_count_cache[after_cursor][asset_key]
 
     def get_materialized_partitions(
@@ -531,9 +596,10 @@ def get_materialized_partitions(
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Returns a list of partitions for a partitions definition."""
         if partitions_def_name not in self._dynamic_partitions_cache:
-            self._dynamic_partitions_cache[partitions_def_name] = (
-                self.instance.get_dynamic_partitions(partitions_def_name)
-            )
+            with self._timed_query():
+                self._dynamic_partitions_cache[partitions_def_name] = (
+                    self.instance.get_dynamic_partitions(partitions_def_name)
+                )
         return self._dynamic_partitions_cache[partitions_def_name]
 
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
@@ -627,12 +693,12 @@ def asset_partitions_with_newly_updated_parents_and_new_latest_storage_id(
                     else:
                         # we are mapping from the partitions of the parent asset to the partitions of
                         # the child asset
-                        partition_mapping = self.asset_graph.get_partition_mapping(child, asset_key)
                         child_partitions_subset = (
-                            partition_mapping.get_downstream_partitions_for_partitions(
-                                partitions_subset,
-                                downstream_partitions_def=child_partitions_def,
+                            self.asset_graph.get_child_partitions_subset_of_parent(
                                 dynamic_partitions_store=self,
+                                parent_partitions_subset=partitions_subset,
+                                parent_asset_key=asset_key,
+                                child_asset_key=child,
                                 current_time=self.evaluation_time,
                             )
                         )
@@ -704,22 +770,23 @@ def _asset_partitions_data_versions(
                 else {}
             )
         else:
-            query_result = self.instance._event_storage.get_latest_tags_by_partition(  # noqa
-                asset_key,
-                event_type=self._event_type_for_key(asset_key),
-                tag_keys=[DATA_VERSION_TAG],
-                after_cursor=after_cursor,
-                before_cursor=before_cursor,
-                asset_partitions=(
-                    [
-                        asset_partition.partition_key
-                        for asset_partition in asset_partitions
-                        if asset_partition.partition_key is not None
-                    ]
-                    if asset_partitions is not None
-                    else None
-                ),
-            )
+            with self._timed_query():
+                query_result = self.instance._event_storage.get_latest_tags_by_partition(  # noqa
+                    asset_key,
+                    event_type=self._event_type_for_key(asset_key),
+                    tag_keys=[DATA_VERSION_TAG],
+                    after_cursor=after_cursor,
+                    before_cursor=before_cursor,
+                    asset_partitions=(
+                        [
+                            asset_partition.partition_key
+                            for asset_partition in asset_partitions
+                            if asset_partition.partition_key is not None
+                        ]
+                        if asset_partitions is not None
+                        else None
+                    ),
+                )
             return {
                 AssetKeyPartitionKey(asset_key, partition_key): (
                     DataVersion(tags[DATA_VERSION_TAG]) if tags.get(DATA_VERSION_TAG) else None
@@ -1,9 +1,19 @@
 import sys
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
-from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
+from dagster import (
+    IntMetadataValue,
+    TextMetadataValue,
+    _check as check,
+    job,
+    op,
+    repository,
+)
+from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.snapshot_repository import (
+    RepositorySnapshotCache,
     sync_get_streaming_external_repositories_data_grpc,
 )
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -53,6 +63,42 @@ def test_streaming_external_repositories_error(instance):
             sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
 
 
+def test_streaming_external_repositories_snapshot_cache(instance, tmpdir):
+    with get_bar_repo_code_location(instance) as code_location:
+        list_repositories_response = sync_list_repositories_grpc(code_location.client)
+        snapshot_ids = check.not_none(list_repositories_response.repository_snapshot_ids)
+        assert set(snapshot_ids.keys()) == {"bar_repo"}
+
+        snapshot_cache = RepositorySnapshotCache(cache_dir=str(tmpdir))
+        with mock.patch(
+            "dagster._api.snapshot_repository.get_repository_snapshot_cache",
+            return_value=snapshot_cache,
+        ):
+            external_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location, repository_snapshot_ids=snapshot_ids
+            )
+            assert snapshot_cache.get(snapshot_ids["bar_repo"]) == external_repo_datas["bar_repo"]
+
+            # snapshots with a known id are served from the cache instead of the server
+            with mock.patch.object(
+                code_location.client,
+                "streaming_external_repository",
+                side_effect=Exception("fetched the repository snapshot"),
+            ):
+                assert (
+                    sync_get_streaming_external_repositories_data_grpc(
+                        code_location.client, code_location, repository_snapshot_ids=snapshot_ids
+                    )["bar_repo"]
+                    is external_repo_datas["bar_repo"]
+                )
+
+                # a fresh process reads the snapshot from the cache directory
+                assert (
+                    RepositorySnapshotCache(cache_dir=str(tmpdir)).get(snapshot_ids["bar_repo"])
+                    == external_repo_datas["bar_repo"]
+                )
+
+
 @op
 def do_something():
     return 1
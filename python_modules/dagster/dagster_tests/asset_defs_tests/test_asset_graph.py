@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import Optional
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pendulum
@@ -559,3 +560,112 @@ def include_all(asset_key, partitions_subset):
         )
         == expected_asset_graph_subset
     )
+
+
+def test_get_partitions_subsets_fan_out_fan_in():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+    hourly_partitions_def = HourlyPartitionsDefinition(start_date="2022-01-01-00:00")
+
+    @asset(partitions_def=daily_partitions_def)
+    def parent():
+        ...
+
+    @asset(partitions_def=hourly_partitions_def)
+    def child(parent):
+        ...
+
+    asset_graph = AssetGraph.from_assets([parent, child])
+    with instance_for_test() as instance:
+        current_time = pendulum.now("UTC")
+
+        child_partitions_subset = asset_graph.get_child_partitions_subset_of_parent(
+            instance,
+            daily_partitions_def.subset_with_partition_keys(["2022-01-03", "2022-01-04"]),
+            parent.key,
+            child.key,
+            current_time,
+        )
+        assert set(child_partitions_subset.get_partition_keys()) == {
+            f"2022-01-0{day}-{str(hour).zfill(2)}:00" for day in [3, 4] for hour in range(24)
+        }
+
+        parent_partitions_result = asset_graph.get_parent_partitions_subset_for_child(
+            child_partitions_subset,
+            parent.key,
+            child.key,
+            dynamic_partitions_store=instance,
+            current_time=current_time,
+        )
+        assert set(parent_partitions_result.partitions_subset.get_partition_keys()) == {
+            "2022-01-03",
+            "2022-01-04",
+        }
+        assert parent_partitions_result.required_but_nonexistent_partition_keys == []
+
+
+def test_bfs_filter_asset_partitions_maps_partitions_in_batches():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+    hourly_partitions_def = HourlyPartitionsDefinition(start_date="2022-01-01-00:00")
+
+    @asset(partitions_def=daily_partitions_def)
+    def daily_asset():
+        ...
+
+    @asset(partitions_def=hourly_partitions_def)
+    def hourly_asset(daily_asset):
+        ...
+
+    @asset(
+        partitions_def=hourly_partitions_def,
+        ins={
+            "hourly_self_dependent_asset": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+            )
+        },
+    )
+    def hourly_self_dependent_asset(hourly_asset, hourly_self_dependent_asset):
+        ...
+
+    asset_graph = AssetGraph.from_assets([daily_asset, hourly_asset, hourly_self_dependent_asset])
+    initial_asset_partitions = {
+        AssetKeyPartitionKey(daily_asset.key, partition_key)
+        for partition_key in ["2022-01-01", "2022-01-02", "2022-01-03"]
+    }
+
+    with instance_for_test() as instance:
+        with mock.patch.object(
+            asset_graph,
+            "get_child_partitions_subset_of_parent",
+            wraps=asset_graph.get_child_partitions_subset_of_parent,
+        ) as get_child_partitions_subset_mock:
+            result = asset_graph.bfs_filter_asset_partitions(
+                instance,
+                lambda asset_partitions, _: True,
+                initial_asset_partitions,
+                evaluation_time=create_pendulum_time(2022, 1, 5),
+            )
+
+        expected_hourly_partition_keys = {
+            f"2022-01-0{day}-{str(hour).zfill(2)}:00" for day in [1, 2, 3] for hour in range(24)
+        }
+        assert {
+            asset_partition
+            for asset_partition in result
+            if asset_partition.asset_key != hourly_self_dependent_asset.key
+        } == initial_asset_partitions | {
+            AssetKeyPartitionKey(hourly_asset.key, partition_key)
+            for partition_key in expected_hourly_partition_keys
+        }
+        assert {
+            AssetKeyPartitionKey(hourly_self_dependent_asset.key, partition_key)
+            for partition_key in expected_hourly_partition_keys
+        } <= result
+
+        # the daily partitions are mapped to the hourly asset in a single call, and the hourly
+        # partitions are mapped to their child in a single call
+        assert [
+            call.args[2:4] for call in get_child_partitions_subset_mock.call_args_list
+        ].count((daily_asset.key, hourly_asset.key)) == 1
+        assert [
+            call.args[2:4] for call in get_child_partitions_subset_mock.call_args_list
+        ].count((hourly_asset.key, hourly_self_dependent_asset.key)) == 1
@@ -1,11 +1,23 @@
+from typing import cast
+
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
 from dagster._core.definitions.partition import DefaultPartitionsSubset
+from dagster._core.definitions.partition_key_index import PartitionKeyIndex
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsSubset,
 )
-from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.errors import (
+    DagsterDefinitionChangedDeserializationError,
+    DagsterInvalidDeserializationVersionError,
+    DagsterInvalidInvocationError,
+)
 
 
 def test_default_subset_cannot_deserialize_invalid_version():
@@ -78,3 +90,70 @@ def test_empty_subsets():
     assert type(composite.empty_subset()) is MultiPartitionsSubset
     assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
+
+
+def test_default_subset_bitmap_operations():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(1000)])
+    key_index = PartitionKeyIndex(partitions_def.get_partition_keys())
+
+    evens = DefaultPartitionsSubset.from_bitmap(
+        partitions_def, key_index, key_index.get_bitmap(str(i) for i in range(0, 1000, 2))
+    )
+    first_half = DefaultPartitionsSubset.from_bitmap(
+        partitions_def, key_index, key_index.get_bitmap(str(i) for i in range(500))
+    )
+    assert len(evens) == 500
+    assert "2" in evens and "3" not in evens
+
+    union = evens | first_half
+    assert len(union) == 750
+    assert union == partitions_def.empty_subset().with_partition_keys(
+        set(evens.get_partition_keys()) | set(first_half.get_partition_keys())
+    )
+
+    difference = evens - first_half
+    assert len(difference) == 250
+    assert set(difference.get_partition_keys()) == {str(i) for i in range(500, 1000, 2)}
+    assert set(difference.get_partition_keys_not_in_subset()) == set(
+        partitions_def.get_partition_keys()
+    ) - set(difference.get_partition_keys())
+
+    assert len(evens.with_partition_keys(["1", "3"])) == 502
+    # keys outside of the index fall back to a set of keys
+    assert set(evens.with_partition_keys(["foo"]).get_partition_keys()) == set(
+        evens.get_partition_keys()
+    ) | {"foo"}
+
+
+def test_default_subset_bitmap_serialization():
+    partitions_def = StaticPartitionsDefinition(["foo", "bar", "baz", "qux"])
+    key_index = PartitionKeyIndex(partitions_def.get_partition_keys())
+    subset = partitions_def.empty_subset().with_partition_keys(["foo", "baz"])
+
+    serialized = cast(DefaultPartitionsSubset, subset).serialize_bitmap(key_index)
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+
+    deserialized = partitions_def.deserialize_subset(serialized)
+    assert deserialized.get_partition_keys() == {"baz", "foo"}
+    assert deserialized == subset
+
+    with pytest.raises(DagsterDefinitionChangedDeserializationError):
+        StaticPartitionsDefinition(["foo", "bar", "baz"]).deserialize_subset(serialized)
+    # the same number of partition keys, in a different order
+    with pytest.raises(DagsterDefinitionChangedDeserializationError):
+        StaticPartitionsDefinition(["bar", "foo", "baz", "qux"]).deserialize_subset(serialized)
+
+
+def test_dynamic_subset_bitmap_serialization():
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+    key_index = PartitionKeyIndex(["apple", "banana"])
+    serialized = DefaultPartitionsSubset.from_bitmap(
+        partitions_def, key_index, key_index.get_bitmap(["banana"])
+    ).serialize_bitmap(key_index)
+
+    deserialized = DefaultPartitionsSubset.from_serialized(partitions_def, serialized, key_index)
+    assert deserialized.get_partition_keys() == {"banana"}
+
+    # the partition keys of a named dynamic partitions definition come from the instance
+    with pytest.raises(DagsterInvalidInvocationError):
+        partitions_def.deserialize_subset(serialized)
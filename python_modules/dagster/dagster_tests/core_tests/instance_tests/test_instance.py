@@ -726,12 +726,11 @@ def test_configurable_class_missing_methods():
 @patch("dagster._core.storage.partition_status_cache.get_and_update_asset_status_cache_value")
 def test_get_status_by_partition(mock_get_and_update):
     mock_cached_value = MagicMock(spec=AssetStatusCacheValue)
-    mock_cached_value.deserialize_materialized_partition_subsets.return_value = [
-        "2023-06-01",
-        "2023-06-02",
-    ]
-    mock_cached_value.deserialize_failed_partition_subsets.return_value = ["2023-06-15"]
-    mock_cached_value.deserialize_in_progress_partition_subsets.return_value = ["2023-07-01"]
+    mock_cached_value.deserialize_partition_subsets.return_value = (
+        ["2023-06-01", "2023-06-02"],
+        ["2023-06-15"],
+        ["2023-07-01"],
+    )
     mock_get_and_update.return_value = mock_cached_value
     with instance_for_test() as instance:
         partition_status = instance.get_status_by_partition(
@@ -0,0 +1,161 @@
+import threading
+import time
+from typing import List, Sequence
+from unittest import mock
+
+from dagster import file_relative_path, job, repository
+from dagster._core.host_representation.origin import (
+    CodeLocationOrigin,
+    RegisteredCodeLocationOrigin,
+)
+from dagster._core.test_utils import instance_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import PythonFileTarget, WorkspaceLoadTarget
+from dagster._core.workspace.workspace import CodeLocationEntry, CodeLocationLoadStatus
+
+
+@job
+def noop_job():
+    pass
+
+
+@repository
+def repo():
+    return [noop_job]
+
+
+class _MutableTarget(WorkspaceLoadTarget):
+    def __init__(self, targets: List[PythonFileTarget]):
+        self.targets = targets
+
+    def create_origins(self) -> Sequence[CodeLocationOrigin]:
+        return [origin for target in self.targets for origin in target.create_origins()]
+
+
+class _RegisteredTarget(WorkspaceLoadTarget):
+    def __init__(self, location_names: Sequence[str]):
+        self.location_names = location_names
+
+    def create_origins(self) -> Sequence[CodeLocationOrigin]:
+        return [RegisteredCodeLocationOrigin(name) for name in self.location_names]
+
+
+def _loaded_entry(origin: CodeLocationOrigin) -> CodeLocationEntry:
+    return CodeLocationEntry(
+        origin=origin,
+        code_location=None,
+        load_error=None,
+        load_status=CodeLocationLoadStatus.LOADED,
+        display_metadata={},
+        update_timestamp=time.time(),
+    )
+
+
+def _target(location_name: str, attribute: str = "repo") -> PythonFileTarget:
+    return PythonFileTarget(
+        python_file=file_relative_path(__file__, "test_process_context.py"),
+        attribute=attribute,
+        working_directory=None,
+        location_name=location_name,
+    )
+
+
+def test_load_locations_concurrently():
+    load_target = _MutableTarget(
+        [_target("loc_one"), _target("loc_error", attribute="missing_repo"), _target("loc_two")]
+    )
+    with instance_for_test(
+        overrides={"code_servers": {"max_concurrent_location_loads": 2}}
+    ) as instance:
+        assert instance.code_server_max_concurrent_location_loads == 2
+
+        with WorkspaceProcessContext(instance, load_target) as process_context:
+            snapshot = process_context.create_snapshot()
+
+            # locations keep the order of the workspace
+            assert list(snapshot) == ["loc_one", "loc_error", "loc_two"]
+            assert all(
+                entry.load_status == CodeLocationLoadStatus.LOADED for entry in snapshot.values()
+            )
+            assert process_context.has_code_location("loc_one")
+            assert process_context.has_code_location("loc_two")
+            assert process_context.has_code_location_error("loc_error")
+
+            # locations that are removed from the workspace are dropped on reload, and new
+            # locations are added
+            load_target.targets = [_target("loc_two"), _target("loc_three")]
+            process_context.reload_workspace()
+
+            assert process_context.code_location_names == ["loc_two", "loc_three"]
+            assert process_context.has_code_location("loc_two")
+            assert process_context.has_code_location("loc_three")
+
+
+def test_max_concurrent_location_loads():
+    lock = threading.Lock()
+    num_active = 0
+    max_active = 0
+
+    def _load_location(origin, reload):
+        nonlocal num_active, max_active
+        with lock:
+            num_active += 1
+            max_active = max(max_active, num_active)
+        time.sleep(0.5)
+        with lock:
+            num_active -= 1
+        return _loaded_entry(origin)
+
+    with instance_for_test(
+        overrides={"code_servers": {"max_concurrent_location_loads": 2}}
+    ) as instance, mock.patch.object(
+        WorkspaceProcessContext, "_load_location", side_effect=_load_location
+    ):
+        start_time = time.time()
+        with WorkspaceProcessContext(
+            instance, _RegisteredTarget([f"loc_{i}" for i in range(4)])
+        ) as process_context:
+            # two at a time, so two rounds of loads rather than four
+            assert time.time() - start_time < 1.9
+            assert max_active == 2
+            assert all(
+                entry.load_status == CodeLocationLoadStatus.LOADED
+                for entry in process_context.create_snapshot().values()
+            )
+
+
+def test_load_in_background():
+    slow_location_can_finish = threading.Event()
+
+    def _load_location(origin, reload):
+        if origin.location_name == "slow_loc":
+            slow_location_can_finish.wait(30)
+        return _loaded_entry(origin)
+
+    with instance_for_test() as instance, mock.patch.object(
+        WorkspaceProcessContext, "_load_location", side_effect=_load_location
+    ):
+        with WorkspaceProcessContext(
+            instance, _RegisteredTarget(["slow_loc", "fast_loc"]), load_in_background=True
+        ) as process_context:
+            # the fast location becomes usable while the slow one is still loading
+            start_time = time.time()
+            while (
+                process_context.create_snapshot()["fast_loc"].load_status
+                != CodeLocationLoadStatus.LOADED
+            ):
+                assert time.time() - start_time < 30, "fast location never loaded"
+                time.sleep(0.1)
+
+            assert (
+                process_context.create_snapshot()["slow_loc"].load_status
+                == CodeLocationLoadStatus.LOADING
+            )
+            assert not process_context.wait_for_workspace_to_load(timeout=0.1)
+
+            slow_location_can_finish.set()
+            assert process_context.wait_for_workspace_to_load(timeout=30)
+            assert (
+                process_context.create_snapshot()["slow_loc"].load_status
+                == CodeLocationLoadStatus.LOADED
+            )
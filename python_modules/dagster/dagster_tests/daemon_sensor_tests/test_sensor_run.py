@@ -200,6 +200,12 @@ def custom_interval_sensor(_context):
     return SkipReason()
 
 
+@sensor(job_name="the_job")
+def slow_sensor(_context):
+    time.sleep(3)
+    return SkipReason()
+
+
 @sensor(job_name="the_job")
 def skip_cursor_sensor(context):
     if not context.cursor:
@@ -676,6 +682,7 @@ def the_repo():
         always_on_sensor,
         run_key_sensor,
         custom_interval_sensor,
+        slow_sensor,
         skip_cursor_sensor,
         run_cursor_sensor,
         asset_foo_sensor,
@@ -866,7 +873,14 @@ def asset_sensor_repo():
 FUTURES_TIMEOUT = 75
 
 
-def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=FUTURES_TIMEOUT):
+def evaluate_sensors(
+    workspace_context,
+    executor,
+    submit_executor=None,
+    timeout=FUTURES_TIMEOUT,
+    max_concurrent_ticks_per_location=None,
+    evaluation_timeout=None,
+):
     logger = get_default_daemon_logger("SensorDaemon")
     futures = {}
     list(
@@ -876,6 +890,8 @@ def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=
             threadpool_executor=executor,
             sensor_tick_futures=futures,
             submit_threadpool_executor=submit_executor,
+            max_concurrent_ticks_per_location=max_concurrent_ticks_per_location,
+            evaluation_timeout=evaluation_timeout,
         )
     )
 
@@ -1457,6 +1473,72 @@ def test_custom_interval_sensor(executor, instance, workspace_context, external_
         validate_tick(ticks[0], external_sensor, expected_datetime, TickStatus.SKIPPED)
 
 
+def test_sensor_evaluation_timeout(executor, instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=28, tz="UTC"), "US/Central"
+    )
+    with pendulum.test(freeze_datetime):
+        external_sensor = external_repo.get_external_sensor("slow_sensor")
+        instance.add_instigator_state(
+            InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+
+        evaluate_sensors(workspace_context, executor, evaluation_timeout=1)
+        ticks = instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+        assert len(ticks) == 1
+        validate_tick(ticks[0], external_sensor, freeze_datetime, TickStatus.SKIPPED)
+        assert (
+            ticks[0].skip_reason
+            == "Sensor evaluation did not finish within 1 seconds, so its result was not used."
+        )
+
+
+def test_max_concurrent_ticks_per_location(instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=28, tz="UTC"), "US/Central"
+    )
+    external_sensors = [
+        external_repo.get_external_sensor("simple_sensor"),
+        external_repo.get_external_sensor("custom_interval_sensor"),
+    ]
+    with pendulum.test(freeze_datetime), ThreadPoolExecutor(max_workers=2) as executor:
+        for external_sensor in external_sensors:
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+        # only one of the two sensors in the location is evaluated per iteration
+        evaluate_sensors(workspace_context, executor, max_concurrent_ticks_per_location=1)
+        num_ticks = [
+            len(
+                instance.get_ticks(
+                    external_sensor.get_external_origin_id(), external_sensor.selector_id
+                )
+            )
+            for external_sensor in external_sensors
+        ]
+        assert sorted(num_ticks) == [0, 1]
+
+        # the sensor that was just evaluated is within its minimum interval, so the other sensor
+        # is evaluated next
+        evaluate_sensors(workspace_context, executor, max_concurrent_ticks_per_location=1)
+        for external_sensor in external_sensors:
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == 1
+
+
 def test_custom_interval_sensor_with_offset(
     monkeypatch, executor, instance, workspace_context, external_repo
 ):
@@ -1062,6 +1062,50 @@ def test_asset_backfill_submit_runs_in_chunks(
     assert instance.get_runs_count() == num_partitions
 
 
+def test_asset_backfill_unchanged_iteration_does_not_update_backfill(
+    instance: DagsterInstance, workspace_context: WorkspaceProcessContext
+):
+    asset_selection = [AssetKey("daily_1"), AssetKey("daily_2")]
+    target_partitions = daily_partitions_def.get_partition_keys()[0:2]
+    backfill_id = "backfill_with_unfinished_runs"
+
+    instance.add_backfill(
+        PartitionBackfill.from_asset_partitions(
+            asset_graph=ExternalAssetGraph.from_workspace(
+                workspace_context.create_request_context()
+            ),
+            backfill_id=backfill_id,
+            tags={},
+            backfill_timestamp=pendulum.now().timestamp(),
+            asset_selection=asset_selection,
+            partition_names=target_partitions,
+            dynamic_partitions_store=instance,
+            all_partitions=False,
+        )
+    )
+
+    # the requested runs are never launched, so they never finish
+    with mock.patch("dagster._core.execution.asset_backfill.submit_run_request"):
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+        backfill = instance.get_backfill(backfill_id)
+        assert backfill
+        assert backfill.status == BulkActionStatus.REQUESTED
+
+        with mock.patch(
+            "dagster._core.instance.DagsterInstance.update_backfill"
+        ) as update_backfill_mock:
+            list(
+                execute_backfill_iteration(
+                    workspace_context, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+            assert update_backfill_mock.call_count == 0
+
+
 def test_asset_backfill_mid_iteration_cancel(
     instance: DagsterInstance, workspace_context: WorkspaceProcessContext
 ):
@@ -23,6 +23,8 @@
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.monitoring.run_monitoring import (
+    execute_run_monitoring_iteration,
+    get_run_worker_health_results,
     monitor_canceling_run,
     monitor_started_run,
     monitor_starting_run,
@@ -40,6 +42,9 @@ def __init__(self, inst_data: Optional[ConfigurableClassData] = None):
         self.launch_run_calls = 0
         self.resume_run_calls = 0
         self.termination_calls = []
+        self.bulk_check_results: Optional[Mapping[str, CheckRunHealthResult]] = None
+        self.should_except_bulk_check = False
+        self.bulk_check_calls = 0
         super().__init__()
 
     @property
@@ -88,6 +93,20 @@ def check_run_worker_health(self, _run):
             else CheckRunHealthResult(WorkerStatus.NOT_FOUND, "")
         )
 
+    @property
+    def supports_bulk_check_run_worker_health(self):
+        return self.bulk_check_results is not None
+
+    def bulk_check_run_worker_health(self, runs):
+        self.bulk_check_calls += 1
+        if self.should_except_bulk_check:
+            raise Exception("oof")
+        return {
+            run.run_id: self.bulk_check_results[run.run_id]
+            for run in runs
+            if run.run_id in self.bulk_check_results
+        }
+
 
 @pytest.fixture
 def instance():
@@ -280,6 +299,56 @@ def test_monitor_started(
     assert run_launcher.resume_run_calls == 3
 
 
+def test_get_run_worker_health_results(instance: DagsterInstance, logger: Logger):
+    runs = [
+        create_run_for_test(instance, job_name="foo", status=DagsterRunStatus.STARTED)
+        for _ in range(3)
+    ]
+    run_launcher = cast(TestRunLauncher, instance.run_launcher)
+
+    not_found = CheckRunHealthResult(WorkerStatus.NOT_FOUND, "")
+    running = CheckRunHealthResult(WorkerStatus.RUNNING, "")
+
+    assert get_run_worker_health_results(instance, runs, logger) == {
+        run.run_id: not_found for run in runs
+    }
+    assert run_launcher.bulk_check_calls == 0
+
+    # runs missing from the bulk check are checked individually
+    run_launcher.bulk_check_results = {runs[0].run_id: running}
+    assert get_run_worker_health_results(instance, runs, logger) == {
+        runs[0].run_id: running,
+        runs[1].run_id: not_found,
+        runs[2].run_id: not_found,
+    }
+    assert run_launcher.bulk_check_calls == 1
+
+    run_launcher.should_except_bulk_check = True
+    assert get_run_worker_health_results(instance, runs, logger) == {
+        run.run_id: not_found for run in runs
+    }
+    assert run_launcher.bulk_check_calls == 2
+
+
+def test_monitoring_iteration_bulk_health_check(
+    instance: DagsterInstance, workspace_context: WorkspaceProcessContext, logger: Logger
+):
+    runs = [
+        create_run_for_test(instance, job_name="foo", status=DagsterRunStatus.STARTED)
+        for _ in range(3)
+    ]
+    run_launcher = cast(TestRunLauncher, instance.run_launcher)
+    run_launcher.bulk_check_results = {
+        run.run_id: CheckRunHealthResult(WorkerStatus.RUNNING, "") for run in runs[:2]
+    }
+
+    list(execute_run_monitoring_iteration(workspace_context, logger))
+
+    # only the run that was missing from the bulk check was found to be unhealthy and resumed
+    assert run_launcher.bulk_check_calls == 1
+    assert run_launcher.resume_run_calls == 1
+
+
 def test_long_running_termination(
     instance: DagsterInstance, workspace_context: WorkspaceProcessContext, logger: Logger
 ):
@@ -1,6 +1,7 @@
 import time
 from contextlib import contextmanager
 from typing import Iterator
+from unittest import mock
 
 import pytest
 from dagster._core.events import DagsterEvent, DagsterEventType
@@ -834,3 +835,25 @@ def test_key_limit_with_extra_tags(use_threads, workspace_context, daemon, job_h
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_queued_runs_refreshed_incrementally(instance, workspace_context, job_handle):
+    daemon = QueuedRunCoordinatorDaemon(interval_seconds=1)
+    create_queued_run(instance, job_handle, run_id="run-1")
+
+    list(daemon.run_iteration(workspace_context))
+    assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+    create_queued_run(instance, job_handle, run_id="run-2")
+    create_queued_run(instance, job_handle, run_id="run-3")
+    instance.report_run_canceled(instance.get_run_by_id("run-3"))
+
+    # only runs updated since the last iteration are loaded from storage
+    with mock.patch.object(
+        instance, "get_run_records", wraps=instance.get_run_records
+    ) as get_run_records_mock:
+        list(daemon.run_iteration(workspace_context))
+
+    assert get_run_ids(instance.run_launcher.queue()) == ["run-1", "run-2"]
+    assert get_run_records_mock.call_count == 1
+    assert get_run_records_mock.call_args.kwargs["filters"].updated_after is not None
@@ -1,5 +1,17 @@
+import logging
+
 import pytest
-from dagster import AssetKey
+from dagster import (
+    AssetKey,
+    AutoMaterializePolicy,
+    DailyPartitionsDefinition,
+    asset,
+    materialize,
+)
+from dagster._core.definitions.asset_daemon_context import AssetDaemonContext
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.instance_for_test import instance_for_test
 from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.tags import PARTITION_NAME_TAG
@@ -255,3 +267,48 @@ def sort_run_key_fn(run):
         assert len(evaluations) == 1
         assert evaluations[0].evaluation.asset_key == AssetKey("asset4")
         assert evaluations[0].evaluation.run_ids == {run.run_id for run in sorted_runs}
+        assert evaluations[0].evaluation.num_queries is not None
+        assert evaluations[0].evaluation.query_duration is not None
+
+
+def test_prefetch_latest_storage_ids_by_partition(instance):
+    partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+
+    @asset(partitions_def=partitions_def)
+    def upstream():
+        pass
+
+    @asset(partitions_def=partitions_def, auto_materialize_policy=AutoMaterializePolicy.eager())
+    def downstream(upstream):
+        pass
+
+    for partition_key in ["2023-01-01", "2023-01-02"]:
+        materialize([upstream], instance=instance, partition_key=partition_key)
+
+    context = AssetDaemonContext(
+        instance=instance,
+        asset_graph=AssetGraph.from_assets([upstream, downstream]),
+        cursor=AssetDaemonCursor.empty(),
+        materialize_run_tags=None,
+        observe_run_tags=None,
+        auto_observe=False,
+        target_asset_keys=None,
+        respect_materialization_data_versions=False,
+        logger=logging.getLogger("dagster.amp"),
+    )
+    instance_queryer = context.instance_queryer
+    num_queries = instance_queryer.num_queries
+    assert num_queries > 0
+
+    # the latest storage ids of the partitions were fetched up front
+    for partition_key in ["2023-01-01", "2023-01-02"]:
+        assert instance_queryer.get_latest_materialization_or_observation_storage_id(
+            AssetKeyPartitionKey(upstream.key, partition_key)
+        )
+    assert not instance_queryer.get_latest_materialization_or_observation_storage_id(
+        AssetKeyPartitionKey(downstream.key, "2023-01-01")
+    )
+    assert instance_queryer.num_queries == num_queries
+
+    context.evaluate()
+    assert set(context.query_stats_by_asset_key.keys()) == {downstream.key}
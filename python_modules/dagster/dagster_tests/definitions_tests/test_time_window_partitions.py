@@ -901,6 +901,83 @@ def test_partition_subset_with_partition_keys(initial: str, added: str):
     assert len(updated_subset) == updated_subset_str.count("+")
 
 
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition(start_date="2015-01-01"),
+        HourlyPartitionsDefinition(start_date="2015-01-01-00:00", timezone="America/New_York"),
+        TimeWindowPartitionsDefinition(
+            start="2015-01-01-00:00", fmt="%Y-%m-%d-%H:%M", cron_schedule="*/15 * * * *"
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("-", "+"),
+        ("+", "+"),
+        ("+-", "-+"),
+        ("--+++---+++--", "++---+++---++"),
+        ("-+-+-+-+-+-+-", "---+++++++---"),
+        ("+++++++++++++", "-+-+-+-+-+-+-"),
+    ],
+)
+def test_partition_subset_set_operations(
+    partitions_def: TimeWindowPartitionsDefinition, first: str, second: str
+):
+    partition_keys = partitions_def.get_partition_keys_between_indexes(0, len(first))
+
+    def _subset(case_str: str) -> TimeWindowPartitionsSubset:
+        subset = partitions_def.empty_subset().with_partition_keys(
+            [key for key, c in zip(partition_keys, case_str) if c == "+"]
+        )
+        # round trip through serialization to get a subset represented as time windows
+        return cast(
+            TimeWindowPartitionsSubset, partitions_def.deserialize_subset(subset.serialize())
+        )
+
+    first_subset = _subset(first)
+    second_subset = _subset(second)
+    first_keys = set(first_subset.get_partition_keys())
+    second_keys = set(second_subset.get_partition_keys())
+
+    for result, expected_keys in [
+        (first_subset | second_subset, first_keys | second_keys),
+        (first_subset & second_subset, first_keys & second_keys),
+        (first_subset - second_subset, first_keys - second_keys),
+    ]:
+        assert set(result.get_partition_keys()) == expected_keys
+        assert len(result) == len(expected_keys)
+        assert all(key in result for key in expected_keys)
+        assert not any(key in result for key in set(partition_keys) - expected_keys)
+
+
+def test_partition_subset_with_partition_key_range():
+    partitions_def = HourlyPartitionsDefinition(start_date="2015-01-01-00:00")
+    subset = cast(
+        TimeWindowPartitionsSubset,
+        partitions_def.empty_subset().with_partition_key_range(
+            PartitionKeyRange("2015-01-01-12:00", "2016-01-01-11:00")
+        ),
+    )
+    assert len(subset) == 365 * 24
+    assert subset.included_time_windows == [
+        time_window("2015-01-01T12:00:00", "2016-01-01T12:00:00")
+    ]
+    assert "2015-06-01-00:00" in subset
+    assert "2016-01-01-12:00" not in subset
+
+    # the range is clipped to the partitions of the partitions definition
+    subset = cast(
+        TimeWindowPartitionsSubset,
+        subset.with_partition_key_range(PartitionKeyRange("2014-12-31-00:00", "2015-01-01-23:00")),
+    )
+    assert len(subset) == 365 * 24 + 12
+    assert subset.get_partition_key_ranges() == [
+        PartitionKeyRange("2015-01-01-00:00", "2016-01-01-11:00")
+    ]
+
+
 def test_weekly_time_window_partitions_subset():
     weekly_partitions_def = WeeklyPartitionsDefinition(start_date="2022-01-01")
 
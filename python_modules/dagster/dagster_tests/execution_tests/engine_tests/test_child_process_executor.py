@@ -8,6 +8,7 @@
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventWaiter,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
@@ -105,3 +106,29 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def _execute_with_event_waiter(command):
+    event_waiter = ChildProcessEventWaiter()
+    events = []
+    for event in execute_child_process_command(multiprocessing, command, event_waiter):
+        if event is None:
+            # each wait ends as soon as the child process reports an event or exits
+            event_waiter.wait(timeout=30.0)
+        elif not isinstance(event, ChildProcessEvent):
+            events.append(event)
+    return events
+
+
+def test_long_running_command_with_event_waiter():
+    start_time = time.time()
+    assert _execute_with_event_waiter(LongRunningCommand()) == [1]
+    assert time.time() - start_time < 30.0
+
+
+def test_crashy_process_with_event_waiter():
+    start_time = time.time()
+    with pytest.raises(ChildProcessCrashException) as exc:
+        _execute_with_event_waiter(CrashyCommand())
+    assert exc.value.exit_code == 1
+    assert time.time() - start_time < 30.0
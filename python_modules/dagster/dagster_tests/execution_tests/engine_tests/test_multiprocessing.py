@@ -515,3 +515,53 @@ def get_dynamic_op_failure_job():
 )
 def test_dynamic_failure_retry(job_fn, config_fn):
     assert_expected_failure_behavior(job_fn, config_fn)
+
+
+@op
+def return_pid():
+    return os.getpid()
+
+
+@job
+def pid_job():
+    for i in range(6):
+        return_pid.alias(f"return_pid_{i}")()
+
+
+def test_reuse_processes():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(pid_job),
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "reuse_processes": True,
+                            "max_steps_per_process": 4,
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            pids = [result.output_for_node(f"return_pid_{i}") for i in range(6)]
+            # each worker process executes up to 4 steps before it is replaced
+            assert len(set(pids)) == 2
+            assert os.getpid() not in pids
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_reuse_processes():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config={"execution": {"config": {"multiprocess": {"reuse_processes": True}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
@@ -1,7 +1,14 @@
 from dagster import reconstructable
 from dagster._core.definitions import op
 from dagster._core.definitions.decorators.job_decorator import job
-from dagster._core.execution.api import execute_job
+from dagster._core.execution.api import create_execution_plan, execute_job
+from dagster._core.execution.plan.active import (
+    critical_path_sort_key_fn,
+    get_critical_path_lengths,
+    get_step_durations_from_stats,
+)
+from dagster._core.execution.retries import RetryMode
+from dagster._core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
 from dagster._core.test_utils import instance_for_test
 
 
@@ -62,3 +69,87 @@ def test_priorities_mp():
                 "low",
                 "low_2",
             ]
+
+
+@op
+def emit(_):
+    return 1
+
+
+@op
+def chain(_, num):
+    return num
+
+
+@job
+def critical_path_test():
+    emit.alias("single")()
+    chain.alias("chain_3")(chain.alias("chain_2")(emit.alias("chain_1")()))
+    high.alias("high_single")()
+
+
+def test_critical_path_lengths():
+    plan = create_execution_plan(critical_path_test)
+    assert get_critical_path_lengths(plan) == {
+        "single": 1.0,
+        "chain_1": 3.0,
+        "chain_2": 2.0,
+        "chain_3": 1.0,
+        "high_single": 1.0,
+    }
+    assert get_critical_path_lengths(plan, {"single": 10.0, "chain_2": 0.5})["chain_1"] == 2.5
+
+
+def _skip_remaining_steps(active_execution, steps):
+    while steps:
+        _ = [active_execution.mark_skipped(step.key) for step in steps]
+        steps = active_execution.get_steps_to_skip()
+
+
+def test_critical_path_sort_key():
+    plan = create_execution_plan(critical_path_test)
+    with plan.start(RetryMode.DISABLED, critical_path_sort_key_fn(plan)) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        # the priority tag still takes precedence over the critical path
+        assert [step.key for step in steps] == ["high_single", "chain_1", "single"]
+        _skip_remaining_steps(active_execution, steps)
+
+    with plan.start(
+        RetryMode.DISABLED, critical_path_sort_key_fn(plan, {"single": 10.0})
+    ) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["high_single", "single", "chain_1"]
+        _skip_remaining_steps(active_execution, steps)
+
+
+def test_step_durations_from_stats():
+    assert get_step_durations_from_stats(
+        [
+            RunStepKeyStatsSnapshot("run", "single", StepEventStatus.SUCCESS, 1.0, 4.0),
+            RunStepKeyStatsSnapshot("run", "failed", StepEventStatus.FAILURE, 1.0, 4.0),
+            RunStepKeyStatsSnapshot("run", "in_progress", StepEventStatus.IN_PROGRESS, 1.0),
+            RunStepKeyStatsSnapshot("run", "mapped[a]", StepEventStatus.SUCCESS, 1.0, 2.0),
+            RunStepKeyStatsSnapshot("run", "mapped[b]", StepEventStatus.SUCCESS, 1.0, 4.0),
+        ]
+    ) == {"single": 3.0, "mapped[?]": 2.0}
+
+
+def test_critical_path_mp():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(critical_path_test)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {"max_concurrent": 1, "prioritize_critical_path": True}
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert [str(event.node_handle) for event in result.get_step_success_events()][:2] == [
+                "high_single",
+                "chain_1",
+            ]
@@ -23,14 +23,14 @@
 )
 from dagster._core.definitions.repository_definition import AssetsDefinitionCacheableData
 from dagster._core.events import DagsterEventType
-from dagster._core.execution.api import ReexecutionOptions, execute_job
+from dagster._core.execution.api import ReexecutionOptions, create_execution_plan, execute_job
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.step_delegating import (
     CheckStepHealthResult,
     StepDelegatingExecutor,
     StepHandler,
 )
-from dagster._core.test_utils import instance_for_test
+from dagster._core.test_utils import create_run_for_test, instance_for_test
 from dagster._utils.merger import merge_dicts
 
 from .retry_jobs import (
@@ -226,6 +226,49 @@ def test_execute_intervals():
     # assert TestStepHandler.check_step_health_count >= 3
 
 
+def test_wake_on_new_events():
+    executor = StepDelegatingExecutor(
+        TestStepHandler(), retries=RetryMode.DISABLED, sleep_seconds=60.0, wake_on_new_events=True
+    )
+    with DagsterInstance.ephemeral() as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        assert executor._pop_events(instance, run.run_id) == []  # noqa: SLF001
+
+        with executor._watch_for_new_events(instance, run.run_id):  # noqa: SLF001
+            instance.report_engine_event("new event", run)
+
+            start_time = time.time()
+            executor._wait_for_new_events(  # noqa: SLF001
+                create_execution_plan(foo_job).start(RetryMode.DISABLED)
+            )
+            assert time.time() - start_time < 60
+
+        # only the new event is read after the cursor
+        assert [
+            event.message for event in executor._pop_events(instance, run.run_id)  # noqa: SLF001
+        ] == ["new event"]
+
+
+def test_wait_for_new_events_until_retry():
+    executor = StepDelegatingExecutor(
+        TestStepHandler(), retries=RetryMode.ENABLED, sleep_seconds=60.0
+    )
+    with create_execution_plan(foo_job).start(RetryMode.ENABLED) as active_execution:
+        for step in active_execution.get_steps_to_execute():
+            active_execution.mark_up_for_retry(step.key, at_time=time.time() + 0.5)
+
+        start_time = time.time()
+        executor._wait_for_new_events(active_execution)  # noqa: SLF001
+        assert time.time() - start_time < 60
+
+        while not active_execution.is_complete:
+            for step in active_execution.get_steps_to_execute():
+                active_execution.mark_skipped(step.key)
+            for step in active_execution.get_steps_to_skip():
+                active_execution.mark_skipped(step.key)
+            active_execution.sleep_til_ready()
+
+
 @op(tags={"database": "tiny"})
 def slow_op(_):
     time.sleep(2)
@@ -490,6 +490,11 @@ class Foo(NamedTuple):
     deserialized = deserialize_value(serialized, whitelist_map=test_env)
     assert deserialized == val
 
+    # fields that are not constructor params are ignored
+    newer_serialized = '{"__class__": "Foo", "colour": "red", "shade": "dark"}'
+    deserialized = deserialize_value(newer_serialized, whitelist_map=test_env)
+    assert deserialized == val
+
 
 def test_named_tuple_old_fields() -> None:
     test_env = WhitelistMap.create()
@@ -670,6 +675,42 @@ class NumHolder(NamedTuple):
     assert x.num == roundtrip_x.num
 
 
+def test_orjson_deserialization(monkeypatch) -> None:
+    pytest.importorskip("orjson")
+    import dagster._serdes.serdes as serdes
+
+    monkeypatch.setattr(serdes, "_USE_ORJSON", True)
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Shape(Enum):
+        CIRCLE = "circle"
+
+    @_whitelist_for_serdes(whitelist_map=test_map, storage_field_names={"color": "colour"})
+    class Bar(NamedTuple):
+        color: str
+        shape: Shape
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Foo(NamedTuple):
+        bars: Sequence[Bar]
+        tags: AbstractSet[str]
+        num: float
+
+    val = Foo([Bar("red", Shape.CIRCLE)], {"a", "b"}, 1.5)
+    assert deserialize_value(serialize_value(val, test_map), whitelist_map=test_map) == val
+
+    # payloads that orjson can't parse exactly are parsed with the standard library
+    val = Foo([], set(), 98765432109876543210)
+    assert deserialize_value(serialize_value(val, test_map), whitelist_map=test_map) == val
+    serialized = serialize_value(Foo([], set(), float("nan")), test_map)
+    deserialized = deserialize_value(serialized, Foo, whitelist_map=test_map)
+    assert deserialized.num != deserialized.num
+
+    with pytest.raises(DeserializationError, match="not in the whitelist"):
+        deserialize_value('{"__class__": "Baz"}', whitelist_map=test_map)
+
+
 def test_enum_storage_name() -> None:
     test_env = WhitelistMap.create()
 
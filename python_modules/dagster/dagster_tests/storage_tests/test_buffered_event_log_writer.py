@@ -0,0 +1,189 @@
+import time
+from unittest import mock
+
+import pytest
+from dagster import AssetKey, AssetMaterialization
+from dagster._core.errors import DagsterEventLogBatchWriteError
+from dagster._core.events import (
+    DagsterEvent,
+    DagsterEventType,
+    EngineEventData,
+    StepMaterializationData,
+)
+from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.storage.event_log.buffered_writer import BufferedEventLogWriter
+from dagster._core.test_utils import instance_for_test
+
+RUN_ID = "foo"
+
+
+def create_engine_event(count: int, run_id: str = RUN_ID) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message=str(count),
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "nonce",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def create_step_success_event() -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message="success",
+        level="debug",
+        run_id=RUN_ID,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            "nonce",
+            event_specific_data=StepSuccessData(duration_ms=100.0),
+        ),
+    )
+
+
+def create_materialization_event() -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message="materialization",
+        level="debug",
+        run_id=RUN_ID,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "nonce",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(asset_key=AssetKey("foo"))
+            ),
+        ),
+    )
+
+
+def test_flush_on_buffer_size():
+    with instance_for_test() as instance:
+        storage = instance.event_log_storage
+        writer = BufferedEventLogWriter(storage, max_buffer_size=3, flush_interval_seconds=60)
+        try:
+            writer.write(create_engine_event(1))
+            writer.write(create_engine_event(2))
+            assert len(storage.get_logs_for_run(RUN_ID)) == 0
+
+            writer.write(create_engine_event(3))
+            assert [log.message for log in storage.get_logs_for_run(RUN_ID)] == ["1", "2", "3"]
+        finally:
+            writer.close()
+
+
+def test_flush_on_synchronous_event():
+    with instance_for_test() as instance:
+        storage = instance.event_log_storage
+        writer = BufferedEventLogWriter(storage, max_buffer_size=100, flush_interval_seconds=60)
+        try:
+            writer.write(create_engine_event(1))
+            assert len(storage.get_logs_for_run(RUN_ID)) == 0
+
+            writer.write(create_step_success_event())
+            assert [log.message for log in storage.get_logs_for_run(RUN_ID)] == ["1", "success"]
+        finally:
+            writer.close()
+
+
+def test_flush_on_interval():
+    with instance_for_test() as instance:
+        storage = instance.event_log_storage
+        writer = BufferedEventLogWriter(storage, max_buffer_size=100, flush_interval_seconds=0.1)
+        try:
+            writer.write(create_engine_event(1))
+
+            start_time = time.time()
+            while not storage.get_logs_for_run(RUN_ID):
+                assert time.time() - start_time < 10, "Timed out waiting for buffered events"
+                time.sleep(0.1)
+        finally:
+            writer.close()
+
+
+def test_instance_buffered_event_log_writes():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "flush_interval_seconds": 60.0}}
+    ) as instance:
+        with instance.buffered_event_log_writes():
+            for i in range(5):
+                instance.handle_new_event(create_engine_event(i))
+            assert len(instance.all_logs(RUN_ID)) == 0
+
+        assert [log.message for log in instance.all_logs(RUN_ID)] == [str(i) for i in range(5)]
+
+        # writes are no longer buffered once the context manager exits
+        instance.handle_new_event(create_engine_event(5))
+        assert len(instance.all_logs(RUN_ID)) == 6
+
+
+def test_instance_buffered_event_log_writes_disabled():
+    with instance_for_test() as instance:
+        with instance.buffered_event_log_writes():
+            instance.handle_new_event(create_engine_event(0))
+            assert len(instance.all_logs(RUN_ID)) == 1
+
+
+def test_retry_after_index_write_failure():
+    with instance_for_test() as instance:
+        storage = instance.event_log_storage
+        writer = BufferedEventLogWriter(storage, max_buffer_size=100, flush_interval_seconds=60)
+        try:
+            writer.write(create_engine_event(1))
+            writer.write(create_materialization_event())
+
+            # the event log rows are committed before the asset index write fails
+            with mock.patch.object(
+                storage, "store_asset_event", side_effect=Exception("index write failed")
+            ):
+                with pytest.raises(DagsterEventLogBatchWriteError):
+                    writer.flush()
+
+            # the stored events are not written again
+            writer.flush()
+            assert [log.message for log in storage.get_logs_for_run(RUN_ID)] == [
+                "1",
+                "materialization",
+            ]
+        finally:
+            writer.close()
+
+
+def test_retry_after_partial_batch_failure():
+    with instance_for_test() as instance:
+        storage = instance.event_log_storage
+        writer = BufferedEventLogWriter(storage, max_buffer_size=100, flush_interval_seconds=60)
+        try:
+            writer.write(create_engine_event(1, run_id="run_a"))
+            writer.write(create_engine_event(2, run_id="run_b"))
+
+            # the rows for the first run are committed, and then writing the second run fails
+            original_get_event_insert_values = storage._get_event_insert_values  # noqa: SLF001
+
+            def _get_event_insert_values(event):
+                if event.run_id == "run_b":
+                    raise Exception("write failed")
+                return original_get_event_insert_values(event)
+
+            with mock.patch.object(
+                storage, "_get_event_insert_values", side_effect=_get_event_insert_values
+            ):
+                with pytest.raises(DagsterEventLogBatchWriteError):
+                    writer.flush()
+
+            assert len(storage.get_logs_for_run("run_a")) == 1
+            assert len(storage.get_logs_for_run("run_b")) == 0
+
+            writer.flush()
+            assert len(storage.get_logs_for_run("run_a")) == 1
+            assert len(storage.get_logs_for_run("run_b")) == 1
+        finally:
+            writer.close()
@@ -2,7 +2,9 @@
 import os
 import sys
 import tempfile
+import time
 import traceback
+from unittest import mock
 
 import pytest
 import sqlalchemy
@@ -18,7 +20,7 @@
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import TestEventLogStorage, create_test_event_log_record
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -124,6 +126,25 @@ def event_log_storage(self):
             finally:
                 storage.dispose()
 
+    def test_watch_fetches_runs_in_single_query(self, storage):
+        watched = {"run_a": [], "run_b": []}
+        for run_id, events in watched.items():
+            storage.watch(run_id, None, lambda event, _cursor, events=events: events.append(event))
+
+        with mock.patch.object(
+            storage, "get_records_for_run", side_effect=Exception("fetched a single run")
+        ):
+            storage.store_event(create_test_event_log_record("a", run_id="run_a"))
+            storage.store_event(create_test_event_log_record("b", run_id="run_b"))
+
+            start_time = time.time()
+            while not all(watched.values()):
+                assert time.time() - start_time < 10, "Timed out waiting for watched events"
+                time.sleep(0.1)
+
+        assert [event.user_message for event in watched["run_a"]] == ["a"]
+        assert [event.user_message for event in watched["run_b"]] == ["b"]
+
 
 class TestLegacyStorage(TestEventLogStorage):
     __test__ = True
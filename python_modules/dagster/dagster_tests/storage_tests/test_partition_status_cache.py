@@ -1,3 +1,4 @@
+import json
 import time
 
 from dagster import (
@@ -15,6 +16,8 @@
     define_asset_job,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.partition import DefaultPartitionsSubset
+from dagster._core.definitions.partition_key_index import PartitionKeyIndex
 from dagster._core.definitions.time_window_partitions import HourlyPartitionsDefinition
 from dagster._core.events import (
     AssetMaterializationPlannedData,
@@ -788,3 +791,113 @@ def my_asset():
             asset_graph.get_partitions_def(asset_key)
         )
         assert failed_subset.get_partition_keys() == set()
+
+
+def test_dynamic_partitions_status_cached_as_bitmap():
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+
+    @asset(partitions_def=partitions_def)
+    def asset1(context):
+        if context.partition_key.startswith("fail"):
+            raise Exception()
+
+    asset_key = AssetKey("asset1")
+    asset_graph = AssetGraph.from_assets([asset1])
+    asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+    with instance_for_test() as created_instance:
+        created_instance.add_dynamic_partitions("fruits", ["apple", "banana", "fail_cherry"])
+        for partition_key in ["apple", "fail_cherry"]:
+            asset_job.execute_in_process(
+                instance=created_instance, partition_key=partition_key, raise_on_error=False
+            )
+
+        cached_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, partitions_def
+        )
+        assert cached_status
+        assert json.loads(cached_status.serialized_materialized_partition_subset)["version"] == (
+            DefaultPartitionsSubset.BITMAP_SERIALIZATION_VERSION
+        )
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def, dynamic_partitions_store=created_instance
+        ).get_partition_keys() == {"apple"}
+        assert cached_status.deserialize_failed_partition_subsets(
+            partitions_def, dynamic_partitions_store=created_instance
+        ).get_partition_keys() == {"fail_cherry"}
+
+        # values cached as lists of partition keys are updated to bitmaps
+        created_instance.update_asset_cached_status_data(
+            asset_key,
+            cached_status._replace(
+                serialized_materialized_partition_subset=partitions_def.empty_subset()
+                .with_partition_keys(["apple"])
+                .serialize(),
+                serialized_failed_partition_subset=partitions_def.empty_subset()
+                .with_partition_keys(["fail_cherry"])
+                .serialize(),
+            ),
+        )
+        asset_job.execute_in_process(instance=created_instance, partition_key="banana")
+
+        cached_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, partitions_def
+        )
+        assert cached_status
+        assert json.loads(cached_status.serialized_failed_partition_subset)["version"] == (
+            DefaultPartitionsSubset.BITMAP_SERIALIZATION_VERSION
+        )
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def, dynamic_partitions_store=created_instance
+        ).get_partition_keys() == {"apple", "banana"}
+        assert cached_status.deserialize_failed_partition_subsets(
+            partitions_def, dynamic_partitions_store=created_instance
+        ).get_partition_keys() == {"fail_cherry"}
+
+
+def test_stale_partition_status_bitmap_is_rebuilt():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_job = define_asset_job("asset_job").resolve(
+        asset_graph=AssetGraph.from_assets([asset1])
+    )
+
+    with instance_for_test() as created_instance:
+        asset_job.execute_in_process(instance=created_instance, partition_key="a")
+        cached_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, partitions_def
+        )
+        assert cached_status
+        materialized, failed, in_progress = cached_status.deserialize_partition_subsets(
+            partitions_def
+        )
+        assert materialized.get_partition_keys() == {"a"}
+        assert not failed.get_partition_keys()
+        assert not in_progress.get_partition_keys()
+
+        # a bitmap over other partition keys can't be decoded against the current keys
+        other_key_index = PartitionKeyIndex(["c", "b", "a"])
+        stale_status = cached_status._replace(
+            serialized_materialized_partition_subset=DefaultPartitionsSubset.from_bitmap(
+                partitions_def, other_key_index, other_key_index.get_bitmap(["c"])
+            ).serialize_bitmap(other_key_index)
+        )
+        assert not stale_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys()
+
+        created_instance.update_asset_cached_status_data(asset_key, stale_status)
+        asset_job.execute_in_process(instance=created_instance, partition_key="b")
+
+        cached_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, partitions_def
+        )
+        assert cached_status
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"a", "b"}
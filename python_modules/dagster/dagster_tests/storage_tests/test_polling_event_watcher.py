@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Union
@@ -138,3 +139,55 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_watch_multiple_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        watched = {"foo": [], "bar": []}
+
+        def make_callback(run_id):
+            def _callback(event, _cursor):
+                watched[run_id].append(event)
+
+            return _callback
+
+        callbacks = {run_id: make_callback(run_id) for run_id in watched}
+        for run_id, callback in callbacks.items():
+            storage.watch(run_id, None, callback)
+
+        storage.store_event(create_event(1, run_id="foo"))
+        storage.store_event(create_event(2, run_id="bar"))
+        storage.store_event(create_event(3, run_id="foo"))
+
+        attempts = 20
+        while (len(watched["foo"]) < 2 or len(watched["bar"]) < 1) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched["foo"]] == [1, 3]
+        assert [int(evt.message) for evt in watched["bar"]] == [2]
+
+        # every watched run is served by a single polling thread
+        assert (
+            len([thread for thread in threading.enumerate() if thread.name == "sql-event-watch"])
+            == 1
+        )
+
+        for run_id, callback in callbacks.items():
+            storage.end_watch(run_id, callback)
+        assert not storage._watcher.has_run_id("foo")  # noqa: SLF001
+        assert not storage._watcher.has_run_id("bar")  # noqa: SLF001
+
+
+def test_get_records_for_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        storage.store_event(create_event(1, run_id="foo"))
+        storage.store_event(create_event(2, run_id="foo"))
+        storage.store_event(create_event(3, run_id="bar"))
+
+        records = storage.get_records_for_runs({"foo": None, "bar": None, "baz": None})
+        assert sorted(int(record.event_log_entry.message) for record in records) == [1, 2, 3]
+
+        foo_records = storage.get_records_for_run("foo").records
+        records = storage.get_records_for_runs({"foo": foo_records[0].storage_id})
+        assert [int(record.event_log_entry.message) for record in records] == [2]
@@ -446,6 +446,42 @@ def test_event_log_storage_store_events_and_wipe(self, test_run_id, storage):
             storage.wipe()
             assert len(storage.get_logs_for_run(test_run_id)) == 0
 
+    def test_get_records_for_runs(self, instance, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("storage does not support fetching records for multiple runs")
+
+        run_ids = [make_new_run_id() for _ in range(3)]
+        with create_and_delete_test_runs(instance, run_ids):
+            for run_id in run_ids:
+                for i in range(2):
+                    storage.store_event(
+                        EventLogEntry(
+                            error_info=None,
+                            level="debug",
+                            user_message=str(i),
+                            run_id=run_id,
+                            timestamp=time.time(),
+                            dagster_event=DagsterEvent(
+                                DagsterEventType.ENGINE_EVENT.value,
+                                "nonce",
+                                event_specific_data=EngineEventData.in_process(999),
+                            ),
+                        )
+                    )
+
+            first_records = storage.get_records_for_run(run_ids[0]).records
+            records = storage.get_records_for_runs(
+                {run_ids[0]: first_records[0].storage_id, run_ids[1]: None}
+            )
+            assert [
+                (record.event_log_entry.run_id, record.event_log_entry.message)
+                for record in records
+            ] == [
+                (run_ids[0], "1"),
+                (run_ids[1], "0"),
+                (run_ids[1], "1"),
+            ]
+
     def test_event_log_storage_store_with_multiple_runs(self, instance, storage):
         runs = ["foo", "bar", "baz"]
         if instance:
@@ -2053,13 +2089,16 @@ def test_get_latest_storage_ids_by_partition(self, storage, instance):
         b = AssetKey(["b"])
         run_id = make_new_run_id()
 
-        def _assert_storage_matches(expected):
+        def _assert_storage_matches(expected, expected_b=None):
             assert (
                 storage.get_latest_storage_id_by_partition(
                     a, DagsterEventType.ASSET_MATERIALIZATION
                 )
                 == expected
             )
+            assert storage.get_latest_storage_ids_by_partition(
+                [a, b], DagsterEventType.ASSET_MATERIALIZATION
+            ) == {a: expected, b: expected_b or {}}
 
         def _store_partition_event(asset_key, partition) -> int:
             storage.store_event(
@@ -2099,25 +2138,27 @@ def _store_partition_event(asset_key, partition) -> int:
             _assert_storage_matches(latest_storage_ids)
 
             # unrelated asset materialized
-            _store_partition_event(b, "p1")
-            _store_partition_event(b, "p2")
-            _assert_storage_matches(latest_storage_ids)
+            latest_storage_ids_b = {
+                "p1": _store_partition_event(b, "p1"),
+                "p2": _store_partition_event(b, "p2"),
+            }
+            _assert_storage_matches(latest_storage_ids, latest_storage_ids_b)
 
             # p1 re materialized
             latest_storage_ids["p1"] = _store_partition_event(a, "p1")
-            _assert_storage_matches(latest_storage_ids)
+            _assert_storage_matches(latest_storage_ids, latest_storage_ids_b)
 
             # p2 materialized
             latest_storage_ids["p3"] = _store_partition_event(a, "p3")
-            _assert_storage_matches(latest_storage_ids)
+            _assert_storage_matches(latest_storage_ids, latest_storage_ids_b)
 
             if self.can_wipe():
                 storage.wipe_asset(a)
                 latest_storage_ids = {}
-                _assert_storage_matches(latest_storage_ids)
+                _assert_storage_matches(latest_storage_ids, latest_storage_ids_b)
 
                 latest_storage_ids["p1"] = _store_partition_event(a, "p1")
-                _assert_storage_matches(latest_storage_ids)
+                _assert_storage_matches(latest_storage_ids, latest_storage_ids_b)
 
     @pytest.mark.parametrize(
         "dagster_event_type",
@@ -3122,6 +3163,44 @@ def tags_op():
                 }
             ]
 
+    def test_store_events(self, storage, instance):
+        key = AssetKey("hello")
+
+        @op
+        def batch_op(context):
+            context.log.info("before")
+            yield AssetMaterialization(asset_key=key, tags={"dagster/a": "1"})
+            yield AssetObservation(asset_key=key)
+            yield AssetMaterialization(asset_key=key, tags={"dagster/a": "2"})
+            context.log.info("after")
+            yield Output(1)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: batch_op(), run_id)
+            storage.store_events(events)
+
+            logs = storage.get_logs_for_run(run_id)
+            assert [log.message for log in logs] == [event.message for event in events]
+
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=key),
+                ascending=True,
+            )
+            assert len(materializations) == 2
+            assert materializations[0].storage_id < materializations[1].storage_id
+
+            asset_entry = storage.get_asset_records([key])[0].asset_entry
+            assert asset_entry.last_materialization_record
+            assert (
+                asset_entry.last_materialization_record.storage_id == materializations[1].storage_id
+            )
+
+            if storage.supports_add_asset_event_tags():
+                assert storage.get_event_tags_for_asset(
+                    key, filter_event_id=materializations[1].storage_id
+                ) == [{"dagster/a": "2"}]
+
     def test_add_asset_event_tags_initially_empty(self, storage, instance):
         if not storage.supports_add_asset_event_tags():
             pytest.skip("storage does not support adding asset event tags")
@@ -3,6 +3,7 @@
 import time
 import unittest
 from datetime import datetime, timedelta
+from unittest import mock
 
 import pendulum
 import pytest
@@ -931,6 +932,78 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_job_snapshot(job_snapshot_id)
 
+    def test_get_job_snapshot_dependency_structure(self, storage: RunStorage):
+        @op
+        def op_one():
+            return 1
+
+        @op
+        def op_two(num):
+            return num + 1
+
+        @job
+        def two_op_job():
+            op_two(op_one())
+
+        job_snapshot = two_op_job.get_job_snapshot()
+        job_snapshot_id = storage.add_job_snapshot(job_snapshot)
+        assert storage.add_job_snapshot(job_snapshot) == job_snapshot_id
+
+        dep_structure = storage.get_job_snapshot_dependency_structure(job_snapshot_id)
+        assert dep_structure == job_snapshot.dep_structure_snapshot
+        assert [snap.node_name for snap in dep_structure.node_invocation_snaps] == [
+            "op_one",
+            "op_two",
+        ]
+
+    def test_snapshot_cache(self, storage: RunStorage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        from dagster._core.execution.api import create_execution_plan
+        from dagster._core.snap import snapshot_from_execution_plan
+        from dagster._core.storage.runs import sql_run_storage
+
+        job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        job_snapshot = job_def.get_job_snapshot()
+        job_snapshot_id = storage.add_job_snapshot(job_snapshot)
+        ep_snapshot = snapshot_from_execution_plan(
+            create_execution_plan(job_def), job_def.get_job_snapshot_id()
+        )
+        ep_snapshot_id = storage.add_execution_plan_snapshot(ep_snapshot)
+
+        # snapshots that are already stored are not serialized again
+        with mock.patch.object(
+            sql_run_storage, "serialize_value", wraps=sql_run_storage.serialize_value
+        ) as serialize_value:
+            assert storage.add_job_snapshot(job_snapshot) == job_snapshot_id
+            assert storage.add_execution_plan_snapshot(ep_snapshot) == ep_snapshot_id
+            assert serialize_value.call_count == 0
+
+        with mock.patch.object(
+            sql_run_storage,
+            "defensively_unpack_execution_plan_snapshot_query",
+            side_effect=Exception("deserialized a snapshot"),
+        ):
+            # added snapshots are served from the cache
+            assert serialize_pp(storage.get_job_snapshot(job_snapshot_id)) == serialize_pp(
+                job_snapshot
+            )
+
+            # checking for a snapshot reads the snapshot table, without deserializing anything
+            storage._get_snapshot_cache().clear()  # noqa: SLF001
+            assert storage.has_execution_plan_snapshot(ep_snapshot_id)
+            assert storage.has_job_snapshot(job_snapshot_id)
+
+        # only job snapshots have a dependency structure
+        assert storage.get_job_snapshot_dependency_structure(ep_snapshot_id) is None
+
+        if self.can_delete_runs():
+            assert storage.get_job_snapshot(job_snapshot_id)
+            storage.wipe()
+            assert storage._get_snapshot_cache().get(job_snapshot_id) is None  # noqa: SLF001
+            assert not storage.has_job_snapshot(job_snapshot_id)
+
     def test_single_write_read_with_snapshot(self, storage: RunStorage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
@@ -2,7 +2,7 @@
 import sys
 import time
 from enum import Enum
-from typing import Any, Callable, List, Optional, TypeVar
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
 
 import kubernetes.client
 import kubernetes.client.rest
@@ -426,6 +426,26 @@ def _get_job_status():
 
         return k8s_api_retry(_get_job_status, max_retries=3, timeout=wait_time_between_attempts)
 
+    def list_jobs(
+        self,
+        namespace: str,
+        label_selector: str,
+        wait_time_between_attempts=DEFAULT_WAIT_BETWEEN_ATTEMPTS,
+    ) -> Sequence[V1Job]:
+        """List the Kubernetes Jobs in a namespace that match a label selector.
+
+        Args:
+            namespace (str): Namespace in which to list jobs.
+            label_selector (str): Kubernetes label selector that the jobs must match.
+        """
+
+        def _list_jobs():
+            return self.batch_api.list_namespaced_job(
+                namespace=namespace, label_selector=label_selector
+            ).items
+
+        return k8s_api_retry(_list_jobs, max_retries=3, timeout=wait_time_between_attempts)
+
     def delete_job(
         self,
         job_name,
@@ -1,6 +1,7 @@
 import logging
 import sys
-from typing import Any, Mapping, Optional, Sequence
+from collections import defaultdict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import kubernetes
 from dagster import (
@@ -20,6 +21,20 @@
 from .container_context import K8sContainerContext
 from .job import DagsterK8sJobConfig, construct_dagster_k8s_job, get_job_name_from_run_id
 
+# The number of run IDs in the label selector of each list call in bulk_check_run_worker_health
+BULK_CHECK_RUN_WORKER_HEALTH_CHUNK_SIZE = 100
+
+
+def _get_resume_attempt_number_from_job_name(run_id: str, job_name: str) -> Optional[int]:
+    # inverse of get_job_name_from_run_id, with 0 for the job that first launched the run
+    run_job_name = get_job_name_from_run_id(run_id)
+    if job_name == run_job_name:
+        return 0
+    suffix = job_name[len(run_job_name) + 1 :]
+    if job_name.startswith(f"{run_job_name}-") and suffix.isdigit():
+        return int(suffix)
+    return None
+
 
 class K8sRunLauncher(RunLauncher, ConfigurableClass):
     """RunLauncher that starts a Kubernetes Job for each Dagster job run.
@@ -416,6 +431,59 @@ def check_run_worker_health(self, run: DagsterRun):
                 WorkerStatus.UNKNOWN, str(serializable_error_info_from_exc_info(sys.exc_info()))
             )
 
+        return self._get_run_worker_health_from_job_status(run, status)
+
+    @property
+    def supports_bulk_check_run_worker_health(self):
+        return True
+
+    def bulk_check_run_worker_health(
+        self, runs: Sequence[DagsterRun]
+    ) -> Mapping[str, CheckRunHealthResult]:
+        # Rather than reading the status of each run's job, list the run worker jobs of many runs
+        # at once by their run ID label. Each resume attempt of a run launches a new job, so the
+        # job with the highest resume attempt number is the current one.
+        runs_by_namespace: Dict[str, List[DagsterRun]] = defaultdict(list)
+        for run in runs:
+            namespace = check.not_none(self.get_container_context_for_run(run).namespace)
+            runs_by_namespace[namespace].append(run)
+
+        results: Dict[str, CheckRunHealthResult] = {}
+        for namespace, namespace_runs in runs_by_namespace.items():
+            for i in range(0, len(namespace_runs), BULK_CHECK_RUN_WORKER_HEALTH_CHUNK_SIZE):
+                chunk = {
+                    run.run_id: run
+                    for run in namespace_runs[i : i + BULK_CHECK_RUN_WORKER_HEALTH_CHUNK_SIZE]
+                }
+                jobs = self._api_client.list_jobs(
+                    namespace=namespace,
+                    label_selector=f"dagster/run-id in ({','.join(chunk.keys())})",
+                )
+
+                latest_jobs: Dict[str, Tuple[int, Any]] = {}
+                for job in jobs:
+                    run_id = (job.metadata.labels or {}).get("dagster/run-id")
+                    if run_id not in chunk:
+                        continue
+                    resume_attempt_number = _get_resume_attempt_number_from_job_name(
+                        run_id, job.metadata.name
+                    )
+                    if resume_attempt_number is None:
+                        continue
+                    if run_id not in latest_jobs or resume_attempt_number > latest_jobs[run_id][0]:
+                        latest_jobs[run_id] = (resume_attempt_number, job)
+
+                # runs without a job are left out, to be checked individually
+                for run_id, (_, job) in latest_jobs.items():
+                    results[run_id] = self._get_run_worker_health_from_job_status(
+                        chunk[run_id], job.status
+                    )
+
+        return results
+
+    def _get_run_worker_health_from_job_status(
+        self, run: DagsterRun, status: Any
+    ) -> CheckRunHealthResult:
         inactive_job_with_finished_pods = bool(
             (not status.active) and (status.failed or status.succeeded)
         )
@@ -18,7 +18,9 @@
 from dagster_k8s import K8sRunLauncher
 from dagster_k8s.job import DAGSTER_PG_PASSWORD_ENV_VAR, UserDefinedDagsterK8sConfig
 from kubernetes.client.models.v1_job import V1Job
+from kubernetes.client.models.v1_job_list import V1JobList
 from kubernetes.client.models.v1_job_status import V1JobStatus
+from kubernetes.client.models.v1_object_meta import V1ObjectMeta
 
 
 def test_launcher_from_config(kubeconfig_file):
@@ -588,3 +590,87 @@ def test_check_run_health(kubeconfig_file):
 
             health = k8s_run_launcher.check_run_worker_health(finished_run)
             assert health.status == WorkerStatus.FAILED, health.msg
+
+
+def test_bulk_check_run_health(kubeconfig_file):
+    mock_k8s_client_batch_api = mock.Mock(
+        spec_set=["read_namespaced_job_status", "list_namespaced_job"]
+    )
+
+    k8s_run_launcher = K8sRunLauncher(
+        service_account_name="webserver-admin",
+        instance_config_map="dagster-instance",
+        postgres_password_secret="dagster-postgresql-secret",
+        dagster_home="/opt/dagster/dagster_home",
+        job_image="fake_job_image",
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    recon_job = reconstructable(fake_job)
+    recon_repo = recon_job.repository
+    repo_def = recon_repo.get_definition()
+    loadable_target_origin = LoadableTargetOrigin(python_file=__file__)
+
+    with instance_for_test() as instance:
+        with in_process_test_workspace(instance, loadable_target_origin) as workspace:
+            location = workspace.get_code_location(workspace.code_location_names[0])
+            repo_handle = RepositoryHandle(
+                repository_name=repo_def.name,
+                code_location=location,
+            )
+            fake_external_job = external_job_from_recon_job(
+                recon_job,
+                op_selection=None,
+                repository_handle=repo_handle,
+            )
+
+            running_run, resumed_run, missing_run = [
+                create_run_for_test(
+                    instance,
+                    job_name="demo_job",
+                    external_job_origin=fake_external_job.get_external_origin(),
+                    job_code_origin=fake_external_job.get_python_origin(),
+                    status=DagsterRunStatus.STARTED,
+                )
+                for _ in range(3)
+            ]
+            k8s_run_launcher.register_instance(instance)
+
+            def _job(job_name, run_id, status):
+                return V1Job(
+                    metadata=V1ObjectMeta(name=job_name, labels={"dagster/run-id": run_id}),
+                    status=status,
+                )
+
+            mock_k8s_client_batch_api.list_namespaced_job.return_value = V1JobList(
+                items=[
+                    _job(
+                        f"dagster-run-{running_run.run_id}",
+                        running_run.run_id,
+                        V1JobStatus(failed=0, succeeded=0, active=1),
+                    ),
+                    # the first attempt of the resumed run failed, but the second is running
+                    _job(
+                        f"dagster-run-{resumed_run.run_id}",
+                        resumed_run.run_id,
+                        V1JobStatus(failed=1, succeeded=0, active=0),
+                    ),
+                    _job(
+                        f"dagster-run-{resumed_run.run_id}-1",
+                        resumed_run.run_id,
+                        V1JobStatus(failed=0, succeeded=0, active=1),
+                    ),
+                ]
+            )
+
+            results = k8s_run_launcher.bulk_check_run_worker_health(
+                [running_run, resumed_run, missing_run]
+            )
+
+            assert mock_k8s_client_batch_api.list_namespaced_job.call_count == 1
+            assert mock_k8s_client_batch_api.read_namespaced_job_status.call_count == 0
+            assert results.keys() == {running_run.run_id, resumed_run.run_id}
+            assert results[running_run.run_id].status == WorkerStatus.RUNNING
+            assert results[resumed_run.run_id].status == WorkerStatus.RUNNING
@@ -1,4 +1,5 @@
-from typing import Any, ContextManager, Mapping, Optional, Sequence
+from contextlib import contextmanager
+from typing import Any, ContextManager, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 import dagster._check as check
 import sqlalchemy as db
@@ -19,7 +20,6 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -39,8 +39,7 @@
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
-
-CHANNEL_NAME = "run_events"
+from .event_watcher import CHANNEL_NAME, PostgresEventWatcher
 
 
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
@@ -91,7 +90,7 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        self._event_watcher = PostgresEventWatcher(self, self.postgres_url)
 
         self._secondary_index_cache = {}
 
@@ -182,7 +181,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wakes the PostgresEventWatcher of any process watching this run
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -206,6 +205,64 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    @contextmanager
+    def _run_batch_connection(self, run_id: str) -> Iterator[Connection]:
+        # The engine autocommits each statement, so switch this connection to a regular isolation
+        # level and open an explicit transaction, so that the rows for the batch (and the NOTIFY
+        # for them) are committed together.
+        with self._connect() as conn:
+            conn = conn.execution_options(isolation_level="READ COMMITTED")
+            with conn.begin():
+                yield conn
+
+    def _insert_event_rows(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts the given events like the base implementation, but returns the storage id of every
+        inserted row so that each run in the batch can be notified with its latest storage id
+        without querying the table again.
+        """
+        event_ids: List[Optional[int]] = [None] * len(events)
+        latest_storage_id_by_run_id: Dict[str, int] = {}
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+
+        def _flush_pending() -> None:
+            if not pending:
+                return
+            inserted_ids = conn.execute(
+                SqlEventLogStorageTable.insert()
+                .values([values for _, values in pending])
+                .returning(SqlEventLogStorageTable.c.id)
+            ).fetchall()
+            for (i, _), (storage_id,) in zip(pending, inserted_ids):
+                run_id = events[i].run_id
+                latest_storage_id_by_run_id[run_id] = max(
+                    storage_id, latest_storage_id_by_run_id.get(run_id, storage_id)
+                )
+            pending.clear()
+
+        for i, event in enumerate(events):
+            values = self._get_event_insert_values(event)
+            if not self._is_indexed_event(event):
+                pending.append((i, values))
+                continue
+
+            _flush_pending()
+            result = conn.execute(SqlEventLogStorageTable.insert().values(**values))
+            event_ids[i] = result.inserted_primary_key[0]
+            latest_storage_id_by_run_id[event.run_id] = event_ids[i]
+
+        _flush_pending()
+
+        # notify once per run in the batch, with the latest storage id for that run
+        for run_id, storage_id in latest_storage_id_by_run_id.items():
+            conn.execute(
+                db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                {"notify_id": run_id + "_" + str(storage_id)},
+            )
+
+        return event_ids
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -0,0 +1,80 @@
+import logging
+import select
+import threading
+from typing import Callable, Optional
+
+import dagster._check as check
+import psycopg2
+import psycopg2.extensions
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+CHANNEL_NAME = "run_events"
+
+LISTEN_TIMEOUT = 5.0  # seconds between checks for watcher shutdown
+LISTEN_RETRY_INTERVAL = 5.0  # seconds to wait before reconnecting a failed LISTEN connection
+
+
+class PostgresEventWatcher(SqlPollingEventWatcher):
+    """Event log watcher that is woken by the NOTIFY issued by PostgresEventLogStorage for each
+    batch of stored events.
+
+    A single LISTEN connection, started when the first run is watched, is shared by every watched
+    run. Notifications for watched runs wake the polling thread, which then fetches the new events
+    for all watched runs with one query. If the LISTEN connection is lost, the watcher keeps polling
+    with backoff until it reconnects.
+    """
+
+    def __init__(self, event_log_storage: SqlEventLogStorage, conn_string: str):
+        super(PostgresEventWatcher, self).__init__(event_log_storage)
+        self._conn_string = check.str_param(conn_string, "conn_string")
+        self._listen_thread_lock = threading.Lock()
+        self._listen_thread: Optional[threading.Thread] = None
+
+    def watch_run(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
+        super(PostgresEventWatcher, self).watch_run(run_id, cursor, callback)
+        with self._listen_thread_lock:
+            if not self._listen_thread and not self._should_thread_exit.is_set():
+                self._listen_thread = threading.Thread(
+                    target=self._listen, name="postgres-event-watch-listen", daemon=True
+                )
+                self._listen_thread.start()
+
+    def close(self):
+        super(PostgresEventWatcher, self).close()
+        with self._listen_thread_lock:
+            if self._listen_thread and self._listen_thread is not threading.current_thread():
+                self._listen_thread.join()
+
+    def _listen(self):
+        while not self._should_thread_exit.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(self._conn_string)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as curs:
+                    curs.execute(f"LISTEN {CHANNEL_NAME};")
+
+                while not self._should_thread_exit.is_set():
+                    if select.select([conn], [], [], LISTEN_TIMEOUT) == ([], [], []):
+                        continue
+
+                    conn.poll()
+                    run_ids = set()
+                    while conn.notifies:
+                        notification = conn.notifies.pop(0)
+                        # payloads are of the form `{run_id}_{storage_id}`
+                        run_ids.add(notification.payload.rsplit("_", 1)[0])
+                    self.notify(run_ids)
+            except Exception:
+                logging.exception(
+                    "Exception in the postgres event watcher LISTEN connection, falling back to"
+                    " polling until it reconnects."
+                )
+                self._should_thread_exit.wait(LISTEN_RETRY_INTERVAL)
+            finally:
+                if conn:
+                    conn.close()